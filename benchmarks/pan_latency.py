@@ -0,0 +1,90 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Compares pan latency (x-range change through repaint) of the QSplitter-of-PlotWidgets layout against the
+single-scene StackedLayoutMultiPlotWidget, at increasing plot counts.
+
+Run as: python benchmarks/pan_latency.py [--plots 10 50 200] [--points 10000] [--pans 50]
+Set QT_QPA_PLATFORM=offscreen to run headless."""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import List, Type
+
+import numpy as np
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from pyqtgraph_scope_plots import LinkedMultiPlotWidget, MultiPlotWidget, StackedLayoutMultiPlotWidget
+
+
+class SplitterPlots(LinkedMultiPlotWidget):
+    pass
+
+
+class StackedPlots(StackedLayoutMultiPlotWidget, LinkedMultiPlotWidget):
+    pass
+
+
+def measure_pan_ms(
+    app: QApplication, cls: Type[MultiPlotWidget], num_plots: int, points: int, pans: int
+) -> List[float]:
+    """Returns the time of each pan, in ms, from setting the x-range until all plots have repainted."""
+    plots = cls()
+    names = [str(i) for i in range(num_plots)]
+    plots.show_data_items([(name, QColor("yellow"), MultiPlotWidget.PlotType.DEFAULT) for name in names])
+    xs = np.arange(points, dtype=np.float64)
+    rng = np.random.default_rng(0)
+    plots.set_data({name: (xs, np.cumsum(rng.standard_normal(points))) for name in names})
+    plots.resize(1200, 900)
+    plots.show()
+    for _ in range(10):  # settle initial layout and render
+        app.processEvents()
+
+    window = points / 10
+    times_ms = []
+    for i in range(pans):
+        start = (i % 10) * window / 10
+        start_s = time.perf_counter()
+        plots._anchor_x_plot_item.setXRange(start, start + window, padding=0)
+        plots.repaint()  # synchronous repaint of all children
+        app.processEvents()
+        times_ms.append((time.perf_counter() - start_s) * 1000)
+    plots.close()
+    plots.deleteLater()
+    app.processEvents()
+    return times_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plots", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--points", type=int, default=10000, help="points per plot")
+    parser.add_argument("--pans", type=int, default=50, help="pans measured per configuration")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    assert isinstance(app, QApplication)
+    print(f"{'plots':>6} {'layout':>10} {'median ms':>10} {'p90 ms':>10}")
+    for num_plots in args.plots:
+        for label, cls in [("splitter", SplitterPlots), ("stacked", StackedPlots)]:
+            times_ms = measure_pan_ms(app, cls, num_plots, args.points, args.pans)
+            p90 = float(np.percentile(times_ms, 90))
+            print(f"{num_plots:>6} {label:>10} {statistics.median(times_ms):>10.1f} {p90:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,7 +29,10 @@ from .color_signals_table import ColorPickerPlotWidget, ColorPickerSignalsTable
 from .timeshift_signals_table import TimeshiftPlotWidget, TimeshiftSignalsTable
 from .transforms_signal_table import TransformsPlotWidget, TransformsSignalsTable
 from .visibility_toggle_table import VisibilityPlotWidget, VisibilityToggleSignalsTable
+from .value_dtype_plot_widget import ValueDtypePlotWidget, ValueDtypeSignalsTable
 from .legend_plot_widget import LegendPlotWidget
+from .rolling_plot_widget import RollingPlotWidget
+from .stacked_plot_widget import StackedLayoutMultiPlotWidget
 from .plots_table_widget import PlotsTableWidget
 
 # xy and mixins
@@ -76,7 +79,11 @@ __all__ = [
     "TransformsSignalsTable",
     "VisibilityPlotWidget",
     "VisibilityToggleSignalsTable",
+    "ValueDtypePlotWidget",
+    "ValueDtypeSignalsTable",
     "LegendPlotWidget",
+    "RollingPlotWidget",
+    "StackedLayoutMultiPlotWidget",
     "PlotsTableWidget",
     "XyPlotWidget",
     "XyPlotLinkedCursorWidget",
@@ -46,7 +46,9 @@ class AnimationPlotsTableWidget(PlotsTableWidget):
             full_region = self._plots._last_region
             restore_full_region = True
         else:
-            all_xs = [data[0] for data in self._plots._data.values()]
+            all_xs = [  # only request displayed data, other data may not have been processed
+                self._plots._data[name][0] for name in self._plots._displayed_data_names() if name in self._plots._data
+            ]
             min_xs = [min(data) for data in all_xs if len(data)]
             max_xs = [max(data) for data in all_xs if len(data)]
             assert min_xs or max_xs, "no data to determine full region"
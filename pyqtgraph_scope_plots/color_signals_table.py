@@ -76,7 +76,6 @@ class ColorPickerPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
                     for data_item_name, (data_color, plot_type) in self._data_items.items()
                 ]
             )
-            self._update_plots()
             self.sigDataItemsUpdated.emit()
 
 
@@ -16,7 +16,7 @@ import itertools
 import os.path
 import time
 from functools import partial
-from typing import Dict, Tuple, Any, List, Optional, Callable, Sequence, cast, Set, Iterable
+from typing import Dict, Tuple, Any, List, Optional, Callable, Set, Iterable, Collection
 
 import numpy as np
 import pandas as pd
@@ -47,7 +47,8 @@ from ..stats_signals_table import StatsSignalsTable
 from ..time_axis import TimeAxisItem
 from ..timeshift_signals_table import TimeshiftSignalsTable, TimeshiftPlotWidget
 from ..transforms_signal_table import TransformsSignalsTable, TransformsPlotWidget
-from ..util import int_color, BaseTopModel, HasSaveLoadDataConfig
+from ..value_dtype_plot_widget import ValueDtypePlotWidget, ValueDtypeSignalsTable
+from ..util import int_color, BaseTopModel, HasSaveLoadDataConfig, RunLengthEncoding, ingest_data_frame
 from ..visibility_toggle_table import VisibilityToggleSignalsTable, VisibilityPlotWidget
 from ..xy_plot import (
     XyPlotWidget,
@@ -122,14 +123,22 @@ class FullPlots(
     ColorPickerPlotWidget,
     TimeshiftPlotWidget,
     TransformsPlotWidget,
+    ValueDtypePlotWidget,
     PlotsTableWidget.Plots,
 ):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._thickness: float = 1
         super().__init__(*args, **kwargs)
 
-    def _update_plots(self) -> None:
-        super()._update_plots()
+    def _update_plots(self, data_names: Optional[Collection[str]] = None) -> None:
+        super()._update_plots(data_names)
+        self._apply_thickness()
+
+    def _update_plot_item_data_items(self) -> None:
+        super()._update_plot_item_data_items()
+        self._apply_thickness()  # for graphics newly generated
+
+    def _apply_thickness(self) -> None:
         for plot_item, _ in self._plot_item_data.items():
             for item in plot_item.items:
                 if isinstance(item, pg.PlotCurveItem):
@@ -137,7 +146,7 @@ class FullPlots(
 
     def set_thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_plots()
+        self._apply_thickness()
 
 
 class FullSignalsTable(
@@ -147,6 +156,7 @@ class FullSignalsTable(
     ColorPickerSignalsTable,
     TimeshiftSignalsTable,
     TransformsSignalsTable,
+    ValueDtypeSignalsTable,
     FilterSignalsTable,
     StatsSignalsTable,
     PlotsTableWidget.SignalsTable,
@@ -182,6 +192,7 @@ class CsvLoaderPlotsTableWidget(AnimationPlotsTableWidget, PlotsTableWidget, Has
     _MODEL_BASES = [CsvLoaderStateModel]
 
     WATCH_INTERVAL_MS = 333  # polls the filesystem metadata for changes this frequently
+    GAP_JUMP_FACTOR = 10.0  # sampling jumps of more than this many typical sample spacings are shown as gaps
 
     _PLOT_TYPE = FullPlots
     _TABLE_TYPE = FullSignalsTable
@@ -232,6 +243,10 @@ class CsvLoaderPlotsTableWidget(AnimationPlotsTableWidget, PlotsTableWidget, Has
         assert isinstance(self._table, StatsSignalsTable)
         self._table.disable_stats(checked)
 
+    def _on_memory_report(self) -> None:
+        assert isinstance(self._plots, FullPlots)
+        QMessageBox.information(self, "Memory Report", self._plots.memory_report_text())
+
     def _make_controls(self) -> QWidget:
         button_load = QToolButton()
         button_load.setText("Load CSV")
@@ -296,6 +311,9 @@ class CsvLoaderPlotsTableWidget(AnimationPlotsTableWidget, PlotsTableWidget, Has
         self._disable_stats_action.setCheckable(True)
         self._disable_stats_action.toggled.connect(self._on_disable_stats)
         button_menu.addAction(self._disable_stats_action)
+        memory_report_action = QAction("Memory Report", button_menu)
+        memory_report_action.triggered.connect(self._on_memory_report)
+        button_menu.addAction(memory_report_action)
         animation_action = QAction("Create Animation", button_menu)
         animation_action.triggered.connect(partial(self._start_animation_ui_flow, ""))
         button_menu.addAction(animation_action)
@@ -402,30 +420,30 @@ class CsvLoaderPlotsTableWidget(AnimationPlotsTableWidget, PlotsTableWidget, Has
             df = pd.read_csv(csv_filepath, **self._pandas_read_csv_kwargs)
             self._csv_time[csv_filepath] = time.time()
 
+            assert pd.api.types.is_numeric_dtype(df[df.columns[0]])
+            for col_name in df.columns[1:]:  # string columns as categorical, so enum plots work on integer codes
+                if not pd.api.types.is_numeric_dtype(df[col_name].dtype):
+                    df[col_name] = df[col_name].astype("category")
+            # columns reference a shared time array, and column memory is used in place where possible
+            # numeric columns keep missing values (instead of masking the time array) with their gaps indexed
+            df_data, _ = ingest_data_frame(df, gap_jump_factor=self.GAP_JUMP_FACTOR)
+            data_dict.update(df_data)
             time_values = df[df.columns[0]]
-            assert pd.api.types.is_numeric_dtype(time_values)
 
             for col_name, series in list(df.items())[1:]:
                 csv_data_items_dict.setdefault(csv_filepath, set()).add(col_name)
 
                 if pd.api.types.is_numeric_dtype(series.dtype):  # is numeric
                     data_type = MultiPlotWidget.PlotType.DEFAULT
-                else:  # assume string
+                else:  # assume string, stored as transitions since these are typically states or modes
                     data_type = MultiPlotWidget.PlotType.ENUM_WAVEFORM
+                    if not series.hasnans:  # missing cells would become held values, so those stay sparse
+                        data_dict[col_name] = RunLengthEncoding.encode(*df_data[col_name])
                 data_type_dict[col_name] = data_type
 
-                not_nans = pd.notna(series)
-                if not_nans.all():
-                    xs = time_values
-                    ys = series.values
-                else:  # get rid of nans
-                    xs = time_values[not_nans]
-                    ys = series.values[not_nans]
-                data_dict[col_name] = (xs, ys)
-
-                # if not in append mode, check if a time axis is needed - inferring by if min is Jan 1 2000 in timestamp
-                if not append and min(cast(Sequence[int], time_values)) >= 946684800:
-                    any_is_timevalue = True
+            # if not in append mode, check if a time axis is needed - inferring by if min is Jan 1 2000 in timestamp
+            if not append and len(df.columns) > 1 and len(time_values) and np.min(time_values) >= 946684800:
+                any_is_timevalue = True
 
         if any_is_timevalue:
             self._plots.set_x_axis(lambda: TimeAxisItem(orientation="bottom"))
@@ -0,0 +1,135 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+from typing import List, Tuple, Optional, Any, Mapping, Dict
+
+import numpy as np
+import numpy.typing as npt
+import pyqtgraph as pg
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QColor
+
+from .interactivity_mixins import SnappableHoverPlot, DataPlotItem, HasDataValueAt, ClippedPlotCurveItem
+from .util import DigitalBus, RunLengthEncoding, UniformTimebase
+
+
+class DigitalBusPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
+    """Plot that takes a digital bus (boolean lines bit-packed into unsigned integer words, see DigitalBus) vs. time
+    and renders each line as a stacked logic trace, with the line names on the y axis.
+    All lines are drawn as one curve, built from the edges of all lines extracted in one vectorized pass.
+    Words without registered line names are shown as all the bits of their dtype."""
+
+    LINE_PITCH = 1.5  # vertical distance between lines, with each line's trace spanning 0 (low) to 1 (high)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._line_names: Tuple[str, ...] = ()
+        self._change_xs = np.array([])  # sorted x positions where any line changes, for snapping
+        self._curve = ClippedPlotCurveItem(x=[], y=[])
+
+        self.sigYRangeChanged.connect(self._forced_y_range)
+        self._forced_y_range()
+
+    def _line_base(self, line: Any) -> Any:
+        """Returns the y position of the low level of line(s), with the first line on top."""
+        return (len(self._line_names) - 1 - line) * self.LINE_PITCH
+
+    def _forced_y_range(self) -> None:
+        """Forces the Y range to fit the lines, since Y scaling doesn't really make sense for logic traces."""
+        self.getViewBox().setYRange(-0.2, max(len(self._line_names) - 1, 0) * self.LINE_PITCH + 1.2)
+
+    def _snap_pos(self, target_pos: QPointF, x_lo: float, x_hi: float) -> Optional[QPointF]:
+        # prefer to snap to the nearest change (of any line) if in the window, otherwise the nearest point
+        if not len(self._data):
+            return None
+        data_name, (xs, ys) = next(iter(self._data.items()))
+
+        candidate_poss = self._change_xs[
+            bisect.bisect_left(self._change_xs, x_lo) : bisect.bisect_right(self._change_xs, x_hi)
+        ]
+        if not len(candidate_poss):  # no changes in window, search all points
+            candidate_poss = xs[UniformTimebase.bisect_left(xs, x_lo) : UniformTimebase.bisect_right(xs, x_hi)]
+        if not len(candidate_poss):
+            return None
+        return QPointF(candidate_poss[np.argmin(np.abs(candidate_poss - target_pos.x()))], target_pos.y())
+
+    def _data_value_label_at(self, pos: float, precision_factor: float = 1.0) -> List[Tuple[float, str, QColor]]:
+        # all lines are read out at once, each next to its trace
+        if not len(self._data):
+            return []
+        data_name, (xs, ys) = next(iter(self._data.items()))
+        color = next(iter(self._data_items.values()))
+
+        index = RunLengthEncoding.index_at(xs, ys, pos)
+        if index is None:
+            return []
+        line_bits = DigitalBus.bits(ys[index : index + 1], len(self._line_names))[0]
+        return [(self._line_base(line) + 0.5, str(bit), color) for line, bit in enumerate(line_bits)]
+
+    def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
+        if len(self._data_items) != 1:
+            raise ValueError("DigitalBusPlot only supports exactly one data item")
+
+        graphics_dict: Dict[str, List[pg.GraphicsObject]] = {}
+        for name, color in data_items.items():
+            self._curve = ClippedPlotCurveItem(x=[], y=[], name=name, connect="finite")
+            self._curve.setPen(color=color, width=1)
+            graphics_dict[name] = [self._curve]
+        return graphics_dict
+
+    def _update_plot_data(self, name: str, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]) -> None:
+        line_names = DigitalBus.line_names(ys)
+        if line_names is None:
+            if len(ys) and not np.issubdtype(ys.dtype, np.unsignedinteger):
+                raise ValueError(f"DigitalBusPlot data must be unsigned integer words, got {ys.dtype}")
+            line_names = tuple(str(bit) for bit in range(ys.dtype.itemsize * 8 if len(ys) else 0))
+        self._line_names = line_names
+        self.getAxis("left").setTicks(
+            [[(self._line_base(line) + 0.5, line_name) for line, line_name in enumerate(line_names)], []]
+        )
+        self._forced_y_range()
+
+        if not len(ys):
+            self._change_xs = np.array([])
+            self._curve.setData(x=[], y=[])
+            return
+        edge_indices, edge_lines = DigitalBus.edges(ys, len(line_names))
+        self._change_xs = xs[np.unique(edge_indices)]
+
+        # each line's trace is its first sample, the level before and after each edge, and its last sample, followed
+        # by a NaN to break the curve between lines; these are generated for all lines then sorted into trace order
+        line_count = len(line_names)
+        all_lines = np.arange(line_count)
+        levels_after = ((ys[edge_indices] >> edge_lines.astype(ys.dtype)) & 1).astype(np.float64)
+        point_lines = np.concatenate((all_lines, edge_lines, edge_lines, all_lines, all_lines))
+        point_indices = np.concatenate(
+            (np.zeros(line_count, dtype=int), edge_indices, edge_indices, np.full(line_count, len(ys) - 1))
+        )
+        point_levels = np.concatenate(
+            (
+                DigitalBus.bits(ys[:1], line_count)[0],
+                1 - levels_after,
+                levels_after,
+                DigitalBus.bits(ys[-1:], line_count)[0],
+                np.full(line_count, np.nan),
+            )
+        )
+        point_orders = np.repeat(np.arange(5), [line_count, len(edge_lines), len(edge_lines), line_count, line_count])
+        point_indices = np.concatenate((point_indices, np.full(line_count, len(ys) - 1)))  # NaN break points
+        order = np.lexsort((point_orders, point_indices, point_lines))
+        self._curve.setData(
+            x=xs[point_indices[order]], y=point_levels[order] + self._line_base(point_lines[order]), connect="finite"
+        )
+        self._curve.set_full_bounds(((xs[0], xs[-1]), (-0.2, self._line_base(0) + 1.2)))
@@ -14,6 +14,7 @@
 
 import bisect
 from typing import List, Tuple, Optional, Any, cast, Mapping, Dict
+from weakref import ref
 
 import numpy as np
 import numpy.typing as npt
@@ -22,23 +23,39 @@ from PySide6.QtCore import QPointF, QRect
 from PySide6.QtGui import QColor
 
 from .graphics_collections import TextItemCollection
-from .interactivity_mixins import SnappableHoverPlot, DataPlotItem, HasDataValueAt
+from .interactivity_mixins import SnappableHoverPlot, DataPlotItem, HasDataValueAt, ClippedPlotCurveItem
+from .util import AppendableArray, CategoricalCodes, RunLengthEncoding, UniformTimebase
 
 
 class EnumWaveformPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
     """Plot that takes data as string vs. time and renders as a digital waveform, with transitions when string
-    equality changes."""
+    equality changes.
+    Only the visible part of the waveform is drawn, updated once view range changes settle. Where more than one
+    transition falls in a pixel column, a filled activity band is drawn instead of the individual edges (and
+    labels), so rendering scales with the view's pixel width instead of the number of transitions.
+    Edges are detected incrementally for appended data (see AppendableArray)."""
+
+    _HEIGHTS_PATTERN = np.array([1, -1, -1, 1])  # waveform heights at the edges of consecutive transitions
+    _EXTENDS_MAX_DEPTH = 64  # appends (since the last update) searched for the previously processed data
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         # since labels may need to be regenerated on resize, save the information separately from the data
-        self._edges = np.array([])  # list of x positions of edges, sorted but not necessarily unique
+        # list of x positions of edges, sorted but not necessarily unique, excluding the last (padding) edge
+        self._edges = np.array([])
+        self._edge_heights = np.array([], dtype=int)  # waveform height at each edge
+        self._end_edge: Optional[float] = None  # x position of the last edge (the last sample), if any
+        self._end_height = 1
+        self._transitions = np.array([])  # x positions of the first sample after each change, for density
+        # (xs, ys) the edges were generated from, weak so they don't hold older buffers alive
+        self._edges_source: Optional[Tuple["ref[npt.NDArray[Any]]", "ref[npt.NDArray[Any]]"]] = None
+        # activity band bounds for the current view, as flattened [start0, end0, start1, end1, ...]
+        self._activity_spans = np.array([])
         self._curves_labels = TextItemCollection(self, anchor=(0, 0.5))
         self._sample_label = pg.TextItem()  # for character width, assumed boundingRect in screen coordinates
-        self._curve_true = pg.PlotCurveItem(x=[], y=[])
-        self._curve_comp = pg.PlotCurveItem(x=[], y=[])
-
-        self.sigXRangeChanged.connect(self._update_plot_labels)
+        self._curve_true = ClippedPlotCurveItem(x=[], y=[])
+        self._curve_comp = ClippedPlotCurveItem(x=[], y=[])
+        self._activity_bands = pg.BarGraphItem(x0=[], x1=[], y0=-1, y1=1, pen=None)
 
         self.sigYRangeChanged.connect(self._forced_y_range)
         self._forced_y_range()
@@ -56,9 +73,11 @@ class EnumWaveformPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
         edges_lo = bisect.bisect_left(self._edges, x_lo)
         edges_hi = bisect.bisect_right(self._edges, x_hi)
         candidate_poss = self._edges[edges_lo:edges_hi]
+        if self._end_edge is not None and x_lo <= self._end_edge <= x_hi:
+            candidate_poss = np.append(candidate_poss, self._end_edge)
         if not len(candidate_poss):  # no edges in window, search all points
-            index_lo = bisect.bisect_left(xs, x_lo)
-            index_hi = bisect.bisect_right(xs, x_hi)
+            index_lo = UniformTimebase.bisect_left(xs, x_lo)
+            index_hi = UniformTimebase.bisect_right(xs, x_hi)
             candidate_poss = xs[index_lo:index_hi]
         if len(candidate_poss):
             candidate_dists = [abs(x - target_pos.x()) for x in candidate_poss]
@@ -73,70 +92,146 @@ class EnumWaveformPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
         data_name, (xs, ys) = next(iter(self._data.items()))
         color = next(iter(self._data_items.values()))
 
-        index = bisect.bisect_left(xs, pos)
-        if index < len(xs) and xs[index] == pos:  # found exact match
+        index = RunLengthEncoding.index_at(xs, ys, pos)
+        if index is not None:  # exact match, or held value of run-length encoded data
             return [(0, str(ys[index]), color)]
         else:
             return []
 
     def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
-        if len(data_items) != 1:
+        if len(self._data_items) != 1:
             raise ValueError("EnumWaveformPlot only supports exactly one data item")
 
         graphics_dict: Dict[str, List[pg.GraphicsObject]] = {}
         for name, color in data_items.items():
-            self._curve_true = pg.PlotCurveItem(x=[], y=[], name=name)
+            self._curve_true = ClippedPlotCurveItem(x=[], y=[], name=name)
             self._curve_true.setPen(color=color, width=1)
-            self._curve_comp = pg.PlotCurveItem(x=[], y=[])
+            self._curve_comp = ClippedPlotCurveItem(x=[], y=[])
             self._curve_comp.setPen(color=color, width=1)
-            graphics_dict[name] = [self._curve_true, self._curve_comp]
+            self._activity_bands = pg.BarGraphItem(x0=[], x1=[], y0=-1, y1=1, pen=None, brush=color.darker())
+            graphics_dict[name] = [self._curve_true, self._curve_comp, self._activity_bands]
 
         return graphics_dict
 
+    def _update_plot_item_color(self, name: str, color: QColor) -> None:
+        super()._update_plot_item_color(name, color)
+        for item in self._data_graphics.get(name, []):
+            if isinstance(item, pg.BarGraphItem):
+                item.setOpts(brush=color.darker())
+
+    @classmethod
+    def _extends(cls, arr: npt.NDArray[Any], prefix: npt.NDArray[Any]) -> bool:
+        """Returns whether arr is prefix, or was created by (possibly several) AppendableArray.extend from prefix."""
+        for _ in range(cls._EXTENDS_MAX_DEPTH):
+            if arr is prefix:
+                return True
+            if len(arr) <= len(prefix):
+                return False
+            prev_arr = AppendableArray.prefix_of(arr)
+            if prev_arr is None:
+                return False
+            arr = prev_arr
+        return False
+
     def _update_plot_data(self, name: str, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]) -> None:
         # generate the control points for half of the waveform using numpy operations for efficiency
-        ys_values, ys_int = np.unique(ys, return_inverse=True)  # map to integer for efficiency
-        # do change detection to find edges, element is true if it is different from the next element
-        if len(ys):
-            # prechanges is true on the index before the change
-            prechanges = np.not_equal(ys_int[:-1], ys_int[1:])
-        else:  # handle empty array case
-            prechanges = np.array([])
-
-        prechanges_indices = np.where(prechanges)[0]
+        # if the data extends (see AppendableArray) the data of the last update, only the appended samples (plus one
+        # sample of overlap) are scanned and their edges appended, so live updates are O(new samples)
+        source = self._edges_source
+        scan_start = 0
+        if source is not None and len(ys) == len(xs):
+            prev_xs, prev_ys = source[0](), source[1]()
+            if prev_xs is not None and prev_ys is not None and len(prev_ys) and len(prev_ys) == len(prev_xs):
+                if self._extends(xs, prev_xs) and self._extends(ys, prev_ys):
+                    scan_start = len(prev_ys) - 1
+        if scan_start == 0:  # full scan
+            self._edges, self._edge_heights, self._transitions = np.array([]), np.array([], dtype=int), np.array([])
+
+        # integer codes, registered for categorical data or cached by identity, for efficient change detection
+        # codes are only compared within the scanned part, so may be local to it
+        ys_codes, _ = CategoricalCodes.encode(ys if scan_start == 0 else ys[scan_start:])
+        # prechanges is true on the index before the change
+        prechanges_indices = np.flatnonzero(np.not_equal(ys_codes[:-1], ys_codes[1:])) + scan_start
         # interleave the indices and itself plus one to get all the points where the data changes
+        # run-length encoded values hold until the next sample, so the pre-change edge is at the change instead
         # note, this may result in duplicate points, which is fine for plotting
-        changes_prechanges_indices = np.column_stack(
-            (
-                prechanges_indices,
-                prechanges_indices + np.ones(len(prechanges_indices), dtype=int),
+        held_indices = prechanges_indices + 1 if RunLengthEncoding.is_run_length(ys) else prechanges_indices
+        changes_prechanges_indices = np.column_stack((held_indices, prechanges_indices + 1)).reshape(-1)
+        if scan_start == 0 and len(ys):  # prepend the first element to pad out the trace
+            changes_prechanges_indices = np.concatenate(([0], changes_prechanges_indices))
+        # heights continue the [1, -1, -1, 1] pattern of the transition edges, after the padding element
+        heights = self._HEIGHTS_PATTERN[(np.arange(len(changes_prechanges_indices)) + len(self._edges) - 1) % 4]
+
+        self._edges = AppendableArray.extend(self._edges, np.take(xs, changes_prechanges_indices))
+        self._edge_heights = AppendableArray.extend(self._edge_heights, heights)
+        self._transitions = AppendableArray.extend(self._transitions, np.take(xs, prechanges_indices + 1))
+        # the last element pads out the trace, but is kept separately since it moves with every append
+        self._end_edge = float(xs[-1]) if len(xs) else None
+        self._end_height = int(self._edge_heights[-1]) if len(self._edge_heights) else 1
+        self._edges_source = (ref(xs), ref(ys))
+        if len(self._edges):  # curves only hold the visible part, but autorange should cover all the data
+            bounds: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = (
+                (self._edges[0], cast(float, self._end_edge)),
+                (-1.0, 1.0),
             )
-        ).reshape(-1)
-        heights = np.array(
-            ([1, -1, -1, 1] * ((len(changes_prechanges_indices) + 3) // 4))[: len(changes_prechanges_indices)]
-        )
-        if len(heights) > 0:  # append first and last elements to pad out the trace
-            changes_prechanges_indices = np.concatenate(([0], changes_prechanges_indices, [len(xs) - 1]))
-            heights = np.concatenate(([heights[0]], heights, [heights[-1]]))
-        elif len(ys):  # special case for waveform that doesn't change but is nonempty
-            changes_prechanges_indices = np.array([0, len(xs) - 1])
-            heights = np.array([1, 1])
-        else:  # empty case, need changes_prechanges_indices to be empty to not slice an empty array
-            pass
+        else:
+            bounds = None
+        self._curve_true.set_full_bounds(bounds)
+        self._curve_comp.set_full_bounds(bounds)
+        self._update_waveform_view()
 
-        self._edges = np.take(xs, changes_prechanges_indices)
+    def _update_waveform_view(self) -> None:
+        """Draws the waveform for the current view: activity bands over pixel columns with more than one transition,
+        and edges (clipped to the view, with one edge of margin on each side) elsewhere.
+        Transition density per pixel column is counted from the sorted transitions, in O(width log n)."""
+        viewbox = self.getViewBox()
+        width_px = max(int(viewbox.width()), 1)
+        view_left, view_right = viewbox.viewRange()[0]
 
-        self._curve_true.setData(x=self._edges, y=heights)
-        self._curve_comp.setData(x=self._edges, y=np.zeros(len(heights)) - heights)
+        column_bounds = np.linspace(view_left, view_right, width_px + 1)
+        column_counts = np.diff(np.searchsorted(self._transitions, column_bounds))
+        busy_changes = np.diff(np.concatenate(([0], column_counts > 1, [0])).astype(np.int8))
+        span_starts = column_bounds[np.flatnonzero(busy_changes == 1)]
+        span_ends = column_bounds[np.flatnonzero(busy_changes == -1)]
+        self._activity_spans = np.column_stack((span_starts, span_ends)).reshape(-1)
+        self._activity_bands.setOpts(x0=span_starts, x1=span_ends)
+
+        start = max(bisect.bisect_left(self._edges, view_left) - 1, 0)
+        end = min(bisect.bisect_right(self._edges, view_right) + 1, len(self._edges))
+        if len(self._activity_spans):
+            # edges inside a band are covered by it, so only keep the first and last of each band (so lines connect)
+            # and the edges between bands, without visiting every edge in the bands
+            span_bounds = np.searchsorted(self._edges, self._activity_spans, side="right").clip(start, end)
+            range_starts = np.concatenate(([start], span_bounds[1::2], span_bounds[0::2], span_bounds[1::2] - 1))
+            range_ends = np.concatenate((span_bounds[0::2], [end], span_bounds[0::2] + 1, span_bounds[1::2]))
+            range_starts, range_ends = np.maximum(range_starts, start), np.minimum(range_ends, end)
+            nonempty = range_ends > range_starts
+            range_starts, range_ends = range_starts[nonempty], range_ends[nonempty]
+            range_lens = range_ends - range_starts
+            indices = np.unique(  # concatenated aranges of each range
+                np.repeat(range_starts - np.cumsum(range_lens) + range_lens, range_lens) + np.arange(range_lens.sum())
+            )
+            edges, heights = self._edges[indices], self._edge_heights[indices]
+        else:
+            edges, heights = self._edges[start:end], self._edge_heights[start:end]
+        if end == len(self._edges) and self._end_edge is not None:  # pad out the trace to the last sample
+            edges, heights = np.append(edges, self._end_edge), np.append(heights, self._end_height)
+        self._curve_true.setData(x=edges, y=heights)
+        self._curve_comp.setData(x=edges, y=np.zeros(len(heights)) - heights)
 
     def resizeEvent(self, ev: Any) -> None:
         super().resizeEvent(ev)
         self._update_plot_labels()
 
-    def set_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
-        super().set_data(data)
+    def _render_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
+        super()._render_data(data)
         self._update_plot_labels()
 
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
+        self._update_waveform_view()
+        self._update_plot_labels()  # labels depend on the visible width of segments
+
     def _update_plot_labels(self) -> None:
         if not self._data:
             self._curves_labels.update([])
@@ -151,6 +246,8 @@ class EnumWaveformPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
         # generate plot labels by testing character-width points in view space and using bisect to turn those
         # into data indices, which makes this mostly (outside the log-factor of bisect) runtime independent
         # of the data set - it should handle very large datasets just as performantly
+        # test points are bisected in one vectorized pass, and points in activity bands (where segments are narrower
+        # than a pixel, so can't hold a label) are skipped before any per-segment work
         if len(edges) == 0:  # nothing to be done
             return []
 
@@ -164,30 +261,40 @@ class EnumWaveformPlot(SnappableHoverPlot, HasDataValueAt, DataPlotItem):
         test_point_span = (self.viewRect().right() - self.viewRect().left()) / (test_point_count - 1)  # fenceposting
         edge_index_min = bisect.bisect_left(edges, self.viewRect().left())
         edge_index_max = bisect.bisect_right(edges, self.viewRect().right())
-        prev_edge_index: Optional[int] = None
+        test_data_poss = self.viewRect().left() + test_point_span * np.arange(test_point_count)
+        # note, bisect left returns the first point at or AFTER the test point (insertion point)
+        test_edge_indices = (
+            np.searchsorted(edges[edge_index_min:edge_index_max], test_data_poss, side="left") + edge_index_min
+        )
+        candidates = np.concatenate(([True], test_edge_indices[1:] != test_edge_indices[:-1]))  # new segments
+        candidates &= test_edge_indices % 2 == 1  # only keep transition edges
+        if len(self._activity_spans):
+            candidates &= np.searchsorted(self._activity_spans, test_data_poss, side="right") % 2 == 0
         labels: List[Tuple[float, float, str, QColor]] = []
-        for test_point_i in range(test_point_count):
-            test_data_pos = self.viewRect().left() + test_point_span * test_point_i
-            # note, bisect left returns the first point at or AFTER the test point (insertion point)
-            test_edge_index = bisect.bisect_left(edges, test_data_pos, lo=edge_index_min, hi=edge_index_max)
-            if test_edge_index == prev_edge_index:
-                continue
-            prev_edge_index = test_edge_index
-            if test_edge_index % 2 == 0:  # only keep transition edges
-                continue
+        for test_edge_index in test_edge_indices[candidates]:
             assert test_edge_index > 0
 
             left_edge = edges[test_edge_index - 1]
-            right_edge = edges[test_edge_index]
+            if test_edge_index < len(edges):
+                right_edge = edges[test_edge_index]
+            else:  # last segment, right side is unbounded
+                right_edge = float("inf")
             if left_edge < self.viewRect().left() <= right_edge:  # clip left side to viewport
                 left_edge = self.viewRect().left()
-            if right_edge == edges[-1]:  # right side is unbounded
-                right_edge = float("inf")
+            span_index = int(np.searchsorted(self._activity_spans, left_edge, side="right"))
+            if span_index % 2 == 1:  # clip left side to the activity band
+                left_edge = self._activity_spans[span_index]
             held_data_width = right_edge - left_edge
             if held_data_width < min_data_width:  # quick test against minimum width
                 continue
 
-            data_index = bisect.bisect_left(xs, left_edge)
+            if RunLengthEncoding.is_run_length(ys):  # the left edge may be inside a held run
+                held_index = RunLengthEncoding.index_at(xs, ys, left_edge)
+                if held_index is None:
+                    continue
+                data_index = held_index
+            else:  # samples within a segment share its value
+                data_index = UniformTimebase.bisect_left(xs, left_edge)
             self._sample_label.setText(str(ys[data_index]))
             label_width = cast(QRect, self.mapRectToView(self._sample_label.boundingRect())).width()
             if held_data_width >= label_width:
@@ -17,20 +17,30 @@ Mixins into pyqtgraph PlotItem that provide interactivity functionality, includi
 live x-axis cursor, region selection, and points-of-interest.
 """
 
-import bisect
+import math
+import time
 from abc import abstractmethod
-from typing import List, Tuple, Dict, Optional, Any, cast, NamedTuple, Union, Mapping
+from typing import List, Tuple, Dict, Optional, Any, cast, NamedTuple, Union, Mapping, Set, Callable
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import QPointF, QSignalBlocker, Signal, Slot
-from PySide6.QtGui import Qt, QColor, QKeyEvent
+from PySide6.QtCore import QPointF, QSignalBlocker, Signal, Slot, QTimer
+from PySide6.QtGui import Qt, QColor, QKeyEvent, QPen
 from PySide6.QtWidgets import QGraphicsSceneMouseEvent
 from numpy import typing as npt
 from pyqtgraph import mkPen
 from pyqtgraph.GraphicsScene.mouseEvents import HoverEvent
 
 from pyqtgraph_scope_plots.graphics_collections import ScatterItemCollection, TextItemCollection
+from .util import (
+    ArrayMeta,
+    GapIndex,
+    IdentityCacheDict,
+    MinMaxPyramid,
+    AppendableArray,
+    RunLengthEncoding,
+    UniformTimebase,
+)
 
 
 class DataPlotItem(pg.PlotItem):  # type: ignore[misc]
@@ -41,24 +51,122 @@ class DataPlotItem(pg.PlotItem):  # type: ignore[misc]
         self._data_items: Dict[str, QColor] = {}
         self._data_graphics: Dict[str, List[pg.GraphicsObject]] = {}
         self._data: Dict[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]] = {}
+        self._suspended = False  # if set, data is stored but not rendered, eg while not visible
+        self._stale = False  # whether data was updated while suspended
+        self._stale_data_names: Set[str] = set()
+
+        # range-dependent work is deferred until view range changes settle, once per event loop iteration
+        # or in a batch across plots by the range batcher
+        self._range_batcher: Optional[Callable[[DataPlotItem], None]] = None
+        self._pending_range_settle = False
+        self._range_stale = False  # whether the range changed while suspended
+        self._range_settle_timer = QTimer(self)
+        self._range_settle_timer.setSingleShot(True)
+        self._range_settle_timer.timeout.connect(self._settle_view_range)
+        self.getViewBox().sigRangeChanged.connect(self._on_view_range_changed)
+        self.getViewBox().sigResized.connect(self._on_view_range_changed)
 
     def set_data_items(self, data_items: Mapping[str, QColor]) -> None:
-        """Generates plot items for the input data items."""
-        for graphics in self._data_graphics.values():  # re-create the graphical items
-            for item in graphics:
+        """Sets the data items, reconciling graphics as a diff: graphics are generated for new data items,
+        removed for deleted ones, and recolored in place for changed colors. Unchanged data items are untouched.
+        Existing data for new data items (eg, set before the data item) is rendered."""
+        if dict(data_items) == self._data_items:
+            return
+        removed_names = [name for name in self._data_items if name not in data_items]
+        added_items = {name: color for name, color in data_items.items() if name not in self._data_items}
+        recolored_items = {
+            name: color
+            for name, color in data_items.items()
+            if name in self._data_items and self._data_items[name] != color
+        }
+        self._data_items = dict(data_items)
+
+        for name in removed_names:
+            for item in self._data_graphics.pop(name, []):
                 self.removeItem(item)
+            self._data.pop(name, None)
+        if removed_names:
+            self._remove_plot_items(removed_names)
 
-        self._data_items = dict(data_items)
-        self._data_graphics = self._generate_plot_items(data_items)
-        for graphics in self._data_graphics.values():
-            for item in graphics:
-                self.addItem(item)
+        if added_items:
+            added_graphics = self._generate_plot_items(added_items)
+            for name, graphics in added_graphics.items():
+                for item in graphics:
+                    self.addItem(item)
+                self._data_graphics[name] = graphics
 
-        self.set_data(self._data)  # don't clear existing data
+        for name, color in recolored_items.items():
+            self._update_plot_item_color(name, color)
+
+        # render new data items, and refresh anything else (like labels) that depend on the data items
+        self.update_data({name: self._data[name] for name in added_items if name in self._data})
 
     def set_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
-        """Updates data for plots defined in set_data_items."""
-        self._data = dict(data)
+        """Sets data for plots defined in set_data_items, replacing all existing data."""
+        self._data = {}
+        self.update_data(data)
+
+    def update_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
+        """Updates data for a subset of plots defined in set_data_items, leaving other data untouched.
+        If suspended, rendering is deferred until resumed."""
+        self._data.update(data)
+        if self._suspended:
+            self._stale = True
+            self._stale_data_names.update(data.keys())
+            return
+        self._render_data(data)
+
+    def set_suspended(self, suspended: bool) -> None:
+        """Suspends rendering (eg, while the plot is not visible), or resumes and catches up on updates made while
+        suspended in one shot."""
+        if suspended == self._suspended:
+            return
+        self._suspended = suspended
+        if not suspended:
+            self._on_resumed()
+
+    def _on_resumed(self) -> None:
+        """Called when rendering is resumed, to render stale state.
+        Optionally override this to catch up on other deferred work, with a super() call."""
+        if self._stale:
+            stale_data = {name: self._data[name] for name in self._stale_data_names if name in self._data}
+            self._stale = False
+            self._stale_data_names = set()
+            self._render_data(stale_data)
+        if self._range_stale:
+            self._range_stale = False
+            self._on_view_range_settled()
+
+    def set_range_batcher(self, batcher: Optional[Callable[["DataPlotItem"], None]]) -> None:
+        """Sets a function to batch range-dependent work across plots, called with this plot when its view range
+        changes, which must later call _settle_view_range. If None, this plot schedules its own."""
+        self._range_batcher = batcher
+
+    def _on_view_range_changed(self) -> None:
+        if self._pending_range_settle:
+            return
+        self._pending_range_settle = True
+        if self._range_batcher is not None:
+            self._range_batcher(self)
+        else:
+            self._range_settle_timer.start(0)
+
+    def _settle_view_range(self) -> None:
+        """Runs range-dependent work once after view range changes, deferred while suspended."""
+        self._pending_range_settle = False
+        if self._suspended:  # caught up when resumed
+            self._range_stale = True
+            return
+        self._on_view_range_settled()
+
+    def _on_view_range_settled(self) -> None:
+        """Called once after view range (pan, zoom, resize) changes settle, to update range-dependent graphics.
+        Not called while suspended. Optionally override this, with a super() call."""
+        pass
+
+    def _render_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
+        """Renders updated data for a subset of data items. Not called while suspended.
+        Override this to process new data, with a super() call."""
         for data_name, (xs, ys) in data.items():
             graphics = self._data_graphics.get(data_name)
             if graphics is None:  # not pre-defined in set_data_items, ignore
@@ -67,12 +175,32 @@ class DataPlotItem(pg.PlotItem):  # type: ignore[misc]
 
     @abstractmethod
     def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
-        """Defines how to generate pyqtgraph graphics items from data definitions.
+        """Defines how to generate pyqtgraph graphics items from data definitions, for data items being added
+        (existing data items are kept).
         Returns a mapping of data item names to their graphics objects.
         This should store graphics objects to be updated later in instance variables.
         INTERNAL API - STABILITY NOT GUARANTEED"""
         raise NotImplementedError
 
+    def _remove_plot_items(self, names: List[str]) -> None:
+        """Called when data items are removed, after their graphics are removed from the plot, to clean up any
+        state stored for their graphics. Optionally override this, with a super() call.
+        INTERNAL API - STABILITY NOT GUARANTEED"""
+        pass
+
+    def _update_plot_item_color(self, name: str, color: QColor) -> None:
+        """Recolors the graphics of a data item in place, keeping other styling.
+        Optionally override this for graphics other than curves and scatters.
+        INTERNAL API - STABILITY NOT GUARANTEED"""
+        for item in self._data_graphics.get(name, []):
+            if isinstance(item, pg.ScatterPlotItem):
+                item.setPen(color)
+                item.setBrush(color)
+            elif isinstance(item, pg.PlotCurveItem):
+                pen = QPen(item.opts["pen"])
+                pen.setColor(color)
+                item.setPen(pen)
+
     @abstractmethod
     def _update_plot_data(self, name: str, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]) -> None:
         """Called when the data is updated, but the data items (and graphical objects) remain the same.
@@ -82,27 +210,150 @@ class DataPlotItem(pg.PlotItem):  # type: ignore[misc]
         raise NotImplementedError
 
 
+class ClippedPlotCurveItem(pg.PlotCurveItem):  # type: ignore[misc]
+    """PlotCurveItem that may only hold the visible (or decimated) part of some larger data,
+    but reports the bounds of the full data so autoranging is unaffected."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._full_bounds: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
+
+    def set_full_bounds(self, bounds: Optional[Tuple[Tuple[float, float], Tuple[float, float]]]) -> None:
+        """Sets the (x, y) bounds of the full data, or None to use the bounds of the held data."""
+        self._full_bounds = bounds
+        self.prepareGeometryChange()
+        self.informViewBoundsChanged()
+
+    def dataBounds(
+        self, ax: int, frac: float = 1.0, orthoRange: Optional[Tuple[float, float]] = None
+    ) -> Tuple[Optional[float], Optional[float]]:
+        if self._full_bounds is None or frac < 1.0 or orthoRange is not None:  # visible-only autorange is exact
+            return cast(Tuple[Optional[float], Optional[float]], super().dataBounds(ax, frac, orthoRange))
+        return self._full_bounds[ax]
+
+
 class DataPlotCurveItem(DataPlotItem):
-    """DataPlotItem that generates a PlotCurveItem"""
+    """DataPlotItem that generates a PlotCurveItem.
+    Large data is drawn from a min/max decimation pyramid, using the level that matches the view's pixel width,
+    and falls back to the raw samples when zoomed in far enough.
+    With CLIP_TO_VIEW, only the visible slice (plus one sample of margin on each side) is handed to the curve,
+    updated once view range changes settle."""
+
+    CLIP_TO_VIEW = True
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._curves: Dict[str, pg.PlotCurveItem] = {}
+        self._curves: Dict[str, ClippedPlotCurveItem] = {}
+        # (decimation level or None for raw, start index, end index) currently drawn
+        self._curve_views: Dict[str, Tuple[Optional[int], int, int]] = {}
+        self._pyramids = IdentityCacheDict[npt.NDArray[Any], MinMaxPyramid]()  # ys -> pyramid
 
     def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
-        """Clear existing state and generate new plot items for all data items"""
-        self._curves.clear()
         graphics_dict: Dict[str, List[pg.GraphicsObject]] = {}
         for name, color in data_items.items():
-            curve = pg.PlotCurveItem(x=[], y=[], name=name)
+            curve = ClippedPlotCurveItem(x=[], y=[], name=name)
             curve.setPen(color=color, width=1)
             self._curves[name] = curve
             graphics_dict[name] = [curve]
 
         return graphics_dict
 
+    def _remove_plot_items(self, names: List[str]) -> None:
+        super()._remove_plot_items(names)
+        for name in names:
+            self._curves.pop(name, None)
+            self._curve_views.pop(name, None)
+
     def _update_plot_data(self, name: str, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]) -> None:
-        self._curves[name].setData(x=xs, y=ys)
+        if self.CLIP_TO_VIEW and len(xs) and np.issubdtype(ys.dtype, np.number):
+            y_bounds = self._finite_bounds(ys)
+            self._curves[name].set_full_bounds(((xs[0], xs[-1]), y_bounds))
+        else:
+            self._curves[name].set_full_bounds(None)
+        self._update_curve(name, xs, ys, True)
+
+    def _finite_bounds(self, ys: npt.NDArray[Any]) -> Tuple[float, float]:
+        """Returns the (cached, where possible, see ArrayMeta) bounds of the finite values of some data."""
+        meta = ArrayMeta.of(ys)
+        if meta is None or math.isnan(meta.finite_min):  # no finite values
+            return 0.0, 0.0
+        return meta.finite_min, meta.finite_max
+
+    def _decimation_pyramid(self, ys: npt.NDArray[Any]) -> MinMaxPyramid:
+        """Returns the (cached, where possible) min/max pyramid for some data."""
+        if ys.flags.writeable:  # can't be cached by identity
+            return MinMaxPyramid(ys)
+        pyramid = self._pyramids.get(ys, None, [])
+        if pyramid is not None and not pyramid.valid:  # buffers taken over by a pyramid of appended data
+            pyramid = None
+        if pyramid is None:
+            prefix = AppendableArray.prefix_of(ys)
+            prefix_pyramid = self._pyramids.get(prefix, None, []) if prefix is not None else None
+            if prefix_pyramid is not None and prefix_pyramid.valid:  # appended data, only process the tail
+                pyramid = MinMaxPyramid(ys, prefix_pyramid)
+            else:
+                pyramid = MinMaxPyramid(ys)
+            self._pyramids.set(ys, None, [], pyramid)
+        return pyramid
+
+    def _curve_view(self, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]) -> Tuple[Optional[int], int, int]:
+        """Returns the pyramid level (or None for raw samples) and the index range to draw for the current view."""
+        viewbox = self.getViewBox()
+        width_px = max(viewbox.width(), 1)  # before layout, assume the coarsest level until resized
+        view_x_range = viewbox.viewRange()[0]
+        start = max(UniformTimebase.bisect_left(xs, view_x_range[0]) - 1, 0)  # include one sample of margin
+        end = min(UniformTimebase.bisect_right(xs, view_x_range[1]) + 1, len(xs))
+        if not self.CLIP_TO_VIEW:
+            start, end = 0, len(xs)
+        visible_count = end - start
+        if visible_count < MinMaxPyramid.BASE_BUCKET * width_px or not np.issubdtype(ys.dtype, np.number):
+            return None, start, end
+        level = self._decimation_pyramid(ys).level_for(visible_count, width_px)
+        if level is not None and self.CLIP_TO_VIEW:  # align to buckets so small pans don't change the data
+            bucket_size = self._decimation_pyramid(ys).bucket_sizes[level]
+            start = start // bucket_size * bucket_size
+            end = min(-(-end // bucket_size) * bucket_size, len(xs))
+        return level, start, end
+
+    def _update_curve(self, name: str, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any], force: bool) -> None:
+        """Draws the data for a curve at the decimation level and clipping for the current view.
+        If not forced, the curve is only updated when the drawn level or range changes."""
+        curve_view = self._curve_view(xs, ys)
+        if not force and self._curve_views.get(name) == curve_view:
+            return
+        self._curve_views[name] = curve_view
+        level, start, end = curve_view
+        step_mode = "right" if RunLengthEncoding.is_run_length(ys) else None  # values hold until the next sample
+        gaps = GapIndex.of(xs, ys) if step_mode is None else None
+        # skip pyqtgraph's per-draw finiteness pass if the data is known finite (only for data cached by identity)
+        xs_meta = ArrayMeta.of(xs) if not xs.flags.writeable else None
+        ys_meta = ArrayMeta.of(ys) if not ys.flags.writeable else None
+        all_finite = xs_meta is not None and xs_meta.all_finite and ys_meta is not None and ys_meta.all_finite
+        indices: Optional[npt.NDArray[np.integer[Any]]] = None
+        if level is None:
+            indices = np.arange(start, end) if gaps is not None else None
+        else:
+            indices = self._decimation_pyramid(ys).indices(level, start, end)
+        if gaps is not None:  # only draw valid points, not connected across gaps
+            assert indices is not None
+            indices = indices[np.isfinite(ys[indices])]
+            self._curves[name].setData(
+                x=xs[indices],
+                y=ys[indices],
+                connect=gaps.connected(indices),
+                skipFiniteCheck=xs_meta is not None and xs_meta.all_finite,
+            )
+        else:
+            xs, ys = (xs[start:end], ys[start:end]) if indices is None else (xs[indices], ys[indices])
+            self._curves[name].setData(x=xs, y=ys, stepMode=step_mode, skipFiniteCheck=all_finite, connect="all")
+
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
+        for name, curve in self._curves.items():
+            xs, ys = self._data.get(name, (None, None))
+            if xs is None or ys is None:
+                continue
+            self._update_curve(name, xs, ys, False)
 
 
 class DeltaAxisItem(pg.AxisItem):  # type: ignore[misc]
@@ -132,8 +383,9 @@ class HasDataValueAt(DataPlotItem):
             if not len(xs):
                 continue
 
-            index = bisect.bisect_left(xs, pos)
-            if index < len(xs) and xs[index] == pos:  # found exact match
+            index = RunLengthEncoding.index_at(xs, ys, pos)
+            gaps = GapIndex.of(xs, ys)
+            if index is not None and (gaps is None or not gaps.is_missing(index)):  # exact or held, and not missing
                 outs.append(
                     (
                         ys[index],
@@ -151,7 +403,20 @@ class HasDataValueAt(DataPlotItem):
 
 class SnappableHoverPlot(DataPlotCurveItem):
     """Mixin for PlotItem that provides an optional snapped nearest data point on user hover.
-    Shows a visual target on the snapped point."""
+    Shows a visual target on the snapped point.
+
+    Dense numeric data is snapped using its min/max decimation pyramid as a spatial index: only the min/max envelope
+    of the finest level with at most SNAP_BUCKETS_PER_PX buckets per pixel of the snap window is searched. Rendering
+    draws a coarser (or the same) level, so the rendered points (and peaks) are always included, and snapping cost is
+    bounded regardless of density.
+
+    Hover events are coalesced to at most HOVER_RATE_HZ updates per second, with the latest position winning: an event
+    is processed immediately if the last update was at least a frame ago, otherwise at the start of the next frame.
+    Reading hover_snap_point processes any pending event first, so it is never stale."""
+
+    class HoverMetrics(NamedTuple):
+        received: int  # hover events received
+        processed: int  # coalesced hover updates run
 
     sigHoverSnapChanged = Signal(HoverSnapData)  # emitted during mouseover when the mouse pos changes
 
@@ -163,13 +428,23 @@ class SnappableHoverPlot(DataPlotCurveItem):
     sigDragCursorCleared = Signal()
 
     SNAP_DISTANCE_PX = 12
-    MAX_PTS = 1024  # if more than this many points in the window, give up
+    MAX_PTS = 1024  # max raw points searched per curve, denser data is searched on its decimation envelope
+    SNAP_BUCKETS_PER_PX = MinMaxPyramid.LEVEL_FACTOR  # rendering draws between 1 and LEVEL_FACTOR buckets per px
+    HOVER_RATE_HZ = 60.0  # max hover updates (snapping and dependent cursors) per second
 
     _Z_VALUE_SNAP_TARGET = 1000
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self.hover_snap_point = HoverSnapData(QPointF(0, 0), None)  # stores the last hover state
+        self._hover_snap_point = HoverSnapData(QPointF(0, 0), None)  # stores the last hover state
+        self._hover_pending = False
+        self._pending_hover_pos: Optional[QPointF] = None  # latest unprocessed hover position, None on exit
+        self._last_hover_s = 0.0
+        self._hover_received = 0
+        self._hover_processed = 0
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.timeout.connect(self._flush_hover)
         self._hover_target = pg.TargetItem(movable=False)
         self._hover_target.setZValue(self._Z_VALUE_SNAP_TARGET)
         self._hover_target.hide()
@@ -179,28 +454,34 @@ class SnappableHoverPlot(DataPlotCurveItem):
         """Returns the closest point in the snappable data set to the target_pos, with x-value between x_lo and x_hi."""
         # closest point for each curve: (data, index, distance)
         data_index_dists: List[Tuple[Tuple[npt.NDArray[np.float64], npt.NDArray[Any]], int, float]] = []
+        pixel_size: Optional[Tuple[float, float]] = None  # all curves share the view, so only computed once
         for name, (xs, ys) in self._data.items():
             data_graphics = self._data_graphics.get(name)
             if not data_graphics or not data_graphics[0].isVisible():
                 continue
             if not len(xs):
                 continue
-            index_lo = bisect.bisect_left(xs, x_lo)
-            index_hi = bisect.bisect_right(xs, x_hi)
-            if index_hi - index_lo > self.MAX_PTS:
+            index_lo = UniformTimebase.bisect_left(xs, x_lo)
+            index_hi = UniformTimebase.bisect_right(xs, x_hi)
+            candidates = self._snap_candidates(ys, index_lo, index_hi)
+            if candidates is None:
                 continue
 
             # this code inspired by ScatterPlotItem._maskAt, which is used to find intersecting items fast
-            px, py = data_graphics[0].pixelVectors()  # account for graph scaling
-            if px is None or py is None or px.x() == 0 or py.y() == 0:  # invalid
-                continue
-            dxs = (xs[index_lo:index_hi] - target_pos.x()) / px.x()
-            dys = (ys[index_lo:index_hi] - target_pos.y()) / py.y()
+            if pixel_size is None:
+                px, py = data_graphics[0].pixelVectors()  # account for graph scaling
+                if px is None or py is None or px.x() == 0 or py.y() == 0:  # invalid
+                    continue
+                pixel_size = (px.x(), py.y())
+            dxs = (xs[candidates] - target_pos.x()) / pixel_size[0]
+            dys = (ys[candidates] - target_pos.y()) / pixel_size[1]
             dists = np.hypot(dxs, dys)
-            if not len(dists):
+            dists[np.isnan(dists)] = np.inf  # don't snap to missing samples
+            if not len(dists) or not np.isfinite(dists).any():
                 continue
             min_dist_index = int(np.argmin(dists))
-            data_index_dists.append(((xs, ys), min_dist_index + index_lo, dists[min_dist_index]))
+            index = min_dist_index + index_lo if isinstance(candidates, slice) else int(candidates[min_dist_index])
+            data_index_dists.append(((xs, ys), index, dists[min_dist_index]))
 
         if data_index_dists:
             (closest_xs, closest_ys), closest_index, _ = min(data_index_dists, key=lambda tup: tup[2])
@@ -208,16 +489,62 @@ class SnappableHoverPlot(DataPlotCurveItem):
         else:
             return None
 
+    def _snap_candidates(
+        self, ys: npt.NDArray[Any], index_lo: int, index_hi: int
+    ) -> Optional[Union[slice, npt.NDArray[np.integer[Any]]]]:
+        """Returns the indices (as a slice or index array) of samples in [index_lo, index_hi) to search for snapping,
+        or None if the range is too dense to search and can't be decimated."""
+        if index_hi - index_lo <= self.MAX_PTS:
+            return slice(index_lo, index_hi)
+        if not np.issubdtype(ys.dtype, np.number):
+            return None
+        pyramid = self._decimation_pyramid(ys)
+        max_buckets = 2 * self.SNAP_DISTANCE_PX * self.SNAP_BUCKETS_PER_PX
+        level = pyramid.level_within(index_hi - index_lo, max_buckets)
+        if level is None:
+            return slice(index_lo, index_hi)
+        return pyramid.indices(level, index_lo, index_hi)
+
+    @property
+    def hover_snap_point(self) -> HoverSnapData:
+        """The last hover state, after processing any pending hover event."""
+        self._flush_hover()
+        return self._hover_snap_point
+
+    def hover_metrics(self) -> "SnappableHoverPlot.HoverMetrics":
+        return self.HoverMetrics(self._hover_received, self._hover_processed)
+
     def hoverEvent(self, ev: HoverEvent) -> None:
         super().hoverEvent(ev)
-        if ev.exit:  # use last data point, since position may not be available here
-            snap_data = HoverSnapData(hover_pos=self.hover_snap_point.hover_pos, snap_pos=None)
+        self._hover_received += 1
+        self._hover_pending = True
+        self._pending_hover_pos = None if ev.exit else QPointF(ev.pos())  # position may not be available on exit
+        delay_s = self._last_hover_s + 1 / self.HOVER_RATE_HZ - time.monotonic()
+        if delay_s <= 0:
+            self._flush_hover()
+        elif not self._hover_timer.isActive():
+            self._hover_timer.start(math.ceil(delay_s * 1000))
+
+    def _flush_hover(self) -> None:
+        """Processes the pending hover event now, if any."""
+        self._hover_timer.stop()
+        if not self._hover_pending:
+            return
+        self._hover_pending = False
+        self._hover_processed += 1
+        self._last_hover_s = time.monotonic()
+        self._process_hover(self._pending_hover_pos)
+
+    def _process_hover(self, pos: Optional[QPointF]) -> None:
+        """Processes a (coalesced) hover event at some position in item coordinates, or None on hover exit.
+        Optionally override this to respond to hover, with a super() call."""
+        if pos is None:  # use last data point
+            snap_data = HoverSnapData(hover_pos=self._hover_snap_point.hover_pos, snap_pos=None)
             self._hover_target.hide()
-            self.hover_snap_point = snap_data
+            self._hover_snap_point = snap_data
             self.sigHoverSnapChanged.emit(snap_data)
             return
 
-        pos = ev.pos()
         # based on pyqtgraph/examples/crosshair.py
         data_pos = cast(QPointF, self.mapToView(pos))
         data_lo = cast(
@@ -239,7 +566,7 @@ class SnappableHoverPlot(DataPlotCurveItem):
         else:
             self._hover_target.hide()
 
-        self.hover_snap_point = snap_data
+        self._hover_snap_point = snap_data
         self.sigHoverSnapChanged.emit(snap_data)
 
 
@@ -312,9 +639,9 @@ class LiveCursorPlot(SnappableHoverPlot, HasDataValueAt):
             curr_pos = snap_data.hover_pos
         self.set_live_cursor(curr_pos.x(), snap_data.hover_pos.y())
 
-    def hoverEvent(self, ev: HoverEvent) -> None:
-        super().hoverEvent(ev)
-        if ev.exit:
+    def _process_hover(self, pos: Optional[QPointF]) -> None:
+        super()._process_hover(pos)
+        if pos is None:
             self.set_live_cursor(None)
 
     @staticmethod
@@ -386,7 +713,6 @@ class RegionPlot(SnappableHoverPlot):
         self._cursor_range_label: Optional[pg.TextItem] = None
 
         self.show_cursor_range_labels = True
-        self.sigRangeChanged.connect(self._update_cursor_labels)
 
     def set_region(self, region: Optional[Union[float, Tuple[float, float]]]) -> None:
         """Creates a cursor / region at the bounds, or moves the existing cursor / region if it exists.
@@ -469,6 +795,10 @@ class RegionPlot(SnappableHoverPlot):
             elif self.cursor_range is not None and self.cursor_range.mouseHovering:  # remove region
                 self.set_region(None)
 
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
+        self._update_cursor_labels()
+
     @Slot()
     def _update_cursor_labels(self) -> None:
         if self.cursor_range is not None:
@@ -586,8 +916,6 @@ class PointsOfInterestPlot(SnappableHoverPlot, HasDataValueAt):
         self.pois: List[pg.InfiniteLine] = []  # lines
         self._poi_items: Dict[pg.InfiniteLine, Tuple[ScatterItemCollection, TextItemCollection]] = {}
 
-        self.sigRangeChanged.connect(self._update_all_poi_labels)
-
     def set_pois(self, pois: List[float]) -> None:
         for _ in range(len(self.pois), len(pois)):  # POIs to be added
             self._add_poi(0)
@@ -620,10 +948,14 @@ class PointsOfInterestPlot(SnappableHoverPlot, HasDataValueAt):
         for line, _ in self._poi_items.items():
             self._update_poi(line)
 
-    def set_data(self, *args: Any, **kwargs: Any) -> None:
-        super().set_data(*args, **kwargs)
+    def _render_data(self, *args: Any, **kwargs: Any) -> None:
+        super()._render_data(*args, **kwargs)
         self._update_all_poi_labels()  # update if plot changed
 
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
+        self._update_all_poi_labels()  # account for scale changes
+
     def _add_poi(self, pos: float) -> None:
         """Adds a new POI at the location"""
         cursor = pg.InfiniteLine(movable=True)
@@ -675,9 +1007,9 @@ class NudgeablePlot(HasDataValueAt):
             if not len(xs):
                 continue
             if dir < 0:  # find previous
-                index = bisect.bisect_left(xs, curr_pos) - 1
+                index = UniformTimebase.bisect_left(xs, curr_pos) - 1
             else:  # find next
-                index = bisect.bisect_right(xs, curr_pos)
+                index = UniformTimebase.bisect_right(xs, curr_pos)
             if index < 0 or index >= len(xs):  # out of bounds
                 continue
             next_pos = xs[index]
@@ -756,18 +1088,21 @@ class EmptyPlotIndicatorPlot(SnappableHoverPlot):
         self._empty_plot_text = pg.TextItem(text=self._EMPTY_PLOT_HELP_TEXT, anchor=(0.5, 0.5))
         self.addItem(self._empty_plot_text, ignoreBounds=True)
         self._on_range_changed_for_empty_indicator()
-        self.sigRangeChanged.connect(self._on_range_changed_for_empty_indicator)
 
-    def set_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
+    def _render_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
         """Override to show/hide empty plot indicator based on data presence."""
-        super().set_data(data)
+        super()._render_data(data)
 
-        if not len(data):
+        if not len(self._data):
             self._on_range_changed_for_empty_indicator()
             self._empty_plot_text.show()
         else:
             self._empty_plot_text.hide()
 
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
+        self._on_range_changed_for_empty_indicator()
+
     @Slot()
     def _on_range_changed_for_empty_indicator(self) -> None:
         """Updates the position of the empty plot indicator when the view range changes."""
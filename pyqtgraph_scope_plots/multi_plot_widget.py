@@ -14,16 +14,33 @@
 
 from enum import Enum
 from functools import partial
-from typing import Dict, Tuple, List, Optional, Any, Callable, Union, Mapping, cast, Literal, TypeVar
+from typing import (
+    Dict,
+    Tuple,
+    List,
+    Optional,
+    Any,
+    Callable,
+    Union,
+    Mapping,
+    cast,
+    Literal,
+    TypeVar,
+    Collection,
+    Set,
+    NamedTuple,
+)
 
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import pyqtgraph as pg
-from PySide6.QtCore import QSignalBlocker, QPoint, QSize, Signal
+from PySide6.QtCore import QSignalBlocker, QRect, Signal, QObject, QEvent, QChildEvent, QTimer
 from PySide6.QtGui import QColor, Qt, QDropEvent, QDragLeaveEvent, QPainter, QBrush, QDragMoveEvent, QPaintEvent
 from PySide6.QtWidgets import QWidget, QSplitter
 from pydantic import BaseModel
 
+from .digital_bus_plotitem import DigitalBusPlot
 from .enum_waveform_plotitem import EnumWaveformPlot
 from .interactivity_mixins import (
     PointsOfInterestPlot,
@@ -34,9 +51,24 @@ from .interactivity_mixins import (
     DataPlotItem,
     NudgeablePlot,
     EmptyPlotIndicatorPlot,
+    SnappableHoverPlot,
 )
 from .point_on_zoom_plot import PointOnZoomPlot, EnumPointOnZoomPlot
-from .util import BaseTopModel, HasSaveLoadDataConfig
+from .time_axis import TimeAxisItem
+from .util import (
+    BaseTopModel,
+    HasSaveLoadDataConfig,
+    AppendableArray,
+    CategoricalCodes,
+    DerivedData,
+    DigitalBus,
+    IdentityCacheDict,
+    RunLengthEncoding,
+    UniformTimebase,
+    cast_values,
+    ingest_array,
+    ingest_data_frame,
+)
 
 
 class InteractivePlot(
@@ -69,6 +101,22 @@ class EnumWaveformInteractivePlot(
     POI_ANCHOR = (0, 0.5)
 
 
+class DigitalBusInteractivePlot(
+    DraggableCursorPlot,
+    NudgeablePlot,
+    PointsOfInterestPlot,
+    RegionPlot,
+    LiveCursorPlot,
+    EmptyPlotIndicatorPlot,
+    DigitalBusPlot,
+):
+    """Digital bus plot with all the interactivity mixins"""
+
+    LIVE_CURSOR_X_ANCHOR = (1, 0.5)
+    LIVE_CURSOR_Y_ANCHOR = (0, 0.5)
+    POI_ANCHOR = (0, 0.5)
+
+
 class PlotWidgetModel(BaseModel):
     data_items: List[str] = []  # window index -> list of data items
     y_range: Optional[Union[Tuple[float, float], Literal["auto"]]] = None
@@ -85,6 +133,7 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
     class PlotType(Enum):
         DEFAULT = 0  # x-y plot
         ENUM_WAVEFORM = 1  # renders string-valued enums as a waveform
+        DIGITAL_BUS = 2  # renders bit-packed boolean lines (see DigitalBus) as stacked logic traces
 
     class NewDataAction(Enum):
         NEW_PLOT = 0  # creates a new plot window for each new data
@@ -99,6 +148,7 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
 
     sigDataItemsUpdated = Signal()  # called when new plot data items are set
     sigDataUpdated = Signal()  # called when new plot data is available
+    sigDataAppended = Signal(object)  # List[str] of data names, called when data is appended with append_data
 
     _MODEL_BASES = [MultiPlotStateModel]
 
@@ -116,11 +166,20 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
         self._data_items: Mapping[str, Tuple[QColor, MultiPlotWidget.PlotType]] = {}  # ordered
         self._raw_data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]] = {}  # pre-transforms, immutable
         self._data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]] = {}  # post-transforms
+        # for datetime64 xs, the timestamp at plot x=0, with xs in plot space as float seconds relative to this
+        self._x_origin: Optional[np.datetime64] = None
+        self._x_origin_cache = IdentityCacheDict[npt.NDArray[Any], npt.NDArray[np.float64]]()  # datetime xs -> xs
+        self._value_dtype_cache = IdentityCacheDict[npt.NDArray[Any], npt.NDArray[Any]]()  # ys -> ys in value dtype
+
+        # plots with view range changes pending, settled in one pass after x-range changes propagate to all plots
+        self._range_settle_plot_items: Dict[DataPlotItem, None] = {}  # as ordered set
+        self._range_settle_timer = QTimer(self)
+        self._range_settle_timer.setSingleShot(True)
+        self._range_settle_timer.timeout.connect(self._settle_plot_ranges)
 
         self.setOrientation(Qt.Orientation.Vertical)
         default_plot_item = self._init_plot_item(self._create_plot_item(self.PlotType.DEFAULT))
-        default_plot_widget = pg.PlotWidget(plotItem=default_plot_item)
-        self.addWidget(default_plot_widget)
+        self._add_plot_item(default_plot_item)
         # contained data items per plot
         self._plot_item_data: Dict[DataPlotItem, List[str]] = {default_plot_item: []}
         # re-derived when _plot_item_data updated, does NOT include the placeholder plot
@@ -133,15 +192,12 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
         model.plot_widgets = []
         x_viewbox: Optional[pg.ViewBox] = None
 
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if not isinstance(widget, pg.PlotWidget):  # ignored
-                continue
+        for plot_item in self._plot_items_ordered():
             widget_model = PlotWidgetModel()
             widget_model.data_items = [
-                data_item for data_item in self._plot_item_data.get(widget.getPlotItem(), []) if data_item is not None
+                data_item for data_item in self._plot_item_data.get(plot_item, []) if data_item is not None
             ]
-            widget_viewbox = cast(pg.PlotItem, widget.getPlotItem()).getViewBox()
+            widget_viewbox = cast(pg.PlotItem, plot_item).getViewBox()
             if widget_viewbox.autoRangeEnabled()[1]:
                 widget_model.y_range = "auto"
             else:
@@ -173,11 +229,10 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
             if plot_type is None:
                 continue
             add_plot_item = self._init_plot_item(self._create_plot_item(plot_type))
-            plot_widget = pg.PlotWidget(plotItem=add_plot_item)
-            self.addWidget(plot_widget)
+            self._add_plot_item(add_plot_item)
             self._plot_item_data[add_plot_item] = plot_widget_model.data_items
 
-            widget_viewbox = cast(pg.PlotItem, plot_widget.getPlotItem()).getViewBox()
+            widget_viewbox = cast(pg.PlotItem, add_plot_item).getViewBox()
             if model.x_range is not None and model.x_range != "auto":
                 widget_viewbox.setXRange(model.x_range[0], model.x_range[1], 0)
             if plot_widget_model.y_range is not None and plot_widget_model.y_range != "auto":
@@ -191,6 +246,24 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
         self._update_plots_x_axis()
         self._update_plot_item_data_items()
 
+    def childEvent(self, event: QChildEvent) -> None:
+        super().childEvent(event)
+        if event.added() and isinstance(event.child(), pg.PlotWidget):  # watch for visibility changes
+            event.child().installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if isinstance(watched, pg.PlotWidget) and event.type() in (
+            QEvent.Type.Show,
+            QEvent.Type.Hide,
+            QEvent.Type.Resize,
+        ):
+            plot_item = watched.getPlotItem()
+            if isinstance(plot_item, DataPlotItem):  # suspend hidden and collapsed plots, catch up when visible
+                plot_item.set_suspended(
+                    event.type() == QEvent.Type.Hide or watched.height() <= 0 or watched.width() <= 0
+                )
+        return super().eventFilter(watched, event)
+
     def render_value(self, data_name: str, value: float) -> str:
         """Float-to-string conversion for a value. Optionally override this to provide smarter precision."""
         plot_item = self._data_name_to_plot_item.get(data_name, None)
@@ -206,22 +279,33 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
         """Sets the X axis of plots, updating existing plots and for future plots.
         The axis must be given as a function, to return a fresh axis for each plot."""
         self._x_axis_fn = x_axis
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if not isinstance(widget, pg.PlotWidget):
-                continue
-            widget.setAxisItems({"bottom": self._x_axis_fn()})
+        for plot_item in self._plot_items_ordered():
+            plot_item.setAxisItems({"bottom": self._x_axis_fn()})
         self._update_plots_x_axis()
 
     def _update_plot_item_data_items(self) -> None:
-        """Called when the plot item data items change, to update the plot items state and the reverse mapping dict."""
+        """Called when the plot item data items change, to update the plot items state and the reverse mapping dict.
+        Plot items reconcile their data items as a diff, and data items new to a plot item (eg, moved from another
+        plot item) are populated from the already-transformed data, without re-running transforms."""
+        prev_data_name_to_plot_item = self._data_name_to_plot_item
         self._data_name_to_plot_item = {}
         for plot_item, data_names in self._plot_item_data.items():
             for name in data_names:
                 self._data_name_to_plot_item[name] = plot_item
+        displayed_data_names = self._displayed_data_names()
+        for plot_item, data_names in self._plot_item_data.items():
             plot_item.set_data_items(
                 {data_name: self._data_items.get(data_name, (QColor("black"), None))[0] for data_name in data_names}
             )
+            added_data = {
+                name: self._data[name]
+                for name in data_names
+                if prev_data_name_to_plot_item.get(name) is not plot_item
+                and name in displayed_data_names
+                and name in self._data
+            }
+            if added_data:
+                plot_item.update_data(added_data)
 
     def _create_plot_item(self, plot_type: "MultiPlotWidget.PlotType") -> DataPlotItem:
         """Given a PlotType, creates the PlotItem and returns it. Override to change the instantiated PlotItem type."""
@@ -232,33 +316,79 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
             return InteractivePlot(**plot_args)
         elif plot_type == self.PlotType.ENUM_WAVEFORM:
             return EnumWaveformInteractivePlot(**plot_args)
+        elif plot_type == self.PlotType.DIGITAL_BUS:
+            return DigitalBusInteractivePlot(**plot_args)
         else:
             raise ValueError(f"unknown plot_type {plot_type}")
 
     def _init_plot_item(self, plot_item: DataPlotItem) -> DataPlotItem:
         """Called after _create_plot_item, does any post-creation init. Returns the same plot_item.
         Optionally override this with a super() call."""
+        plot_item.set_range_batcher(self._on_plot_range_changed)
         return plot_item
 
+    def _on_plot_range_changed(self, plot_item: DataPlotItem) -> None:
+        """Batches range-dependent work of plots, since a pan of one plot changes the range of all linked plots."""
+        self._range_settle_plot_items[plot_item] = None
+        if not self._range_settle_timer.isActive():
+            self._range_settle_timer.start(0)
+
+    def _settle_plot_ranges(self) -> None:
+        plot_items, self._range_settle_plot_items = self._range_settle_plot_items, {}
+        for plot_item in plot_items:
+            if plot_item in self._plot_item_data:  # ignore removed plots
+                plot_item._settle_view_range()
+
+    def _plot_items_ordered(self) -> List[DataPlotItem]:
+        """Returns the plot items in the layout, in display (top to bottom) order.
+        This may include plots that have been removed (with _remove_plot_item) but not yet deleted.
+        Optionally override this, with _add_plot_item, _remove_plot_item and _plot_item_geometry, to change how
+        plots are laid out. By default, each plot item is in its own PlotWidget in the splitter."""
+        plot_items = []
+        for i in range(self.count()):
+            widget = self.widget(i)
+            if isinstance(widget, pg.PlotWidget):
+                plot_items.append(widget.getPlotItem())
+        return plot_items
+
+    def _add_plot_item(self, plot_item: DataPlotItem, index: Optional[int] = None) -> None:
+        """Adds a plot item to the layout, at index in _plot_items_ordered, or at the end if None."""
+        plot_widget = pg.PlotWidget(plotItem=plot_item)
+        if index is None:
+            self.addWidget(plot_widget)
+        else:
+            self.insertWidget(index, plot_widget)
+
+    def _remove_plot_item(self, plot_item: DataPlotItem) -> None:
+        """Removes a plot item from the layout and deletes it."""
+        for i in range(self.count()):
+            widget = self.widget(i)
+            if isinstance(widget, pg.PlotWidget) and widget.getPlotItem() is plot_item:
+                widget.deleteLater()
+
+    def _plot_item_geometry(self, plot_item: DataPlotItem) -> Tuple[QWidget, QRect]:
+        """Returns the widget displaying a plot item and the plot's rect in that widget's coordinates."""
+        for i in range(self.count()):
+            widget = self.widget(i)
+            if isinstance(widget, pg.PlotWidget) and widget.getPlotItem() is plot_item:
+                return widget, widget.rect()
+        raise ValueError("plot item not in layout")
+
     def _clean_plot_widgets(self) -> None:
         """Called when plot items potentially have been emptied / deleted, to clean things up"""
         new_anchor_plot_item: Optional[pg.PlotItem] = self._anchor_x_plot_item  # temporarily Optional
-        for i in range(self.count()):
-            widget = self.widget(i)
-            if not isinstance(widget, pg.PlotWidget):
-                continue
-            if widget.getPlotItem() not in self._plot_item_data or not len(self._plot_item_data[widget.getPlotItem()]):
-                if widget.getPlotItem() is self._anchor_x_plot_item:  # about to delete the x-axis anchor
+        for plot_item in self._plot_items_ordered():
+            if plot_item not in self._plot_item_data or not len(self._plot_item_data[plot_item]):
+                if plot_item is self._anchor_x_plot_item:  # about to delete the x-axis anchor
                     new_anchor_plot_item = None
-                if widget.getPlotItem() in self._plot_item_data:
-                    del self._plot_item_data[widget.getPlotItem()]
-                widget.deleteLater()
+                if plot_item in self._plot_item_data:
+                    del self._plot_item_data[plot_item]
+                self._remove_plot_item(plot_item)
 
         if new_anchor_plot_item is None:  # select a new x-axis anchor and re-link
             if not self._plot_item_data:  # create a default placeholder, if needed
                 plot_item = self._init_plot_item(self._create_plot_item(self.PlotType.DEFAULT))
-                plot_widget = pg.PlotWidget(plotItem=plot_item)
-                self.addWidget(plot_widget)
+                self._add_plot_item(plot_item)
                 self._plot_item_data[plot_item] = []
 
             for plot_item, _ in self._plot_item_data.items():
@@ -273,14 +403,12 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
     def _update_plots_x_axis(self) -> None:
         """Updates plots so only last plot's x axis labels and ticks are visible"""
         is_first = True
-        for i in reversed(range(self.count())):
-            widget = self.widget(i)
-            if not isinstance(widget, pg.PlotWidget):
-                continue
-            plot_item = widget.getPlotItem()
+        for plot_item in reversed(self._plot_items_ordered()):
             if plot_item not in self._plot_item_data:  # ignores removed (deleteLater'd) plots
                 continue
             bottom_axis = cast(pg.AxisItem, plot_item.getAxis("bottom"))
+            if isinstance(bottom_axis, TimeAxisItem):
+                bottom_axis.set_origin(self._x_origin)
             bottom_axis.setStyle(showValues=is_first)
             bottom_axis.showLabel(is_first)
             if isinstance(plot_item, RegionPlot):  # TODO should this be part of a different mixin?
@@ -297,7 +425,6 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
         self._clean_plot_widgets()
         self._update_plots_x_axis()
         self._update_plot_item_data_items()
-        self._update_plots()
 
     def show_data_items(
         self, new_data_items: List[Tuple[str, QColor, "MultiPlotWidget.PlotType"]], *, no_create: bool = False
@@ -319,14 +446,13 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
                     continue
                 add_plot_item: Optional[pg.PlotItem] = None
 
-                if self._new_data_action == self.NewDataAction.MERGE_LAST and plot_type != self.PlotType.ENUM_WAVEFORM:
+                if self._new_data_action == self.NewDataAction.MERGE_LAST and plot_type not in (
+                    self.PlotType.ENUM_WAVEFORM,
+                    self.PlotType.DIGITAL_BUS,
+                ):
                     # if merging plots, try to get the plot to merge into
-                    for i in reversed(range(self.count())):
-                        widget = self.widget(i)
-                        if not isinstance(widget, pg.PlotWidget):
-                            continue
-                        test_plot_item = widget.getPlotItem()
-                        if isinstance(test_plot_item, EnumWaveformInteractivePlot):  # skip enum plots, can't merge
+                    for test_plot_item in reversed(self._plot_items_ordered()):
+                        if isinstance(test_plot_item, (EnumWaveformPlot, DigitalBusPlot)):  # single item, can't merge
                             continue
                         if test_plot_item not in self._plot_item_data:  # ignore removed (deleteLater'd) plots
                             continue
@@ -339,8 +465,7 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
                         add_plot_item.setXLink(self._anchor_x_plot_item)
                     else:
                         self._anchor_x_plot_item = add_plot_item
-                    plot_widget = pg.PlotWidget(plotItem=add_plot_item)
-                    self.addWidget(plot_widget)
+                    self._add_plot_item(add_plot_item)
 
                 self._plot_item_data.setdefault(add_plot_item, []).append(data_name)
 
@@ -354,34 +479,220 @@ class MultiPlotWidget(HasSaveLoadDataConfig, QSplitter):
     def _to_array(self, x: npt.ArrayLike, dtype: Optional[npt.DTypeLike] = None) -> npt.NDArray[Any]:
         if isinstance(x, np.ndarray) and x.flags.writeable == False:
             return x
+        elif isinstance(x, (pd.Categorical, pd.Series)) and isinstance(x.dtype, pd.CategoricalDtype):
+            return CategoricalCodes.from_categorical(x)  # keeps the codes, for enum plots
         else:
             arr = np.array(x, dtype=dtype)
             arr.flags.writeable = False
             return arr
 
+    def _value_dtype(self, data_name: str) -> Optional[np.dtype[Any]]:
+        """Returns the dtype values of data_name are stored in, or None to keep the dtype values are provided in.
+        Optionally override this to set a storage policy, see ValueDtypePlotWidget."""
+        return None
+
+    def _to_value_array(self, data_name: str, ys: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Converts ys to a read-only array in the value dtype of data_name, if the values are representable in it
+        (see cast_values), otherwise keeping the provided dtype. Digital bus words (see DigitalBus) are not values,
+        and keep their dtype. Casts are cached by identity, so data set repeatedly (eg, on a refresh) is cast once."""
+        ys_arr = self._to_array(ys)
+        dtype = self._value_dtype(data_name)
+        if dtype is None or ys_arr.dtype == dtype or DigitalBus.line_names(ys_arr) is not None:
+            return ys_arr
+        cached = self._value_dtype_cache.get(ys_arr, dtype, [])
+        if cached is not None:
+            return cached
+        cast_ys = cast_values(ys_arr, dtype)
+        if cast_ys is None:  # not representable, keep as-is
+            cast_ys = ys_arr
+        cast_ys.flags.writeable = False
+        DerivedData.register_values(ys_arr, cast_ys)  # casts keep missing samples as NaN
+        self._value_dtype_cache.set(ys_arr, dtype, [], cast_ys)
+        return cast_ys
+
+    def _to_plot_xs(self, xs: npt.ArrayLike, cache: bool = True) -> npt.NDArray[np.float64]:
+        """Converts xs to a read-only float64 array in plot space.
+        datetime64 xs (eg, int64 nanosecond timestamps as datetime64[ns]) are converted to float seconds relative to
+        the x origin (set from the first datetime64 data), keeping sub-nanosecond resolution where float epoch seconds
+        would only have sub-microsecond resolution. Conversions are cached by identity, so time arrays shared between
+        data items are converted once."""
+        xs_arr = np.asarray(xs)
+        if not np.issubdtype(xs_arr.dtype, np.datetime64):
+            return self._to_array(xs, dtype=np.float64)
+
+        if self._x_origin is None:
+            valid_xs = xs_arr[~np.isnat(xs_arr)]
+            if not len(valid_xs):
+                return self._to_array(np.full(len(xs_arr), np.nan))
+            self._x_origin = np.min(valid_xs).astype("datetime64[s]")  # truncate to whole seconds for readability
+            if self._x_axis_fn is None:  # default to a time axis for timestamps
+                self.set_x_axis(lambda: TimeAxisItem(orientation="bottom"))
+            else:
+                self._update_plots_x_axis()
+        cacheable = cache and not xs_arr.flags.writeable
+        if cacheable:
+            cached = self._x_origin_cache.get(xs_arr, self._x_origin, [])
+            if cached is not None:
+                return cached
+        origin_ns = self._x_origin.astype("datetime64[ns]").astype(np.int64)
+        # integer subtraction is exact, so the only rounding is of the (small) relative offset to float
+        plot_xs: npt.NDArray[np.float64] = (
+            xs_arr.astype("datetime64[ns]", copy=False).view(np.int64) - origin_ns
+        ) / 1e9
+        plot_xs[np.isnat(xs_arr)] = np.nan
+        plot_xs.flags.writeable = False
+        if cacheable:
+            self._x_origin_cache.set(xs_arr, self._x_origin, [], plot_xs)
+        return plot_xs
+
+    def _reset_x_origin(self) -> None:
+        """Clears the x origin, eg for a new dataset, including on time axes, which otherwise keep the previous
+        origin until the next datetime64 data sets a new one."""
+        self._x_origin = None
+        for plot_item in self._plot_item_data:
+            bottom_axis = plot_item.getAxis("bottom")
+            if isinstance(bottom_axis, TimeAxisItem):
+                bottom_axis.set_origin(None)
+
     T = TypeVar("T", bound=np.generic)
 
     def _transform_data(
-        self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]
+        self,
+        data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]],
+        data_names: Optional[Collection[str]] = None,
     ) -> Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]:
         """Optional function to transform data between the input of set_data and when it is plotted.
-        Data is guaranteed to be a numpy array"""
+        Data is guaranteed to be a numpy array.
+        If data_names is not None, only those data items are dirty, and results for other data items may be reused
+        from the previous call."""
         return data
 
+    def _dirty_data_names(self, data_names: Collection[str]) -> Set[str]:
+        """Returns the data names to be re-processed when data_names change, including data derived from them.
+        Optionally override this to add dependencies, with a super() call."""
+        return set(data_names)
+
     def set_data(self, data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]]) -> None:
         """Sets the data to be plotted as data name -> (xs, ys). Data names must have been previously set with
-        set_data_items, missing items will log an error."""
+        set_data_items, missing items will log an error.
+        xs may be datetime64 timestamps, see _to_plot_xs."""
+        self._reset_x_origin()  # new dataset, new origin
         self._raw_data = {
-            name: (self._to_array(xs, dtype=np.float64), self._to_array(ys)) for name, (xs, ys) in data.items()
+            name: (self._to_plot_xs(xs), self._to_value_array(name, ys)) for name, (xs, ys) in data.items()
         }
         self._update_plots()
         self.sigDataUpdated.emit()
 
-    def _update_plots(self) -> None:
-        self._data = self._transform_data(self._raw_data)
-        for plot_item, data_names in self._plot_item_data.items():
-            plot_item.set_data(
-                {data_name: self._data.get(data_name, (np.empty(0), np.empty(0))) for data_name in data_names}
+    def ingest_data(self, data: Mapping[str, Tuple[Any, Any]]) -> List[str]:
+        """Sets the data to be plotted as data name -> (xs, ys) like set_data, but takes ownership of the input arrays
+        (which may be ndarrays, pandas Series, or buffer-protocol objects) by marking them read-only instead of
+        copying them, where dtype and contiguity allow. Inputs must not be written to afterwards.
+        Returns the data names where a copy was unavoidable."""
+        self._reset_x_origin()  # new dataset, new origin
+        raw_data = {}
+        copied_names = []
+        for name, (xs, ys) in data.items():
+            xs_arr, xs_copied = ingest_array(xs)
+            if np.issubdtype(xs_arr.dtype, np.datetime64):
+                xs_arr, xs_copied = self._to_plot_xs(xs_arr), True
+            elif xs_arr.dtype != np.float64:
+                xs_arr, xs_copied = ingest_array(xs_arr, np.float64)
+            UniformTimebase.detect(xs_arr)  # for O(1) index lookups, cached for shared xs
+            ys_arr, ys_copied = ingest_array(ys)
+            if xs_copied or ys_copied:
+                copied_names.append(name)
+            raw_data[name] = (xs_arr, self._to_value_array(name, ys_arr))
+        self._raw_data = raw_data
+        self._update_plots()
+        self.sigDataUpdated.emit()
+        return copied_names
+
+    def set_data_frame(self, df: pd.DataFrame, time_column: Optional[str] = None) -> List[str]:
+        """Sets the data to be plotted from a DataFrame of a time column (by default, the first column) and value
+        columns named by data name, with missing values dropped. Takes ownership of the column memory per
+        ingest_data, with all columns sharing one time array.
+        Returns the column names (including the time column) where a copy was unavoidable."""
+        data, copied_names = ingest_data_frame(df, time_column)
+        self.ingest_data(data)  # already ingested, no further copies
+        return copied_names
+
+    def append_data(self, data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]]) -> None:
+        """Appends data as data name -> (new xs, new ys) to the end of the existing data, eg for live acquisition.
+        New xs must not be before the last existing xs. Data names without existing data are created.
+        Arrays are extended in place where possible (amortized O(1) per point), and downstream processing
+        (transforms, timeshift, stats, rendering) only processes the appended data where possible.
+        Emits sigDataAppended instead of sigDataUpdated."""
+        # keep the previous arrays alive until consumers are done, so cached results on them can be extended
+        prev_raw_data, prev_data = self._raw_data, self._data
+        raw_data = dict(self._raw_data)
+        for name, (new_xs, new_ys) in data.items():
+            prev = raw_data.get(name, None)
+            new_xs_arr = self._to_plot_xs(new_xs, cache=False)
+            if prev is not None and DigitalBus.line_names(prev[1]) is not None:  # words, not values, keep their dtype
+                new_ys_arr = self._to_array(new_ys)
+            else:
+                new_ys_arr = self._to_value_array(name, new_ys)
+            if prev is not None and RunLengthEncoding.is_run_length(prev[1]):  # only store the transitions
+                new_xs_arr, new_ys_arr = RunLengthEncoding.encode_appended(prev[1], new_xs_arr, new_ys_arr)
+            raw_data[name] = self._append_raw_data(name, prev, new_xs_arr, new_ys_arr)
+        self._raw_data = raw_data
+        self._update_plots(data.keys())
+        self.sigDataAppended.emit(list(data.keys()))
+        del prev_raw_data, prev_data
+
+    def _append_raw_data(
+        self,
+        data_name: str,
+        prev_data: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]],
+        new_xs: npt.NDArray[np.float64],
+        new_ys: npt.NDArray[Any],
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+        """Returns the raw (xs, ys) of a data item (with previous raw data, if any) after appending new_xs, new_ys.
+        Optionally override this to change how appended data is stored."""
+        prev_xs, prev_ys = prev_data if prev_data is not None else (None, None)
+        xs = AppendableArray.extend(prev_xs, new_xs)
+        ys = AppendableArray.extend(prev_ys, new_ys)
+        DerivedData.register_appended(prev_xs, prev_ys, xs, ys)  # eg, run-length encoded data still holds its values
+        return xs, ys
+
+    def _displayed_data_names(self) -> Set[str]:
+        """Returns the data names currently displayed in plots. Only these have their (transformed) data requested
+        by the plots, so other data items are not processed unless requested elsewhere (eg, XY plots or exports).
+        Optionally override this to exclude data items, with a super() call."""
+        return set(self._data_name_to_plot_item.keys())
+
+    def _update_plots(self, data_names: Optional[Collection[str]] = None) -> None:
+        """Runs the data through _transform_data and updates the plots.
+        If data_names is not None, only those data items (and data derived from them) are re-processed and updated,
+        and plots without those data items are left untouched."""
+        displayed_data_names = self._displayed_data_names()
+        if data_names is None:
+            self._data = self._transform_data(self._raw_data)
+            for plot_item, plot_data_names in self._plot_item_data.items():
+                plot_item.set_data(
+                    {
+                        data_name: self._data.get(data_name, (np.empty(0), np.empty(0)))
+                        for data_name in plot_data_names
+                        if data_name in displayed_data_names
+                    }
+                )
+            return
+
+        dirty_data_names = self._dirty_data_names(data_names)
+        self._data = self._transform_data(self._raw_data, dirty_data_names)
+        for plot_item, plot_data_names in self._plot_item_data.items():
+            dirty_plot_data_names = [
+                data_name
+                for data_name in plot_data_names
+                if data_name in dirty_data_names and data_name in displayed_data_names
+            ]
+            if not dirty_plot_data_names:
+                continue
+            plot_item.update_data(
+                {
+                    data_name: self._data.get(data_name, (np.empty(0), np.empty(0)))
+                    for data_name in dirty_plot_data_names
+                }
             )
 
     def autorange(self, enable: bool) -> None:
@@ -400,7 +711,14 @@ class LinkedMultiPlotStateModel(BaseTopModel):
 
 
 class LinkedMultiPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
-    """Mixin into the MultiPlotWidget that links PointsOfInterestPlot, RegionPlot, and LiveCursorPlot"""
+    """Mixin into the MultiPlotWidget that links PointsOfInterestPlot, RegionPlot, and LiveCursorPlot.
+    Hover cursor changes are propagated to the other plots in one batch per event loop iteration, with the latest
+    change winning."""
+
+    class HoverMetrics(NamedTuple):
+        received: int  # hover events received, over all current plots
+        processed: int  # coalesced hover updates run, over all current plots
+        propagated: int  # batched hover cursor propagations to all plots
 
     _MODEL_BASES = [LinkedMultiPlotStateModel]
 
@@ -411,6 +729,22 @@ class LinkedMultiPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
         self._last_drag_cursor: Optional[float] = None
         super().__init__(*args, **kwargs)
 
+        self._pending_hover: Optional[Tuple[Optional[pg.PlotItem], Optional[float]]] = None  # (source, position)
+        self._hover_propagated = 0
+        self._hover_propagate_timer = QTimer(self)
+        self._hover_propagate_timer.setSingleShot(True)
+        self._hover_propagate_timer.timeout.connect(self._propagate_hover_cursor)
+
+    def hover_metrics(self) -> "LinkedMultiPlotWidget.HoverMetrics":
+        plot_metrics = [
+            plot_item.hover_metrics() for plot_item in self._plot_item_data if isinstance(plot_item, SnappableHoverPlot)
+        ]
+        return self.HoverMetrics(
+            sum(metrics.received for metrics in plot_metrics),
+            sum(metrics.processed for metrics in plot_metrics),
+            self._hover_propagated,
+        )
+
     def _write_model(self, model: BaseModel) -> None:
         super()._write_model(model)
         assert isinstance(model, LinkedMultiPlotStateModel)
@@ -448,7 +782,17 @@ class LinkedMultiPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
         return plot_item
 
     def _on_hover_cursor_change(self, sig_plot_item: Optional[pg.PlotItem], position: Optional[float]) -> None:
-        """Propagates cursor change to all plots, excluding signal source sig_plot_item if specified."""
+        """Schedules propagating the cursor change to all plots, excluding signal source sig_plot_item if specified.
+        Changes before the propagation runs are superseded."""
+        self._pending_hover = (sig_plot_item, position)
+        if not self._hover_propagate_timer.isActive():
+            self._hover_propagate_timer.start(0)
+
+    def _propagate_hover_cursor(self) -> None:
+        if self._pending_hover is None:
+            return
+        (sig_plot_item, position), self._pending_hover = self._pending_hover, None
+        self._hover_propagated += 1
         for plot_item, _ in self._plot_item_data.items():
             if plot_item is not sig_plot_item and isinstance(plot_item, LiveCursorPlot):
                 with QSignalBlocker(plot_item):
@@ -534,11 +878,11 @@ class DroppableMultiPlotWidget(MultiPlotWidget):
 
         created_data_names = []  # list of data names that were successfully created / moved
         if not insert:  # merge mode
-            target_plot_widget = self.widget(target_plot_index)
-            if not isinstance(target_plot_widget, pg.PlotWidget):
+            plot_items = self._plot_items_ordered()
+            if not 0 <= target_plot_index < len(plot_items):
                 return
-            target_plot_item = target_plot_widget.getPlotItem()
-            if isinstance(target_plot_item, EnumWaveformPlot):  # can't merge into enum plots
+            target_plot_item = plot_items[target_plot_index]
+            if isinstance(target_plot_item, (EnumWaveformPlot, DigitalBusPlot)):  # can't merge into single-item plots
                 return
             for source_data_name in source_data_names:
                 if len(self._plot_item_data[target_plot_item]) > 0:  # check for merge-ability, for nonempty plots
@@ -555,13 +899,12 @@ class DroppableMultiPlotWidget(MultiPlotWidget):
                 plot_item.setXLink(self._anchor_x_plot_item)
             else:
                 self._anchor_x_plot_item = plot_item
-            plot_widget = pg.PlotWidget(plotItem=plot_item)
-            self.insertWidget(target_plot_index, plot_widget)
+            self._add_plot_item(plot_item, target_plot_index)
 
             self._plot_item_data[plot_item] = [source_data_names[0]]
             created_data_names.append(source_data_names[0])
 
-            if isinstance(plot_item, EnumWaveformPlot):  # only one data item
+            if isinstance(plot_item, (EnumWaveformPlot, DigitalBusPlot)):  # only one data item
                 pass
             else:  # append all compatible
                 for source_data_name in source_data_names[1:]:
@@ -581,7 +924,6 @@ class DroppableMultiPlotWidget(MultiPlotWidget):
                     self._update_plots_x_axis()
 
         self._update_plot_item_data_items()
-        self._update_plots()
 
     def dragEnterEvent(self, event: QDragMoveEvent) -> None:
         from .signals_table import DraggableSignalsTable
@@ -595,50 +937,52 @@ class DroppableMultiPlotWidget(MultiPlotWidget):
             drag_overlay.deleteLater()
         self._drag_overlays = []
 
+    def _add_drag_overlay(self, widget: QWidget, rect: QRect) -> None:
+        overlay = DragTargetOverlay(widget)
+        overlay.setGeometry(rect)
+        overlay.setVisible(True)
+        self._drag_overlays.append(overlay)
+
     def dragMoveEvent(self, event: QDragMoveEvent) -> None:
         self._clear_drag_overlays()
         self._drag_target = None
 
-        last_plot_index_widget: Optional[Tuple[int, pg.PlotWidget]] = None
-        for i in range(self.count()):  # test y positions including between plots
-            target_widget = self.widget(i)
-            if not isinstance(target_widget, pg.PlotWidget):
-                continue
-            target_top_left = target_widget.mapToParent(QPoint(0, 0))
-            target_bot_right = target_widget.mapToParent(QPoint(0, target_widget.size().height()))
-
-            if event.pos().y() < target_top_left.y() + self.DRAG_INSERT_TARGET_SIZE:  # was part of above plot
-                if last_plot_index_widget is not None:  # has a widget above
-                    top_overlay = DragTargetOverlay(last_plot_index_widget[1])
-                    top_overlay.move(QPoint(0, target_widget.height() - self.DRAG_INSERT_TARGET_SIZE))
-                    top_overlay.resize(QSize(target_widget.width(), self.DRAG_INSERT_TARGET_SIZE))
-                    top_overlay.setVisible(True)
-                    self._drag_overlays.append(top_overlay)
-                this_overlay = DragTargetOverlay(target_widget)
-                this_overlay.resize(QSize(target_widget.width(), self.DRAG_INSERT_TARGET_SIZE))
-                this_overlay.setVisible(True)
-                self._drag_overlays.append(this_overlay)
+        last_plot_geometry: Optional[Tuple[int, QWidget, QRect]] = None  # index, widget, rect of the above plot
+        for i, plot_item in enumerate(self._plot_items_ordered()):  # test y positions including between plots
+            target_widget, target_rect = self._plot_item_geometry(plot_item)
+            pos = target_widget.mapFrom(self, event.pos())
+
+            if pos.y() < target_rect.top() + self.DRAG_INSERT_TARGET_SIZE:  # was part of above plot
+                if last_plot_geometry is not None:  # has a widget above
+                    _, above_widget, above_rect = last_plot_geometry
+                    self._add_drag_overlay(above_widget, self._bottom_drag_rect(above_rect))
+                self._add_drag_overlay(
+                    target_widget,
+                    QRect(target_rect.left(), target_rect.top(), target_rect.width(), self.DRAG_INSERT_TARGET_SIZE),
+                )
                 self._drag_target = (i, True)
                 event.accept()
                 return
-            elif event.pos().y() <= target_bot_right.y() - self.DRAG_INSERT_TARGET_SIZE:  # in this current plot
-                self._drag_overlays = [DragTargetOverlay(target_widget)]
-                self._drag_overlays[0].resize(target_widget.size())
-                self._drag_overlays[0].setVisible(True)
+            elif pos.y() <= target_rect.bottom() - self.DRAG_INSERT_TARGET_SIZE:  # in this current plot
+                self._add_drag_overlay(target_widget, target_rect)
                 self._drag_target = (i, False)
                 event.accept()
                 return
 
-            last_plot_index_widget = i, target_widget
+            last_plot_geometry = i, target_widget, target_rect
 
-        if last_plot_index_widget is not None:  # reached the end, append after last plot
-            self._drag_overlays = [DragTargetOverlay(last_plot_index_widget[1])]
-            self._drag_overlays[0].move(QPoint(0, last_plot_index_widget[1].height() - self.DRAG_INSERT_TARGET_SIZE))
-            self._drag_overlays[0].resize(QSize(last_plot_index_widget[1].width(), self.DRAG_INSERT_TARGET_SIZE))
-            self._drag_overlays[0].setVisible(True)
-            self._drag_target = (last_plot_index_widget[0] + 1, True)
+        if last_plot_geometry is not None:  # reached the end, append after last plot
+            last_index, last_widget, last_rect = last_plot_geometry
+            self._add_drag_overlay(last_widget, self._bottom_drag_rect(last_rect))
+            self._drag_target = (last_index + 1, True)
             event.accept()
 
+    def _bottom_drag_rect(self, rect: QRect) -> QRect:
+        """Returns the insertion drag target at the bottom of a plot rect"""
+        return QRect(
+            rect.left(), rect.bottom() + 1 - self.DRAG_INSERT_TARGET_SIZE, rect.width(), self.DRAG_INSERT_TARGET_SIZE
+        )
+
     def dragLeaveEvent(self, event: QDragLeaveEvent) -> None:
         self._clear_drag_overlays()
 
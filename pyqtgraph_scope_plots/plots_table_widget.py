@@ -22,7 +22,7 @@ from PySide6.QtGui import QColor, Qt
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QSplitter, QFileDialog
 from pydantic import BaseModel
 
-from .util import HasSaveLoadDataConfig
+from .util import GapIndex, HasSaveLoadDataConfig, RunLengthEncoding, UpdateScheduler
 from .multi_plot_widget import (
     MultiPlotWidget,
     DroppableMultiPlotWidget,
@@ -58,6 +58,7 @@ class PlotsTableWidget(QSplitter, HasSaveLoadDataConfig):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
 
+        self._update_scheduler: Optional[UpdateScheduler] = None  # if set, updates are coalesced
         self._controls = self._make_controls()
         self._plots = self._make_plots()
         self._table = self._make_table()
@@ -89,6 +90,7 @@ class PlotsTableWidget(QSplitter, HasSaveLoadDataConfig):
         return bases
 
     def _write_model(self, model: BaseModel) -> None:
+        self._flush_updates()
         super()._write_model(model)
         self._plots._write_model(model)
         if isinstance(self._table, HasSaveLoadDataConfig):
@@ -100,9 +102,45 @@ class PlotsTableWidget(QSplitter, HasSaveLoadDataConfig):
         if isinstance(self._table, HasSaveLoadDataConfig):
             self._table._load_model(model)
 
+    def set_update_rate(self, rate_hz: Optional[float]) -> None:
+        """If rate_hz is not None, coalesces _set_data_items, _set_data, and _append_data into at most rate_hz
+        updates per second, so producers can push data faster than the plots can refresh (and from any thread).
+        If None, updates are applied immediately, which is the default."""
+        if rate_hz is None:
+            if self._update_scheduler is not None:
+                self._update_scheduler.flush()
+                self._update_scheduler.deleteLater()
+                self._update_scheduler = None
+        elif self._update_scheduler is None:
+            self._update_scheduler = UpdateScheduler(
+                self._update_data_items, self._plots.set_data, self._plots.append_data, rate_hz, self
+            )
+        else:
+            self._update_scheduler.set_rate(rate_hz)
+
+    def update_metrics(self) -> Optional[UpdateScheduler.Metrics]:
+        """Returns metrics on coalesced updates, if set_update_rate is enabled."""
+        if self._update_scheduler is None:
+            return None
+        return self._update_scheduler.metrics()
+
+    def _flush_updates(self) -> None:
+        """Applies any pending coalesced updates, eg before reading the current data."""
+        if self._update_scheduler is not None:
+            self._update_scheduler.flush()
+
     def _set_data_items(
         self,
         new_data_items: List[Tuple[str, QColor, "MultiPlotWidget.PlotType"]],
+    ) -> None:
+        if self._update_scheduler is not None:
+            self._update_scheduler.set_data_items(new_data_items)
+        else:
+            self._update_data_items(new_data_items)
+
+    def _update_data_items(
+        self,
+        new_data_items: List[Tuple[str, QColor, "MultiPlotWidget.PlotType"]],
     ) -> None:
         self._plots.show_data_items(new_data_items, no_create=len(new_data_items) > 8)
 
@@ -110,14 +148,31 @@ class PlotsTableWidget(QSplitter, HasSaveLoadDataConfig):
         self,
         data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]],
     ) -> None:
-        self._plots.set_data(data)
+        if self._update_scheduler is not None:
+            self._update_scheduler.set_data(data)
+        else:
+            self._plots.set_data(data)
+
+    def _append_data(
+        self,
+        data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]],
+    ) -> None:
+        if self._update_scheduler is not None:
+            self._update_scheduler.append_data(data)
+        else:
+            self._plots.append_data(data)
 
     def _write_csv(self, fileio: Union[TextIO, StringIO]) -> None:
+        self._flush_updates()
         writer = csv.writer(fileio)
         writer.writerow(["# time"] + [name for name, _ in self._plots._data.items()])
 
+        x_origin = self._plots._x_origin
+        x_origin_s = None if x_origin is None else int(x_origin.astype("datetime64[s]").astype(np.int64))
         indices = [0] * len(self._plots._data.items())  # indices to examine on current iteration, in self._data order
         ordered_data_items = list(self._plots._data.values())
+        run_lengths = [RunLengthEncoding.is_run_length(ys) for _, ys in ordered_data_items]
+        all_gaps = [GapIndex.of(xs, ys) for xs, ys in ordered_data_items]  # missing samples are written empty
         while True:  # iterate each row
             xs_at_index = [
                 ordered_data_items[data_index][0][point_index]
@@ -127,16 +182,30 @@ class PlotsTableWidget(QSplitter, HasSaveLoadDataConfig):
             if not len(xs_at_index):  # indices overran all lists, we're done
                 break
             min_x = min(xs_at_index)
-            this_row = [str(min_x)]
+            this_row = [self._x_str(min_x, x_origin_s)]
             for i, (xs, ys) in enumerate(ordered_data_items):
                 if indices[i] < len(xs) and xs[indices[i]] == min_x:
-                    this_row.append(str(ys[indices[i]]))
+                    gaps = all_gaps[i]
+                    this_row.append("" if gaps is not None and gaps.is_missing(indices[i]) else str(ys[indices[i]]))
                     indices[i] += 1
+                elif run_lengths[i] and 0 < indices[i] < len(xs):  # value held from the previous sample
+                    this_row.append(str(ys[indices[i] - 1]))
                 else:
                     this_row.append("")
 
             writer.writerow(this_row)
 
+    @staticmethod
+    def _x_str(x: float, x_origin_s: Optional[int]) -> str:
+        """Returns x as written to CSV. xs relative to an origin (for datetime64 data) are written as epoch seconds
+        with fixed nanosecond decimals, adding the offset to the integer origin to keep nanosecond resolution."""
+        if x_origin_s is None or not np.isfinite(x):
+            return str(x)
+        total_ns = x_origin_s * 1_000_000_000 + round(x * 1e9)
+        sign = "-" if total_ns < 0 else ""
+        seconds, ns = divmod(abs(total_ns), 1_000_000_000)
+        return f"{sign}{seconds}.{ns:09d}"
+
     def _save_csv_dialog(self) -> None:
         """Utility function to open a dialog to export the current data to a CSV with a shared x-axis column."""
         filename, filter = QFileDialog.getSaveFileName(self, f"Save Data", "", "CSV (*.csv)")
@@ -16,18 +16,18 @@
 Mixin for PlotItem that draws points at each data point when zoomed in enough.
 """
 
-import bisect
 from abc import abstractmethod
-from typing import Dict, List, Optional, Any, Tuple, Mapping
+from typing import Dict, List, Optional, Any, Tuple, Mapping, Collection
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import QPointF, QTimer
+from PySide6.QtCore import QPointF
 from PySide6.QtGui import QColor
 from numpy import typing as npt
 
 from .enum_waveform_plotitem import EnumWaveformPlot
 from .interactivity_mixins import DataPlotCurveItem, DataPlotItem
+from .util import UniformTimebase
 
 
 class BasePointOnZoomPlot(DataPlotItem):
@@ -42,39 +42,27 @@ class BasePointOnZoomPlot(DataPlotItem):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        # range update may be called before mapFromView produces updated results, so defer the update
-        self._pending_range_update = False
-        self._range_update_timer = QTimer(self)
-        self._range_update_timer.setSingleShot(True)
-        self._range_update_timer.timeout.connect(self._do_range_update)
-        self.getViewBox().sigRangeChanged.connect(self._on_range_changed)
 
     @abstractmethod
-    def _update_points(self) -> None:
-        """Update point visibility based on current zoom.
+    def _update_points(self, data_names: Optional[Collection[str]] = None) -> None:
+        """Update point visibility based on current zoom, for the specified data names or all if None.
         This may be called in response to new data or changed zoom."""
         raise NotImplementedError
 
-    def set_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
-        super().set_data(data)
-        self._update_points()
-
-    def _on_range_changed(self) -> None:
-        if self._pending_range_update:
-            return
-        self._pending_range_update = True
-        self._range_update_timer.start(0)
+    def _render_data(self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]) -> None:
+        super()._render_data(data)
+        self._update_points(data.keys())
 
-    def _do_range_update(self) -> None:
-        self._pending_range_update = False
+    def _on_view_range_settled(self) -> None:
+        super()._on_view_range_settled()
         self._update_points()
 
     def _calculate_visible_indices(self, xs: npt.NDArray[np.float64]) -> Optional[Tuple[int, int]]:
         """Calculate start and end indices of points to show, if zoomed in enough"""
         viewbox = self.getViewBox()
         view_x_range = viewbox.viewRange()[0]
-        start_idx = bisect.bisect_left(xs, view_x_range[0])
-        end_idx = bisect.bisect_right(xs, view_x_range[1])
+        start_idx = UniformTimebase.bisect_left(xs, view_x_range[0])
+        end_idx = UniformTimebase.bisect_right(xs, view_x_range[1])
 
         if start_idx >= end_idx:
             return None
@@ -113,7 +101,6 @@ class PointOnZoomPlot(DataPlotCurveItem, BasePointOnZoomPlot):
     def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
         parent_graphics = super()._generate_plot_items(data_items)
 
-        self._point_scatters.clear()
         for name, color in data_items.items():
             scatter = pg.ScatterPlotItem(
                 x=[],
@@ -128,8 +115,15 @@ class PointOnZoomPlot(DataPlotCurveItem, BasePointOnZoomPlot):
 
         return parent_graphics
 
-    def _update_points(self) -> None:
+    def _remove_plot_items(self, names: List[str]) -> None:
+        super()._remove_plot_items(names)
+        for name in names:
+            self._point_scatters.pop(name, None)
+
+    def _update_points(self, data_names: Optional[Collection[str]] = None) -> None:
         for name, scatter in self._point_scatters.items():
+            if data_names is not None and name not in data_names:
+                continue
             xs, ys = self._data.get(name, (None, None))
             if xs is None or ys is None:
                 scatter.hide()
@@ -156,7 +150,6 @@ class EnumPointOnZoomPlot(EnumWaveformPlot, BasePointOnZoomPlot):
     def _generate_plot_items(self, data_items: Mapping[str, QColor]) -> Dict[str, List[pg.GraphicsObject]]:
         parent_graphics = super()._generate_plot_items(data_items)
 
-        self._point_scatters.clear()
         for name, color in data_items.items():
             scatter = pg.ScatterPlotItem(
                 x=[],
@@ -171,8 +164,15 @@ class EnumPointOnZoomPlot(EnumWaveformPlot, BasePointOnZoomPlot):
 
         return parent_graphics
 
-    def _update_points(self) -> None:
+    def _remove_plot_items(self, names: List[str]) -> None:
+        super()._remove_plot_items(names)
+        for name in names:
+            self._point_scatters.pop(name, None)
+
+    def _update_points(self, data_names: Optional[Collection[str]] = None) -> None:
         for name, scatter in self._point_scatters.items():
+            if data_names is not None and name not in data_names:
+                continue
             xs, _ = self._data.get(name, (None, None))
             if xs is None:
                 scatter.hide()
@@ -0,0 +1,152 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+
+from .multi_plot_widget import MultiPlotWidget, LinkedMultiPlotWidget
+from .util import (
+    AppendableArray,
+    BaseTopModel,
+    DerivedData,
+    HasSaveLoadDataConfig,
+    UniformTimebase,
+)
+
+
+class RollStateModel(BaseTopModel):
+    roll_samples: Optional[int] = None
+    roll_window: Optional[float] = None
+
+
+class RollingPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
+    """Mixin into the MultiPlotWidget that adds a roll (strip-chart) mode for live data added with append_data.
+    In roll mode, each data item only retains its newest samples (by count and / or by x-window from its newest
+    sample) in a bounded buffer, and the x-range follows the newest sample.
+    With LinkedMultiPlotWidget, points of interest and regions are removed once they scroll out of the data."""
+
+    _MODEL_BASES = [RollStateModel]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._roll_samples: Optional[int] = None
+        self._roll_window: Optional[float] = None
+        self._roll_follow = True
+        # data name -> (xs, ys) storage in roll mode, cleared when data is replaced with set_data
+        self._roll_buffers: Dict[str, Tuple[AppendableArray, AppendableArray]] = {}
+
+    def _write_model(self, model: BaseModel) -> None:
+        super()._write_model(model)
+        assert isinstance(model, RollStateModel)
+        model.roll_samples = self._roll_samples
+        model.roll_window = self._roll_window
+
+    def _load_model(self, model: BaseModel) -> None:
+        super()._load_model(model)
+        assert isinstance(model, RollStateModel)
+        if model.roll_samples is not None or model.roll_window is not None:
+            self.set_roll(model.roll_samples, model.roll_window)
+
+    def roll_enabled(self) -> bool:
+        return self._roll_samples is not None or self._roll_window is not None
+
+    def set_roll(self, samples: Optional[int] = None, window: Optional[float] = None, follow: bool = True) -> None:
+        """Sets roll mode, retaining at most samples per data item and / or samples within window (in x-axis units)
+        of each data item's newest sample. If both are None, roll mode is disabled and all further data is kept.
+        If follow, the x-range tracks the newest sample as data is appended.
+        Existing data is trimmed immediately."""
+        self._roll_samples = samples
+        self._roll_window = window
+        self._roll_follow = follow
+        self._roll_buffers = {}
+        if self.roll_enabled() and self._raw_data:
+            self._raw_data = {
+                name: self._append_raw_data(name, data, np.empty(0), np.empty(0, dtype=data[1].dtype))
+                for name, data in self._raw_data.items()
+            }
+            self._update_plots()
+            self.sigDataUpdated.emit()
+            self._on_rolled()
+
+    def set_data(self, data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]]) -> None:
+        self._roll_buffers = {}
+        super().set_data(data)
+
+    def append_data(self, data: Mapping[str, Tuple[np.typing.ArrayLike, np.typing.ArrayLike]]) -> None:
+        super().append_data(data)
+        if self.roll_enabled():
+            self._on_rolled()
+
+    def _append_raw_data(
+        self,
+        data_name: str,
+        prev_data: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]],
+        new_xs: npt.NDArray[np.float64],
+        new_ys: npt.NDArray[Any],
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+        if not self.roll_enabled():
+            return super()._append_raw_data(data_name, prev_data, new_xs, new_ys)
+
+        buffers = self._roll_buffers.get(data_name, None)
+        if buffers is None:  # first append since set_data or set_roll, copy into a bounded buffer
+            capacity = 2 * (self._roll_samples or 0)  # headroom so compaction is amortized
+            xs_buffer = AppendableArray(np.float64, capacity)
+            ys_buffer = AppendableArray(new_ys.dtype if prev_data is None else prev_data[1].dtype, capacity)
+            if prev_data is not None:  # only copy the previous samples that are retained
+                start = self._roll_start(prev_data[0])
+                xs_buffer.append(prev_data[0][start:])
+                ys_buffer.append(prev_data[1][start:])
+            buffers = self._roll_buffers[data_name] = (xs_buffer, ys_buffer)
+        xs_buffer, ys_buffer = buffers
+
+        xs = xs_buffer.append(new_xs)
+        ys_buffer.append(new_ys)
+        drop = self._roll_start(xs)
+        xs, ys = xs_buffer.drop_front(drop), ys_buffer.drop_front(drop)
+
+        if prev_data is not None:  # registered like appended data in MultiPlotWidget._append_raw_data
+            prev_xs, prev_ys = prev_data
+            dropped = len(prev_xs) + len(new_xs) - len(xs)  # relative to the previous data
+            DerivedData.register_appended(prev_xs, prev_ys, xs, ys, dropped)
+        return xs, ys
+
+    def _roll_start(self, xs: npt.NDArray[np.float64]) -> int:
+        """Returns the index of the first sample of xs retained in roll mode."""
+        start = 0
+        if self._roll_samples is not None:
+            start = max(len(xs) - self._roll_samples, 0)
+        if self._roll_window is not None and len(xs):
+            start = max(start, UniformTimebase.bisect_left(xs, xs[-1] - self._roll_window))
+        return start
+
+    def _on_rolled(self) -> None:
+        """Called after data is trimmed in roll mode, to follow the newest sample and drop stale cursors."""
+        nonempty_xs = [xs for xs, _ in self._raw_data.values() if len(xs)]
+        if not nonempty_xs:
+            return
+        oldest = min(xs[0] for xs in nonempty_xs)
+        newest = max(xs[-1] for xs in nonempty_xs)
+        if self._roll_follow and newest > oldest:
+            start = oldest if self._roll_window is None else max(oldest, newest - self._roll_window)
+            self._anchor_x_plot_item.setXRange(start, newest, padding=0)
+
+        if isinstance(self, LinkedMultiPlotWidget):
+            if any(poi < oldest for poi in self._last_pois):
+                self._on_poi_change(None, [poi for poi in self._last_pois if poi >= oldest])
+            region = self._last_region
+            if isinstance(region, tuple) and max(region) < oldest or isinstance(region, float) and region < oldest:
+                self._on_region_change(None, None)
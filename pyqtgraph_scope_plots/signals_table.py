@@ -12,7 +12,6 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-import bisect
 from typing import Dict, Tuple, List, Any, Optional
 
 import numpy as np
@@ -22,7 +21,7 @@ from PySide6.QtGui import QColor, Qt, QAction, QDrag, QPixmap, QMouseEvent
 from PySide6.QtWidgets import QTableWidgetItem, QHeaderView, QMenu, QLabel
 
 from .multi_plot_widget import MultiPlotWidget, LinkedMultiPlotWidget
-from .util import MixinColsTable, not_none
+from .util import MixinColsTable, not_none, UniformTimebase
 
 
 class SignalsTable(MixinColsTable):
@@ -93,8 +92,8 @@ class HasRegionSignalsTable(SignalsTable):
         ROUNDING_FACTOR = 2e-7
 
         tolerance = (region[1] - region[0]) * ROUNDING_FACTOR
-        low_index = bisect.bisect_left(ts, region[0] - tolerance)  # inclusive
-        high_index = bisect.bisect_right(ts, region[1] + tolerance)  # exclusive
+        low_index = UniformTimebase.bisect_left(ts, region[0] - tolerance)  # inclusive
+        high_index = UniformTimebase.bisect_right(ts, region[1] + tolerance)  # exclusive
         if low_index >= high_index:  # empty set
             return None, None
         else:
@@ -0,0 +1,100 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, List, Optional, Tuple, cast
+
+import pyqtgraph as pg
+from PySide6.QtCore import QEvent, QObject, QRect, QRectF
+from PySide6.QtGui import Qt
+from PySide6.QtWidgets import QGraphicsLinearLayout, QWidget
+
+from .interactivity_mixins import DataPlotItem
+from .multi_plot_widget import MultiPlotWidget
+
+
+class StackedLayoutMultiPlotWidget(MultiPlotWidget):
+    """Mixin into the MultiPlotWidget that hosts all plots stacked in a single GraphicsView scene, instead of each
+    plot in its own PlotWidget (with its own view, scene and paint pass) in the splitter.
+    This scales better with many plots, at the cost of plots not being individually resizable.
+    Left axes are fixed to a common width so the x-axes of all plots line up.
+    Plots are suspended (see DataPlotItem.set_suspended) while the view is hidden or collapsed, or while they are
+    outside the visible part of the scene."""
+
+    LEFT_AXIS_WIDTH = 60  # px
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # created with the first plot, since the splitter must be init'd first
+        self._stacked_view: Optional[pg.GraphicsView] = None
+        self._stacked_layout: Optional[QGraphicsLinearLayout] = None
+        self._stacked_plot_items: List[DataPlotItem] = []  # in layout order
+        super().__init__(*args, **kwargs)
+
+    def _get_stacked_layout(self) -> Tuple[pg.GraphicsView, QGraphicsLinearLayout]:
+        if self._stacked_view is None or self._stacked_layout is None:
+            self._stacked_layout = QGraphicsLinearLayout(Qt.Orientation.Vertical)
+            self._stacked_layout.setContentsMargins(0, 0, 0, 0)
+            self._stacked_layout.setSpacing(0)
+            container = pg.GraphicsWidget()
+            container.setLayout(self._stacked_layout)
+            self._stacked_view = pg.GraphicsView()
+            self._stacked_view.setCentralItem(container)
+            self._stacked_view.installEventFilter(self)  # for suspending plots while not visible
+            self.addWidget(self._stacked_view)
+        return self._stacked_view, self._stacked_layout
+
+    def _plot_items_ordered(self) -> List[DataPlotItem]:
+        return list(self._stacked_plot_items)
+
+    def _add_plot_item(self, plot_item: DataPlotItem, index: Optional[int] = None) -> None:
+        _, layout = self._get_stacked_layout()
+        cast(pg.AxisItem, plot_item.getAxis("left")).setWidth(self.LEFT_AXIS_WIDTH)
+        if index is None:
+            index = len(self._stacked_plot_items)
+        self._stacked_plot_items.insert(index, plot_item)
+        layout.insertItem(index, plot_item)
+        plot_item.geometryChanged.connect(self._update_stacked_suspended)
+
+    def _remove_plot_item(self, plot_item: DataPlotItem) -> None:
+        if plot_item not in self._stacked_plot_items:
+            return
+        view, layout = self._get_stacked_layout()
+        self._stacked_plot_items.remove(plot_item)
+        layout.removeItem(plot_item)
+        view.scene().removeItem(plot_item)
+        plot_item.deleteLater()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._stacked_view and event.type() in (
+            QEvent.Type.Show,
+            QEvent.Type.Hide,
+            QEvent.Type.Resize,
+        ):
+            self._update_stacked_suspended()
+        return super().eventFilter(watched, event)
+
+    def _update_stacked_suspended(self) -> None:
+        """Suspends plots that aren't visible, and catches up plots that became visible."""
+        if self._stacked_view is None:
+            return
+        view = self._stacked_view
+        visible_rect = QRectF()
+        if not view.isHidden() and view.width() > 0 and view.height() > 0:
+            visible_rect = view.mapToScene(view.viewport().rect()).boundingRect()
+        for plot_item in self._stacked_plot_items:
+            plot_rect = plot_item.sceneBoundingRect()
+            plot_item.set_suspended(plot_rect.height() <= 0 or not visible_rect.intersects(plot_rect))
+
+    def _plot_item_geometry(self, plot_item: DataPlotItem) -> Tuple[QWidget, QRect]:
+        view, _ = self._get_stacked_layout()
+        return view, view.mapFromScene(plot_item.sceneBoundingRect()).boundingRect()
@@ -24,7 +24,7 @@ from PySide6.QtWidgets import QTableWidgetItem
 from pydantic import BaseModel
 
 from .signals_table import HasRegionSignalsTable
-from .util import IdentityCacheDict, HasSaveLoadDataConfig, not_none
+from .util import IdentityCacheDict, HasSaveLoadDataConfig, not_none, AppendableArray, ArrayMeta
 
 
 class StatsTableStateModel(BaseModel):
@@ -100,6 +100,8 @@ class StatsSignalsTable(HasRegionSignalsTable, HasSaveLoadDataConfig):
                 low_index, high_index = HasRegionSignalsTable._indices_of_region(xs, request_region)
                 if low_index is None or high_index is None:  # empty set
                     ys_region = np.array([])
+                elif low_index == 0 and high_index == len(ys):  # keep identity, for cached metadata
+                    ys_region = ys
                 else:
                     ys_region = ys[low_index:high_index]
                 stats_dict = self._calculate_stats(ys_region)
@@ -112,15 +114,46 @@ class StatsSignalsTable(HasRegionSignalsTable, HasSaveLoadDataConfig):
             Does not spawn a separate thread, does not affect global state."""
             if len(ys) == 0:
                 return {}
+            meta = ArrayMeta.cached(ys)
+            if np.issubdtype(ys.dtype, np.number):  # accumulate in float64, regardless of the storage dtype
+                ys = ys.astype(np.float64)
+                if meta is None or meta.nan_count:  # exclude missing samples (see GapIndex)
+                    ys = ys[~np.isnan(ys)]
+                    if len(ys) == 0:
+                        return {}
             stats_dict = {}
             mean = sum(ys) / len(ys)
-            stats_dict[StatsSignalsTable.COL_STAT_MIN] = min(ys)
-            stats_dict[StatsSignalsTable.COL_STAT_MAX] = max(ys)
+            if meta is not None and meta.all_finite:  # already known, skip the passes
+                stats_dict[StatsSignalsTable.COL_STAT_MIN] = meta.finite_min
+                stats_dict[StatsSignalsTable.COL_STAT_MAX] = meta.finite_max
+            else:
+                stats_dict[StatsSignalsTable.COL_STAT_MIN] = min(ys)
+                stats_dict[StatsSignalsTable.COL_STAT_MAX] = max(ys)
             stats_dict[StatsSignalsTable.COL_STAT_AVG] = mean
             stats_dict[StatsSignalsTable.COL_STAT_RMS] = math.sqrt(sum([x**2 for x in ys]) / len(ys))
             stats_dict[StatsSignalsTable.COL_STAT_STDEV] = math.sqrt(sum([(x - mean) ** 2 for x in ys]) / len(ys))
             return stats_dict
 
+    @classmethod
+    def _merge_stats(cls, stats1: Dict[int, float], len1: int, stats2: Dict[int, float], len2: int) -> Dict[int, float]:
+        """Combines stats (as dict of col offset -> value) of two disjoint sets of len1 and len2 values,
+        eg to update stats incrementally for appended data."""
+        if not len1 or not stats1:
+            return stats2
+        if not len2 or not stats2:
+            return stats1
+        count = len1 + len2
+        total = stats1[cls.COL_STAT_AVG] * len1 + stats2[cls.COL_STAT_AVG] * len2
+        total_sq = stats1[cls.COL_STAT_RMS] ** 2 * len1 + stats2[cls.COL_STAT_RMS] ** 2 * len2
+        mean = total / count
+        return {
+            cls.COL_STAT_MIN: min(stats1[cls.COL_STAT_MIN], stats2[cls.COL_STAT_MIN]),
+            cls.COL_STAT_MAX: max(stats1[cls.COL_STAT_MAX], stats2[cls.COL_STAT_MAX]),
+            cls.COL_STAT_AVG: mean,
+            cls.COL_STAT_RMS: math.sqrt(total_sq / count),
+            cls.COL_STAT_STDEV: math.sqrt(max(total_sq / count - mean**2, 0)),
+        }
+
     def _post_cols(self) -> int:
         self.COL_STAT = super()._post_cols()
         return self.COL_STAT + 5
@@ -142,6 +175,7 @@ class StatsSignalsTable(HasRegionSignalsTable, HasSaveLoadDataConfig):
         self._region_stats = IdentityCacheDict[npt.NDArray[np.float64], Dict[int, float]]()  # array -> stats dict
 
         self._plots.sigDataUpdated.connect(lambda: self._update_stats_task(0, False))
+        self._plots.sigDataAppended.connect(lambda: self._update_stats_task(0, False))
         self._plots.sigCursorRangeChanged.connect(lambda: self._update_stats_task(100, True))
 
         # shared state for current stats request
@@ -212,15 +246,29 @@ class StatsSignalsTable(HasRegionSignalsTable, HasSaveLoadDataConfig):
             return
 
         region = HasRegionSignalsTable._region_of_plot(self._plots)
-        data_items = [  # filter out enum types
-            (name, (xs, ys)) for name, (xs, ys) in self._plots._data.items() if np.issubdtype(ys.dtype, np.number)
-        ]
+        data_items = []
+        displayed_data_names = self._plots._displayed_data_names()  # only request displayed data, lazily computed
+        for name in filter(lambda name: name in displayed_data_names, self._data_items.keys()):
+            xs, ys = self._plots._data.get(name, (None, None))
+            if xs is not None and ys is not None and np.issubdtype(ys.dtype, np.number):  # filter out enum types
+                data_items.append((name, (xs, ys)))
         if region == self._FULL_RANGE:  # for full range, deduplicate with cache
-            needed_stats = [
-                (weakref.ref(xs), weakref.ref(ys))
-                for name, (xs, ys) in data_items
-                if self._full_range_stats.get(ys, None, []) is None
-            ]
+            needed_stats = []
+            for name, (xs, ys) in data_items:
+                if self._full_range_stats.get(ys, None, []) is not None:
+                    continue
+                prefix = AppendableArray.prefix_of(ys)
+                prefix_stats = self._full_range_stats.get(prefix, None, []) if prefix is not None else None
+                if prefix is not None and prefix_stats is not None:  # appended data, only process the tail
+                    tail_stats = self.StatsCalculatorWorker._calculate_stats(ys[len(prefix) :])
+                    # weighted by the counts of non-missing samples, since missing samples are excluded
+                    prefix_meta, meta = ArrayMeta.of(prefix), ArrayMeta.of(ys)
+                    prefix_count = len(prefix) - (prefix_meta.nan_count if prefix_meta is not None else 0)
+                    tail_count = len(ys) - (meta.nan_count if meta is not None else 0) - prefix_count
+                    stats = self._merge_stats(prefix_stats, prefix_count, tail_stats, tail_count)
+                    self._full_range_stats.set(ys, None, [], stats)
+                else:
+                    needed_stats.append((weakref.ref(xs), weakref.ref(ys)))
         else:
             needed_stats = [(weakref.ref(xs), weakref.ref(ys)) for name, (xs, ys) in data_items]
 
@@ -237,8 +285,9 @@ class StatsSignalsTable(HasRegionSignalsTable, HasSaveLoadDataConfig):
         if self._stats_calculation_disabled:  # don't update the display if disabled
             return
 
+        displayed_data_names = self._plots._displayed_data_names()
         for row, name in enumerate(self._data_items.keys()):
-            xs, ys = self._plots._data.get(name, (None, None))
+            xs, ys = self._plots._data.get(name, (None, None)) if name in displayed_data_names else (None, None)
             if xs is None or ys is None:
                 for col in self.STATS_COLS:
                     not_none(self.item(row, self.COL_STAT + col)).setText("")
@@ -13,23 +13,35 @@
 #    limitations under the License.
 
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, Optional
+
+import numpy as np
 
 from .interactivity_mixins import DeltaAxisItem
 
 
 class TimeAxisItem(DeltaAxisItem):
-    """Time axis timestamp formatting"""
+    """Time axis timestamp formatting.
+    Values are epoch seconds, or seconds relative to an origin timestamp if set (eg, for datetime64 data)."""
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.autoSIPrefix = False  # doesn't make sense for timestamps
+        self._origin_s = 0  # epoch seconds at value 0
+
+    def set_origin(self, origin: Optional[np.datetime64]) -> None:
+        """Sets the timestamp at value 0, truncated to whole seconds. None means values are epoch seconds."""
+        origin_s = 0 if origin is None else int(origin.astype("datetime64[s]").astype(np.int64))
+        if origin_s != self._origin_s:
+            self._origin_s = origin_s
+            self.picture = None  # force re-render of tick strings
+            self.update()
 
     def tickStrings(self, values: List[float], scale: float, spacing: float) -> List[str]:
         out = []
         for value in values:
             try:
-                tick_value = datetime.fromtimestamp(value).strftime("%I:%M:%S.%f"[:-3])
+                tick_value = datetime.fromtimestamp(self._origin_s + value).strftime("%I:%M:%S.%f"[:-3])
             except (OSError, OverflowError):
                 tick_value = "🦆"
             out.append(tick_value)
@@ -11,8 +11,7 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-import bisect
-from typing import Dict, List, Any, Mapping, Tuple, Optional, TypeVar
+from typing import Dict, List, Any, Mapping, Tuple, Optional, TypeVar, Collection
 
 import numpy as np
 import numpy.typing as npt
@@ -23,7 +22,17 @@ from pydantic import BaseModel
 
 from .multi_plot_widget import LinkedMultiPlotWidget
 from .signals_table import ContextMenuSignalsTable
-from .util import IdentityCacheDict, DataTopModel, HasSaveLoadDataConfig, BaseTopModel, not_none
+from .util import (
+    DerivedData,
+    IdentityCacheDict,
+    LazyDataDict,
+    UniformTimebase,
+    DataTopModel,
+    HasSaveLoadDataConfig,
+    BaseTopModel,
+    not_none,
+    AppendableArray,
+)
 
 
 class TimeshiftDataStateModel(DataTopModel):
@@ -71,7 +80,7 @@ class TimeshiftPlotWidget(LinkedMultiPlotWidget, HasSaveLoadDataConfig):
         for data_name in data_names:
             self._timeshifts[data_name] = timeshift
         if update:
-            self._update_plots()
+            self._update_plots(data_names)
             self.sigDataUpdated.emit()
 
     def _apply_timeshift(
@@ -84,25 +93,38 @@ class TimeshiftPlotWidget(LinkedMultiPlotWidget, HasSaveLoadDataConfig):
             return xs
         result = self._timeshifts_cached_results.get(xs, timeshift, [], None)
         if result is None:
-            result = np.add(xs, timeshift)
+            prefix = AppendableArray.prefix_of(xs)
+            prefix_result = None
+            if prefix is not None:
+                prefix_result = self._timeshifts_cached_results.get(prefix, timeshift, [], None)
+            if prefix is not None and prefix_result is not None:  # appended data, only shift the tail
+                result = AppendableArray.extend(prefix_result, np.add(xs[len(prefix) :], timeshift))
+            else:
+                result = np.add(xs, timeshift)
+                result.flags.writeable = False
+            DerivedData.register_shifted(xs, result, timeshift)
             self._timeshifts_cached_results.set(xs, timeshift, [], result)
         return result
 
     T = TypeVar("T", bound=np.generic)
 
     def _transform_data(
-        self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]
+        self,
+        data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]],
+        data_names: Optional[Collection[str]] = None,
     ) -> Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]:
         """Applies timeshifts to the specified data_name and data. Returns the transformed X values (time values, data is not used),
         which may be the input data if no timeshift is specified.
-        Returns identical objects for identical inputs and consecutive identical timeshifts (results are cached).
+        Returns identical objects for identical inputs and consecutive identical timeshifts (results are cached),
+        so clean data items are a cache lookup.
+        Timeshifts are applied lazily, only to data items that are requested.
         """
-        data = super()._transform_data(data)
-        transformed_data = {}
-        for data_name in data.keys():
-            xs, ys = data[data_name]
-            transformed_data[data_name] = (self._apply_timeshift(data_name, data), ys)
-        return transformed_data
+        data = super()._transform_data(data, data_names)
+
+        def timeshift_data(data_name: str) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+            return self._apply_timeshift(data_name, data), data[data_name][1]
+
+        return LazyDataDict(data.keys(), timeshift_data)
 
     def start_timeshift_drag(self, data_names: List[str]) -> None:
         """Creates a timeshift drag handle to allow the user to visually drag a timeshift"""
@@ -113,7 +135,7 @@ class TimeshiftPlotWidget(LinkedMultiPlotWidget, HasSaveLoadDataConfig):
         view_left, view_right = self.view_x_range()
         view_center = (view_left + view_right) / 2
         data_x, data_y = self._data.get(data_names[0], (np.array([]), np.array([])))
-        index = bisect.bisect_left(data_x, view_center)
+        index = UniformTimebase.bisect_left(data_x, view_center)
         if index >= len(data_x):  # snap to closest point
             index = len(data_x) - 1
         elif index < 0:
@@ -11,9 +11,10 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import ast
 import math
 import numbers
-from typing import Dict, Tuple, List, Any, Mapping, Union, Optional, TypeVar
+from typing import Dict, Tuple, List, Any, Mapping, Union, Optional, TypeVar, Collection, Set
 
 import numpy as np
 import numpy.typing as npt
@@ -26,7 +27,20 @@ from pydantic import BaseModel
 from .code_input_dialog import CodeInputDialog
 from .multi_plot_widget import MultiPlotWidget
 from .signals_table import ContextMenuSignalsTable
-from .util import IdentityCacheDict, DataTopModel, HasSaveLoadDataConfig, BaseTopModel, not_none
+from .util import (
+    IdentityCacheDict,
+    LazyDataDict,
+    RunLengthEncoding,
+    UniformTimebase,
+    DataTopModel,
+    HasSaveLoadDataConfig,
+    BaseTopModel,
+    not_none,
+    AppendableArray,
+    GapIndex,
+    DerivedData,
+    DigitalBus,
+)
 
 
 class TransformsDataStateModel(DataTopModel):
@@ -34,7 +48,9 @@ class TransformsDataStateModel(DataTopModel):
 
 
 class AllDataDict:
-    """Takes in multiple series of (xs, ys) and returns the value at exactly the current x.
+    """Takes in multiple series of (xs, ys) and returns the value at exactly the current x, or for run-length encoded
+    data (see RunLengthEncoding), the value held at the current x. Missing (NaN) samples of sparse data (see
+    GapIndex.sparse_of), eg rows of a CSV where a signal wasn't sampled, are treated as no value at that x.
     Mimicks the behavior of a dict that contains all the y values, but more efficient since it doesn't
     do the indexing calculation until a value is requested.
     Requires x to be monotonically increasing. Optimized for the case where gets are done on almost every element,
@@ -47,6 +63,8 @@ class AllDataDict:
         self._x = float("NaN")
         self._data = data
         self._data_indices: Dict[str, int] = {}  # last index at the data name
+        self._run_lengths: Dict[str, bool] = {}  # whether the data name is run-length encoded
+        self._sparse_gaps: Dict[str, Optional[GapIndex.Gaps]] = {}  # gaps of the data name, if sparse
 
     def _set_x(self, x: float) -> None:
         """Updates the x value for the next get"""
@@ -61,17 +79,34 @@ class AllDataDict:
 
     def get(self, key: str, default: Any = None) -> Any:
         xs, ys = self._data[key]
+        if key not in self._data_indices:  # start the search at the first requested x
+            self._data_indices[key] = UniformTimebase.bisect_left(xs, self._x)
         while True:
-            prev_index = self._data_indices.get(key, 0)
+            prev_index = self._data_indices[key]
             if prev_index >= len(xs):  # exceeded length of array
                 return default
             elif xs[prev_index] == self._x:
+                gaps = self._sparse_of(key, ys)
+                if gaps is not None and gaps.is_missing(prev_index) and np.isnan(ys[prev_index]):  # not sampled
+                    return default
                 return ys[prev_index]
             elif xs[prev_index] > self._x:  # past the x being searched for
+                if prev_index > 0 and self._is_run_length(key, ys):  # value held from the previous sample
+                    return ys[prev_index - 1]
                 return default
             else:  # before the x being searched for, advance to the next elt
                 self._data_indices[key] = prev_index + 1
 
+    def _is_run_length(self, key: str, ys: npt.NDArray[Any]) -> bool:
+        if key not in self._run_lengths:
+            self._run_lengths[key] = RunLengthEncoding.is_run_length(ys)
+        return self._run_lengths[key]
+
+    def _sparse_of(self, key: str, ys: npt.NDArray[Any]) -> Optional[GapIndex.Gaps]:
+        if key not in self._sparse_gaps:
+            self._sparse_gaps[key] = GapIndex.sparse_of(ys)
+        return self._sparse_gaps[key]
+
 
 class TransformsPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
     """MultiPlotWidget that adds a user-defined data transform."""
@@ -94,6 +129,8 @@ class TransformsPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
         self._transforms_cached_results = IdentityCacheDict[
             npt.NDArray[Any], npt.NDArray[Any]
         ]()  # src data -> output data
+        # output of the last _transform_data, reused for clean data items
+        self._transformed_data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]] = {}
 
         super().__init__(*args, **kwargs)
 
@@ -132,14 +169,83 @@ class TransformsPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
             return ys
         expr, parsed = transform
 
-        input_all_data_refs = [elt for arrs in all_data.values() for elt in arrs]
+        if self._references_data(parsed):
+            input_data = list(all_data.values())
+        else:  # only depends on this data item, don't request (and compute) others
+            input_data = [(xs, ys)]
+        input_all_data_refs = [elt for arrs in input_data for elt in arrs]
         cached_result = self._transforms_cached_results.get(ys, expr, input_all_data_refs)
         if cached_result is not None:
             return cached_result
 
+        # for appended data, reuse the result on the previous data up to the first appended x of any input,
+        # since points before that can't reference appended data
+        start_index = 0
+        prefix_result: Optional[npt.NDArray[Any]] = None
+        prefix_ys = AppendableArray.prefix_of(ys)
+        if prefix_ys is not None:
+            prefix_refs = [AppendableArray.prefix_of(elt) for elt in input_all_data_refs]
+            prefix_result = self._transforms_cached_results.get(
+                prefix_ys,
+                expr,
+                [elt if prefix is None else prefix for elt, prefix in zip(input_all_data_refs, prefix_refs)],
+            )
+        if prefix_ys is not None and prefix_result is not None:
+            first_appended_xs = []
+            for other_xs, _ in input_data:
+                other_xs_prefix = AppendableArray.prefix_of(other_xs)
+                if other_xs_prefix is not None and len(other_xs_prefix) < len(other_xs):
+                    first_appended_xs.append(other_xs[len(other_xs_prefix)])
+            if first_appended_xs:
+                start_index = UniformTimebase.bisect_left(xs, min(first_appended_xs), 0, len(prefix_ys))
+            else:
+                start_index = len(prefix_ys)
+
+        gaps = GapIndex.sparse_of(ys)
+        missing = None
+        if gaps is not None:  # samples where sparse data wasn't sampled aren't evaluated
+            missing = gaps.missing_mask(len(ys))[start_index:] & np.isnan(ys[start_index:])
+        new_ys = self._eval_transform(expr, parsed, xs[start_index:], ys[start_index:], all_data, missing)
+        if isinstance(new_ys, Exception):
+            return new_ys
+        if DigitalBus.line_names(ys) is not None:  # bus words keep their dtype, so the lines still apply
+            try:
+                new_ys_arr = np.array(new_ys, dtype=ys.dtype)
+            except OverflowError as e:
+                return e
+            new_ys_arr.flags.writeable = False
+        else:
+            new_ys_arr = self._to_value_array(data_name, new_ys)  # stored in the same dtype as raw data
+        if prefix_result is not None:
+            if start_index < len(prefix_result):  # recomputed some previous points, can't extend in place
+                prefix_result = prefix_result[:start_index]
+            result = AppendableArray.extend(prefix_result, new_ys_arr)
+        else:
+            result = new_ys_arr
+        # values only hold if pointwise on this data item only
+        DerivedData.register_values(ys, result, held=not self._references_data(parsed))
+        self._transforms_cached_results.set(ys, expr, input_all_data_refs, result)
+        return result
+
+    def _eval_transform(
+        self,
+        expr: str,
+        parsed: Any,
+        xs: npt.NDArray[np.float64],
+        ys: npt.NDArray[Any],
+        all_data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]],
+        missing: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> Union[List[Any], Exception]:
+        """Evaluates a transform on each point of xs, ys, returning the new ys or the first exception.
+        Points where missing is set are not evaluated and stay missing."""
         other_data_dict = AllDataDict(all_data)
+        if missing is None:
+            missing = np.zeros(len(ys), dtype=np.bool_)
         new_ys = []
-        for x, y in zip(xs, ys):
+        for x, y, y_missing in zip(xs, ys, missing):
+            if y_missing:
+                new_ys.append(y)
+                continue
             try:
                 other_data_dict._set_x(x)
                 self._simpleeval.names = {
@@ -154,30 +260,55 @@ class TransformsPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
                 new_ys.append(new_y)
             except Exception as e:
                 return e
-        result = np.array(new_ys)
-        result.flags.writeable = ys.flags.writeable
-        self._transforms_cached_results.set(ys, expr, input_all_data_refs, result)
-        return result
+        return new_ys
+
+    @staticmethod
+    def _references_data(parsed: Any) -> bool:
+        """Returns whether a parsed transform references other data items (through data)."""
+        return any(isinstance(node, ast.Name) and node.id == "data" for node in ast.walk(parsed))
+
+    def _dirty_data_names(self, data_names: Collection[str]) -> Set[str]:
+        dirty_data_names = super()._dirty_data_names(data_names)
+        if dirty_data_names:  # transforms referencing other data may depend on any dirty data
+            dirty_data_names.update(
+                data_name for data_name, (_, parsed) in self._transforms.items() if self._references_data(parsed)
+            )
+        return dirty_data_names
 
     def _transform_data(
-        self, data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]
+        self,
+        data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]],
+        data_names: Optional[Collection[str]] = None,
     ) -> Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[T]]]:
-        data = super()._transform_data(data)
-        transformed_data = {}
-        last_transform_errs = self._transforms_errs
-        for data_name in data.keys():
+        """Transforms are applied lazily, only to data items that are requested, and transform errors are recorded
+        when the data item is requested. Clean data items reuse results already computed by the previous call."""
+        data = super()._transform_data(data, data_names)
+
+        def transform_data(data_name: str) -> Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]:
             transformed = self._apply_transform(data_name, data)
             if isinstance(transformed, Exception):
                 self._transforms_errs[data_name] = transformed
-                continue
-            else:
-                if data_name in self._transforms_errs:
-                    del self._transforms_errs[data_name]
-            transformed_data[data_name] = data[data_name][0], transformed
-        if len(last_transform_errs) > 0 or len(self._transforms_errs) > 0:
-            self.sigDataUpdated.emit()  # error counts as a transform update
+                return None
+            self._transforms_errs.pop(data_name, None)
+            return data[data_name][0], transformed
+
+        computed_data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]] = {}
+        if data_names is not None and isinstance(self._transformed_data, LazyDataDict):
+            computed_data = {
+                data_name: data_value
+                for data_name, data_value in self._transformed_data.computed_items().items()
+                if data_name not in data_names
+            }
+        transformed_data = LazyDataDict(data.keys(), transform_data, computed_data)
+        self._transformed_data = transformed_data
         return transformed_data
 
+    def _update_plots(self, data_names: Optional[Collection[str]] = None) -> None:
+        had_transform_errs = len(self._transforms_errs) > 0
+        super()._update_plots(data_names)
+        if had_transform_errs or len(self._transforms_errs) > 0:
+            self.sigDataUpdated.emit()  # error counts as a transform update
+
     def set_transform(self, data_names: List[str], transform_expr: str, update: bool = True) -> None:
         """Sets the transform on a particular data and applies it.
         Raises SyntaxError (from simpleeval) on a parsing failure. Does not do any other processing / checks.
@@ -195,7 +326,7 @@ class TransformsPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
                 self._transforms[data_name] = (transform_expr, parsed)
 
         if update:
-            self._update_plots()
+            self._update_plots(data_names)
             self.sigDataUpdated.emit()
 
 
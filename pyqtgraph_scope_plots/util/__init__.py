@@ -12,18 +12,45 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from .appendable_array import AppendableArray
+from .array_meta import ArrayMeta
 from .cache_dict import IdentityCacheDict
+from .categorical import CategoricalCodes
+from .derived_data import DerivedData
+from .digital_bus import DigitalBus
+from .gap_index import GapIndex
+from .ingest import ingest_array, ingest_data_frame
+from .lazy_dict import LazyDataDict
+from .minmax_pyramid import MinMaxPyramid
 from .mixin_cols_table import MixinColsTable
+from .run_length import RunLengthEncoding
 from .save_restore_model import HasSaveLoadConfig, HasSaveLoadDataConfig, BaseTopModel, DataTopModel
+from .uniform_timebase import UniformTimebase
+from .update_scheduler import UpdateScheduler
+from .value_dtype import cast_values
 from .util import not_none, int_color
 
 __all__ = [
+    "AppendableArray",
+    "ArrayMeta",
     "IdentityCacheDict",
+    "CategoricalCodes",
+    "DerivedData",
+    "DigitalBus",
+    "GapIndex",
+    "ingest_array",
+    "ingest_data_frame",
+    "LazyDataDict",
+    "MinMaxPyramid",
     "MixinColsTable",
+    "RunLengthEncoding",
     "HasSaveLoadConfig",
     "HasSaveLoadDataConfig",
     "BaseTopModel",
     "DataTopModel",
+    "UniformTimebase",
+    "UpdateScheduler",
+    "cast_values",
     "not_none",
     "int_color",
 ]
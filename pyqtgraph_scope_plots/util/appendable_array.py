@@ -0,0 +1,123 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Optional
+from weakref import ref
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache_dict import IdentityCacheDict
+
+
+class AppendableArray:
+    """A growable 1-D buffer that exposes its contents as immutable numpy views, with amortized O(1) appends
+    using capacity doubling.
+
+    Views are never modified once handed out: appends only write past the end of all existing views, and growing
+    copies into a new buffer (leaving older views on the old buffer). This makes views safe to use as
+    IdentityCacheDict keys.
+
+    Each view produced by extend() records the view it extends, so derived data (eg, timeshifted or transformed
+    arrays, or stats) cached on the shorter view can be updated by processing only the appended tail."""
+
+    _INITIAL_CAPACITY = 16
+
+    # latest view -> buffer that owns it, so extending the latest view appends in place
+    _heads = IdentityCacheDict[npt.NDArray[Any], "AppendableArray"]()
+    # view -> (weakref to the view it extends); weak so views don't keep older buffers alive
+    _prefixes = IdentityCacheDict[npt.NDArray[Any], "ref[npt.NDArray[Any]]"]()
+
+    def __init__(self, dtype: npt.DTypeLike, capacity: int = _INITIAL_CAPACITY) -> None:
+        self._buffer: npt.NDArray[Any] = np.empty(max(capacity, 1), dtype=dtype)
+        self._start = 0  # contents are self._buffer[self._start : self._end]
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def view(self) -> npt.NDArray[Any]:
+        """Returns an immutable view of the current contents."""
+        view = self._buffer[self._start : self._end]
+        view.flags.writeable = False
+        return view
+
+    def append(self, values: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Appends values, returning an immutable view of the new contents.
+        The buffer dtype is upcast if needed to hold values."""
+        values_arr = np.asarray(values)
+        dtype = self._buffer.dtype
+        if len(values_arr) and np.result_type(dtype, values_arr) != dtype:
+            dtype = np.result_type(dtype, values_arr)
+        new_len = len(self) + len(values_arr)
+        if self._end + len(values_arr) > len(self._buffer) or dtype != self._buffer.dtype:
+            # re-allocate with 2x headroom, which also compacts out dropped samples
+            new_buffer = np.empty(max(2 * new_len, self._INITIAL_CAPACITY), dtype=dtype)
+            new_buffer[: len(self)] = self._buffer[self._start : self._end]
+            self._buffer = new_buffer
+            self._start, self._end = 0, len(self)
+        self._buffer[self._end : self._end + len(values_arr)] = values_arr
+        self._end += len(values_arr)
+        return self.view()
+
+    def drop_front(self, count: int) -> npt.NDArray[Any]:
+        """Drops the first count values (eg, to bound the length for a rolling window), returning an immutable
+        view of the new contents. Storage is reclaimed on a later append."""
+        self._start += max(min(count, len(self)), 0)
+        return self.view()
+
+    @classmethod
+    def extend(cls, prefix: Optional[npt.NDArray[Any]], values: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Returns an immutable array of prefix (which may be None, for empty) followed by values.
+        If prefix is the latest view of an AppendableArray, this appends in place. Otherwise, the prefix is
+        copied into a new AppendableArray, with spare capacity for further appends.
+        The result records prefix, which can be retrieved with prefix_of."""
+        values_arr = np.asarray(values)
+        buffer: Optional[AppendableArray] = None
+        if prefix is not None and not prefix.flags.writeable:
+            buffer = cls._heads.get(prefix, None, [])
+            if buffer is not None and len(buffer) != len(prefix):  # not the latest view, can't append in place
+                buffer = None
+        if buffer is None:
+            if prefix is not None and len(prefix):
+                dtype = np.result_type(prefix, values_arr) if len(values_arr) else prefix.dtype
+            else:
+                dtype = values_arr.dtype
+            buffer = AppendableArray(dtype, 2 * ((0 if prefix is None else len(prefix)) + len(values_arr)))
+            if prefix is not None:
+                buffer.append(prefix)
+
+        result = buffer.append(values_arr)
+        cls._heads.set(result, None, [], buffer)
+        if prefix is not None and not prefix.flags.writeable:
+            cls._prefixes.set(result, None, [], ref(prefix))
+        return result
+
+    @classmethod
+    def record_prefix(cls, prefix: npt.NDArray[Any], arr: npt.NDArray[Any]) -> None:
+        """Records that (immutable) arr starts with all of (immutable) prefix, for arrays built without extend (eg,
+        from a rolling buffer that hasn't dropped samples), so it can be retrieved with prefix_of."""
+        if not prefix.flags.writeable and not arr.flags.writeable and len(arr) >= len(prefix):
+            cls._prefixes.set(arr, None, [], ref(prefix))
+
+    @classmethod
+    def prefix_of(cls, arr: npt.NDArray[Any]) -> Optional[npt.NDArray[Any]]:
+        """If arr was created by extend and the array it extends is still alive, returns that array."""
+        prefix_ref = cls._prefixes.get(arr, None, [])
+        if prefix_ref is None:
+            return None
+        return prefix_ref()
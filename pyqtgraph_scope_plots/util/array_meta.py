@@ -0,0 +1,106 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import math
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .appendable_array import AppendableArray
+from .cache_dict import IdentityCacheDict
+
+
+class ArrayMeta:
+    """Tracks facts about immutable numeric arrays, computed once (see of) so consumers can skip redundant full passes
+    (eg, bounds for autorange, finiteness checks before drawing, min / max for stats and value casts).
+    Uniform sampling is tracked separately by UniformTimebase.
+
+    Metadata is cached by array identity, and must be for immutable (read-only) arrays. Derived arrays get it
+    cheaply: arrays appended to (see AppendableArray) only process the appended tail, and shifted arrays (eg,
+    timeshifted xs) are registered with register_shifted."""
+
+    class Meta(NamedTuple):
+        nan_count: int
+        all_finite: bool
+        sorted: bool  # non-decreasing, and false if there are any NaNs
+        finite_min: float  # NaN if there are no finite values
+        finite_max: float
+
+        def extended(self, tail: "ArrayMeta.Meta", boundary_sorted: bool) -> "ArrayMeta.Meta":
+            """Returns the metadata of this array's data followed by tail's data, given whether the last value of
+            this array is less than or equal to the first value of tail."""
+            return ArrayMeta.Meta(
+                nan_count=self.nan_count + tail.nan_count,
+                all_finite=self.all_finite and tail.all_finite,
+                sorted=self.sorted and tail.sorted and boundary_sorted,
+                finite_min=float(np.fmin(self.finite_min, tail.finite_min)),
+                finite_max=float(np.fmax(self.finite_max, tail.finite_max)),
+            )
+
+    _metas = IdentityCacheDict[npt.NDArray[Any], Meta]()  # array -> metadata
+
+    @classmethod
+    def compute(cls, arr: npt.NDArray[Any]) -> Optional[Meta]:
+        """Computes (without caching) the metadata of a numeric array, or returns None for other arrays."""
+        if arr.ndim != 1 or not np.issubdtype(arr.dtype, np.number) or np.issubdtype(arr.dtype, np.complexfloating):
+            return None
+        if np.issubdtype(arr.dtype, np.integer):
+            nan_count, finite_arr = 0, arr
+        else:
+            finite = np.isfinite(arr)
+            nan_count = int(np.count_nonzero(np.isnan(arr)))
+            finite_arr = arr if finite.all() else arr[finite]
+        all_finite = len(finite_arr) == len(arr)
+        return cls.Meta(
+            nan_count=nan_count,
+            all_finite=all_finite,
+            sorted=all_finite and bool(np.all(arr[1:] >= arr[:-1])),
+            finite_min=float(np.min(finite_arr)) if len(finite_arr) else math.nan,
+            finite_max=float(np.max(finite_arr)) if len(finite_arr) else math.nan,
+        )
+
+    @classmethod
+    def of(cls, arr: npt.NDArray[Any]) -> Optional[Meta]:
+        """Returns the metadata of a numeric array (None for other arrays), cached for read-only arrays.
+        If arr extends (see AppendableArray) an array with cached metadata, only the appended tail is processed."""
+        if arr.flags.writeable:  # can't be cached by identity
+            return cls.compute(arr)
+        meta = cls._metas.get(arr, None, [])
+        if meta is not None:
+            return meta
+        prefix = AppendableArray.prefix_of(arr)
+        prefix_meta = cls._metas.get(prefix, None, []) if prefix is not None else None
+        tail_meta = cls.compute(arr[len(prefix) :]) if prefix is not None and prefix_meta is not None else None
+        if prefix is not None and prefix_meta is not None and tail_meta is not None:  # appended, only process the tail
+            boundary_sorted = not len(prefix) or len(prefix) == len(arr) or arr[len(prefix) - 1] <= arr[len(prefix)]
+            meta = prefix_meta.extended(tail_meta, bool(boundary_sorted))
+        else:
+            meta = cls.compute(arr)
+        if meta is not None:
+            cls._metas.set(arr, None, [], meta)
+        return meta
+
+    @classmethod
+    def cached(cls, arr: npt.NDArray[Any]) -> Optional[Meta]:
+        """Returns the metadata of arr if already computed, without computing it."""
+        return cls._metas.get(arr, None, [])
+
+    @classmethod
+    def register_shifted(cls, arr: npt.NDArray[Any], shifted: npt.NDArray[Any], shift: float) -> None:
+        """Registers shifted (arr + shift, eg timeshifted xs), if arr has cached metadata."""
+        meta = cls.cached(arr)
+        if meta is not None and not shifted.flags.writeable and math.isfinite(shift):
+            shifted_meta = meta._replace(finite_min=meta.finite_min + shift, finite_max=meta.finite_max + shift)
+            cls._metas.set(shifted, None, [], shifted_meta)
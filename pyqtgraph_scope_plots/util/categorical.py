@@ -0,0 +1,86 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .cache_dict import IdentityCacheDict
+
+
+class CategoricalCodes:
+    """Tracks the integer codes and category table of enum (eg, string-valued) data arrays, so consumers like
+    EnumWaveformPlot can work on integer codes (eg, for change detection) instead of sorting the values each time.
+
+    Data arrays stay plain object arrays (so values can be used directly everywhere else), but arrays created from
+    codes reference one shared object per category instead of one object per sample.
+    Arrays are tracked by identity, and must be immutable (read-only) to be registered."""
+
+    # ys -> (codes, categories), where ys == categories[codes]
+    _codes = IdentityCacheDict[npt.NDArray[Any], Tuple[npt.NDArray[np.integer[Any]], npt.NDArray[Any]]]()
+
+    @classmethod
+    def from_codes(cls, codes: npt.ArrayLike, categories: npt.ArrayLike) -> npt.NDArray[Any]:
+        """Returns a read-only data array of categories[codes], registered with its codes.
+        Codes of -1 (as used by pandas for missing values) become None."""
+        codes_arr = np.asarray(codes)
+        categories_arr = np.concatenate([np.asarray(categories, dtype=object), [None]])  # so -1 indexes None
+        categories_arr.flags.writeable = False
+        ys: npt.NDArray[Any] = categories_arr[codes_arr]  # one reference per sample to shared category objects
+        ys.flags.writeable = False
+        codes_arr = codes_arr.copy() if codes_arr.flags.writeable else codes_arr
+        codes_arr.flags.writeable = False
+        cls._codes.set(ys, None, [], (codes_arr, categories_arr))
+        return ys
+
+    @classmethod
+    def from_categorical(cls, values: Union[pd.Categorical, pd.Series, pd.Index]) -> npt.NDArray[Any]:
+        """Returns a read-only data array from pandas categorical values, registered with its codes."""
+        categorical = pd.Categorical(values)  # no copy if already categorical
+        return cls.from_codes(categorical.codes, categorical.categories.to_numpy(dtype=object))
+
+    @classmethod
+    def of(cls, ys: npt.NDArray[Any]) -> Optional[Tuple[npt.NDArray[np.integer[Any]], npt.NDArray[Any]]]:
+        """Returns the (codes, categories) of ys if it was registered, without encoding."""
+        return cls._codes.get(ys, None, [])
+
+    @classmethod
+    def encode(cls, ys: npt.NDArray[Any]) -> Tuple[npt.NDArray[np.integer[Any]], npt.NDArray[Any]]:
+        """Returns the (codes, categories) of ys, encoding (and registering, if read-only) ys if needed.
+        Encoding uses a hash-based factorize, which is O(n) instead of the O(n log n) sort of np.unique."""
+        encoded = cls.of(ys)
+        if encoded is not None:
+            return encoded
+        codes, categories = pd.factorize(ys, use_na_sentinel=False)
+        categories_arr = np.asarray(categories, dtype=object)
+        codes.flags.writeable = False
+        categories_arr.flags.writeable = False
+        if not ys.flags.writeable:
+            cls._codes.set(ys, None, [], (codes, categories_arr))
+        return codes, categories_arr
+
+    @classmethod
+    def masked(cls, ys: npt.NDArray[Any], mask: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        """Returns a read-only ys[mask] (with mask a boolean mask or indices), registered with the correspondingly
+        masked codes if ys is registered."""
+        result: npt.NDArray[Any] = ys[mask]
+        result.flags.writeable = False
+        encoded = cls.of(ys)
+        if encoded is not None:
+            codes = encoded[0][mask]
+            codes.flags.writeable = False
+            cls._codes.set(result, None, [], (codes, encoded[1]))
+        return result
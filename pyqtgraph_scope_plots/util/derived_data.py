@@ -0,0 +1,71 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Optional
+
+import numpy.typing as npt
+
+from .appendable_array import AppendableArray
+from .array_meta import ArrayMeta
+from .digital_bus import DigitalBus
+from .gap_index import GapIndex
+from .run_length import RunLengthEncoding
+from .uniform_timebase import UniformTimebase
+
+
+class DerivedData:
+    """Registers data derived from other data with all the identity registries describing the source (run-length
+    encoding, digital bus lines, gaps, uniform timebases, array metadata, and AppendableArray lineage), by kind of
+    derivation. Code deriving data should go through these instead of the individual registries, so new registries
+    only need to be handled here."""
+
+    @staticmethod
+    def register_values(source: npt.NDArray[Any], derived: npt.NDArray[Any], held: bool = True) -> None:
+        """Registers derived values (ys) computed sample-by-sample from source, on the same xs, eg a cast or
+        transform. held is whether each derived value depends only on the source value, so it holds where the
+        source value does (eg, a cast or pointwise transform, but not one referencing other data)."""
+        if held:
+            RunLengthEncoding.register_derived(source, derived)
+        DigitalBus.register_derived(source, derived)
+        GapIndex.register_derived(source, derived)  # derived values keep missing samples
+
+    @staticmethod
+    def register_shifted(xs: npt.NDArray[Any], shifted: npt.NDArray[Any], shift: float) -> None:
+        """Registers shifted xs (xs + shift, eg timeshifted xs)."""
+        UniformTimebase.register_shifted(xs, shifted, shift)
+        ArrayMeta.register_shifted(xs, shifted, shift)
+
+    @staticmethod
+    def register_appended(
+        prev_xs: Optional[npt.NDArray[Any]],
+        prev_ys: Optional[npt.NDArray[Any]],
+        xs: npt.NDArray[Any],
+        ys: npt.NDArray[Any],
+        dropped: int = 0,
+    ) -> None:
+        """Registers (xs, ys) as (prev_xs, prev_ys) with samples appended, after dropping the first dropped samples
+        (eg, for a rolling window). Only the appended samples are checked, except for sparse data (see
+        GapIndex.sparse_of), whose gaps are rebuilt."""
+        UniformTimebase.register_rolled(prev_xs, xs, dropped)
+        if prev_xs is not None and dropped == 0:  # eg, for extending derived data from the previous data
+            AppendableArray.record_prefix(prev_xs, xs)
+        if prev_ys is None:
+            return
+        RunLengthEncoding.register_derived(prev_ys, ys)
+        DigitalBus.register_derived(prev_ys, ys)
+        gaps = GapIndex.sparse_of(prev_ys)
+        if gaps is not None and not ys.flags.writeable:
+            GapIndex.build(xs, ys, gaps.jump_factor)
+        if dropped == 0:
+            AppendableArray.record_prefix(prev_ys, ys)
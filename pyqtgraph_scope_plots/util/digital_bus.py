@@ -0,0 +1,91 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache_dict import IdentityCacheDict
+
+
+class DigitalBus:
+    """Tracks data arrays that are digital buses: up to MAX_LINES boolean lines bit-packed into one unsigned integer
+    word per sample (line i is bit i), on one shared timebase. Compared to each line being its own data item, this
+    stores one bit instead of a (float64 or object) value per line per sample, and one timebase for all lines.
+    Data arrays are plain (xs, ys) arrays, so they work everywhere. Line names are tracked by identity (of ys), and
+    arrays must be immutable (read-only) to be registered."""
+
+    MAX_LINES = 64
+    _WORD_DTYPES = [np.uint8, np.uint16, np.uint32, np.uint64]
+
+    _line_names = IdentityCacheDict[npt.NDArray[Any], Tuple[str, ...]]()  # ys -> line names, by bit
+
+    @classmethod
+    def pack(cls, lines: Mapping[str, npt.ArrayLike]) -> npt.NDArray[Any]:
+        """Returns a read-only array of words bit-packing lines (as line name -> boolean values, all the same length),
+        in the smallest unsigned integer dtype that holds all lines, registered with the line names."""
+        if not 0 < len(lines) <= cls.MAX_LINES:
+            raise ValueError(f"digital bus must have 1 to {cls.MAX_LINES} lines, got {len(lines)}")
+        dtype = next(np.dtype(dtype) for dtype in cls._WORD_DTYPES if np.dtype(dtype).itemsize * 8 >= len(lines))
+        words: Optional[npt.NDArray[Any]] = None
+        for bit, values in enumerate(lines.values()):
+            line_words = np.asarray(values, dtype=bool).astype(dtype) << dtype.type(bit)
+            if words is None:
+                words = line_words
+            elif len(line_words) != len(words):
+                raise ValueError("digital bus lines must all be the same length")
+            else:
+                words |= line_words
+        assert words is not None
+        words.flags.writeable = False
+        cls.register(words, list(lines.keys()))
+        return words
+
+    @classmethod
+    def register(cls, ys: npt.NDArray[Any], line_names: Any) -> None:
+        """Registers (read-only, unsigned integer) ys as a digital bus with the line names (by bit)."""
+        if not np.issubdtype(ys.dtype, np.unsignedinteger) or len(line_names) > ys.dtype.itemsize * 8:
+            raise ValueError(f"can't hold {len(line_names)} lines in {ys.dtype}")
+        if not ys.flags.writeable:
+            cls._line_names.set(ys, None, [], tuple(line_names))
+
+    @classmethod
+    def line_names(cls, ys: npt.NDArray[Any]) -> Optional[Tuple[str, ...]]:
+        """Returns the line names (by bit) of ys if it was registered as a digital bus, otherwise None."""
+        return cls._line_names.get(ys, None, [])
+
+    @classmethod
+    def register_derived(cls, source: npt.NDArray[Any], derived: npt.NDArray[Any]) -> None:
+        """Registers derived (eg, an extension of source, with the same lines) as a digital bus, if source is."""
+        line_names = cls.line_names(source)
+        if line_names is not None and not derived.flags.writeable and derived.dtype == source.dtype:
+            cls._line_names.set(derived, None, [], line_names)
+
+    @staticmethod
+    def bits(ys: npt.NDArray[Any], count: int) -> npt.NDArray[np.uint8]:
+        """Returns the first count lines of words ys, unpacked as a (len(ys), count) matrix of 0 / 1."""
+        bytes_per_word = ys.dtype.itemsize
+        ys_bytes = np.ascontiguousarray(ys, dtype=ys.dtype.newbyteorder("<")).view(np.uint8)
+        return np.unpackbits(ys_bytes.reshape(-1, bytes_per_word), axis=1, count=count, bitorder="little")
+
+    @classmethod
+    def edges(cls, ys: npt.NDArray[Any], count: int) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Returns the edges of the first count lines of words ys as (sample indices, lines), where each sample index
+        is the first sample after a change of the line, ordered by line then index.
+        Only the words that change are unpacked, so this is one vectorized pass over ys plus O(changes)."""
+        changed = np.flatnonzero(ys[:-1] != ys[1:]) + 1
+        rows, lines = np.nonzero(cls.bits(ys[changed - 1] ^ ys[changed], count))
+        order = np.argsort(lines, kind="stable")  # rows (so indices) are already sorted within each line
+        return changed[rows[order]], lines[order]
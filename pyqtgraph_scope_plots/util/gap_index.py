@@ -0,0 +1,133 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .array_meta import ArrayMeta
+from .cache_dict import IdentityCacheDict
+from .uniform_timebase import UniformTimebase
+
+
+class GapIndex:
+    """Tracks the gaps of data arrays: intervals with no data, where the trace should not be connected across.
+    Gaps are runs of missing (non-finite, eg NaN) samples, and (if a jump factor is given when built) jumps in
+    sampling between consecutive valid samples of more than jump_factor times the typical sample spacing.
+    Runs of missing samples without such a jump (eg, rows of a sparse log where a signal wasn't sampled) are skipped
+    over but not gaps, so data can keep its missing samples (and a shared x array) instead of being masked.
+
+    Gaps are tracked by identity (of ys), and ys must be immutable (read-only) to be registered. Numeric data without
+    registered gaps uses its missing samples as gaps, computed only if ArrayMeta shows there are any."""
+
+    class Gaps(NamedTuple):
+        # gap i spans samples [starts[i], ends[i]), all missing (empty for jumps between valid samples), and the
+        # trace is not connected from the sample before it to the sample after it; sorted, and non-overlapping
+        starts: npt.NDArray[np.intp]
+        ends: npt.NDArray[np.intp]
+        # all runs of missing samples [missing_starts[i], missing_ends[i]), including those that aren't gaps
+        missing_starts: npt.NDArray[np.intp]
+        missing_ends: npt.NDArray[np.intp]
+        # the jump factor these were built with, if any: then the data is sparse (eg, rows of a shared time array
+        # where it wasn't sampled), and missing samples are no value at that x, rather than non-finite values
+        jump_factor: Optional[float] = None
+
+        def connected(self, indices: npt.NDArray[np.integer[Any]]) -> npt.NDArray[np.bool_]:
+            """Given sorted sample indices (eg, of drawn points), returns whether each is connected to the next,
+            in pyqtgraph's connect array format."""
+            gaps_before = np.searchsorted(self.ends, indices, side="right")
+            return np.append(gaps_before[1:] == gaps_before[:-1], False)
+
+        def is_missing(self, index: int) -> bool:
+            """Returns whether the sample at index is missing, eg to skip it for value readouts and export."""
+            run = int(np.searchsorted(self.missing_ends, index, side="right"))
+            return run < len(self.missing_starts) and bool(self.missing_starts[run] <= index)
+
+        def missing_mask(self, length: int) -> npt.NDArray[np.bool_]:
+            """Returns whether each sample (of data with length samples) is missing, as a boolean array."""
+            run_edges = np.zeros(length + 1, dtype=np.intp)
+            np.add.at(run_edges, self.missing_starts, 1)
+            np.add.at(run_edges, self.missing_ends, -1)
+            return np.cumsum(run_edges[:-1]) > 0
+
+    _gaps = IdentityCacheDict[npt.NDArray[Any], Gaps]()  # ys -> gaps
+    _median_steps = IdentityCacheDict[npt.NDArray[Any], float]()  # xs -> median spacing
+
+    @classmethod
+    def build(cls, xs: npt.NDArray[Any], ys: npt.NDArray[Any], jump_factor: Optional[float] = None) -> Gaps:
+        """Builds (and registers, if ys is read-only) the gaps of numeric data, in one vectorized pass.
+        If jump_factor is given, runs of missing samples and spacings between valid samples are gaps only where
+        they span more than jump_factor times the typical spacing of valid samples (the median spacing of xs, cached
+        for xs shared between data, scaled by the fraction of missing samples)."""
+        missing = ~np.isfinite(ys)
+        edges = np.flatnonzero(np.diff(missing.view(np.int8), prepend=0, append=0))
+        missing_starts, missing_ends = edges[0::2], edges[1::2]
+        starts, ends = missing_starts, missing_ends
+        valid_count = len(ys) - int(np.count_nonzero(missing))
+        if jump_factor is not None and valid_count >= 2:
+            max_step = jump_factor * cls._median_step(xs) * len(ys) / valid_count
+            inner = (starts > 0) & (ends < len(ys))  # leading and trailing runs have no data on one side
+            inner_spans = xs[np.minimum(ends, len(ys) - 1)] - xs[np.maximum(starts - 1, 0)]
+            keep = ~inner | (inner_spans > max_step)
+            starts, ends = starts[keep], ends[keep]
+            jumps = np.flatnonzero(np.diff(xs) > max_step) + 1
+            jumps = jumps[~missing[jumps] & ~missing[jumps - 1]]  # between valid samples
+            starts, ends = np.concatenate((starts, jumps)), np.concatenate((ends, jumps))
+            order = np.argsort(starts, kind="stable")
+            starts, ends = starts[order], ends[order]
+        gaps = cls.Gaps(starts, ends, missing_starts, missing_ends, jump_factor)
+        if not ys.flags.writeable:
+            cls._gaps.set(ys, None, [], gaps)
+        return gaps
+
+    @classmethod
+    def _median_step(cls, xs: npt.NDArray[Any]) -> float:
+        """Returns the (cached, for read-only xs) median spacing of xs."""
+        timebase = UniformTimebase.of(xs)
+        if timebase is not None:
+            return timebase[1]
+        step = cls._median_steps.get(xs, None, [])
+        if step is None:
+            step = float(np.median(np.diff(xs)))
+            if not xs.flags.writeable:
+                cls._median_steps.set(xs, None, [], step)
+        return step
+
+    @classmethod
+    def of(cls, xs: npt.NDArray[Any], ys: npt.NDArray[Any]) -> Optional[Gaps]:
+        """Returns the gaps of some data, or None if it has no gaps or missing samples (or isn't numeric)."""
+        gaps = cls._gaps.get(ys, None, [])
+        if gaps is None:
+            if ys.flags.writeable or not len(ys) or not np.issubdtype(ys.dtype, np.number):
+                return None
+            meta = ArrayMeta.of(ys)
+            if meta is None or meta.all_finite:
+                return None
+            gaps = cls.build(xs, ys)
+        return gaps if len(gaps.missing_starts) or len(gaps.starts) else None
+
+    @classmethod
+    def sparse_of(cls, ys: npt.NDArray[Any]) -> Optional[Gaps]:
+        """Returns the registered gaps of sparse data (built with a jump factor, eg by ingest_data_frame), whose missing
+        samples are no value at that x, or None for other data, whose non-finite samples are values."""
+        gaps = cls._gaps.get(ys, None, [])
+        return gaps if gaps is not None and gaps.jump_factor is not None else None
+
+    @classmethod
+    def register_derived(cls, source: npt.NDArray[Any], derived: npt.NDArray[Any]) -> None:
+        """Registers derived (eg, a cast of source, with the same missing samples) with the gaps of source, if any."""
+        gaps = cls._gaps.get(source, None, [])
+        if gaps is not None and not derived.flags.writeable:
+            cls._gaps.set(derived, None, [], gaps)
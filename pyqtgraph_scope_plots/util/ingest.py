@@ -0,0 +1,114 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .categorical import CategoricalCodes
+from .gap_index import GapIndex
+from .uniform_timebase import UniformTimebase
+
+
+def ingest_array(x: Any, dtype: Optional[npt.DTypeLike] = None) -> Tuple[npt.NDArray[Any], bool]:
+    """Converts x (an ndarray, pandas Series / Index, buffer-protocol object, or other array-like) into a read-only
+    1-D-contiguous ndarray of dtype (if specified), taking ownership of the underlying memory without copying where
+    the dtype and contiguity allow it. Returns the array and whether a copy was needed.
+
+    IMPORTANT - the ingested buffer is frozen: if not copied, the input ndarray, and any ndarrays it is a view of
+    (including the array wrapped by a pandas Series, or the DataFrame block holding a column), are marked read-only in
+    place (ownership is transferred), so later writes through them raise instead of silently changing plotted data,
+    which is cached by array identity. Other buffer-protocol objects (eg, array.array) can't be frozen, and the
+    caller must not write to them after this.
+    pandas categorical values are converted to an object array referencing shared category objects, registered with
+    their codes (see CategoricalCodes)."""
+    if isinstance(x, (pd.Categorical, pd.Series, pd.Index)) and isinstance(x.dtype, pd.CategoricalDtype):
+        return CategoricalCodes.from_categorical(x), True
+    if isinstance(x, np.ndarray):
+        arr, copied = x, False
+    elif isinstance(x, (pd.Series, pd.Index)):
+        arr = x.to_numpy()
+        values = x.values  # the backing ndarray for numpy dtypes, without copying
+        copied = not (isinstance(values, np.ndarray) and np.may_share_memory(arr, values))
+    else:
+        try:
+            arr, copied = np.asarray(memoryview(x)), False
+        except TypeError:  # not a buffer-protocol object
+            arr, copied = np.asarray(x), True
+
+    if dtype is not None and arr.dtype != np.dtype(dtype):
+        arr, copied = arr.astype(dtype), True
+    if arr.ndim == 1 and not arr.flags.c_contiguous:
+        arr, copied = np.ascontiguousarray(arr), True
+    _freeze(arr)
+    return arr, copied
+
+
+def _freeze(arr: npt.NDArray[Any]) -> None:
+    """Marks arr, and the ndarrays it is (transitively) a view of, read-only, so the memory can't be written through
+    any of them."""
+    base: Any = arr
+    while isinstance(base, np.ndarray):
+        base.flags.writeable = False
+        base = base.base
+
+
+def ingest_data_frame(
+    df: pd.DataFrame, time_column: Optional[str] = None, gap_jump_factor: Optional[float] = None
+) -> Tuple[Dict[str, Tuple[npt.NDArray[Any], npt.NDArray[Any]]], List[str]]:
+    """Converts a DataFrame of a time column (by default, the first column, either numeric or datetime64) and value
+    columns into data as column name -> (xs, ys), using ingest_array to take ownership of the column memory without
+    copying where possible. Column memory used in place is frozen (see ingest_array), so writing to the DataFrame
+    afterwards raises instead of changing the plotted data.
+    Missing (NaN / None) values are dropped. All columns reference one shared time array, and sparse columns with the
+    same validity mask share one masked copy of it.
+    If gap_jump_factor is specified, numeric columns instead keep their missing values (and the shared time array, so
+    nothing is copied), with their gaps (see GapIndex, with this jump factor) indexed for rendering and consumers.
+    Returns the data and the names of columns (including the time column) that needed a copy."""
+    if time_column is None:
+        time_column = str(df.columns[0])
+    copied_names = []
+    time_dtype = None if pd.api.types.is_datetime64_dtype(df[time_column]) else np.float64  # keep timestamps
+    time_values, time_copied = ingest_array(df[time_column], time_dtype)
+    UniformTimebase.detect(time_values)  # for O(1) index lookups
+    if time_copied:
+        copied_names.append(time_column)
+
+    masked_time_values: Dict[bytes, npt.NDArray[Any]] = {}  # packed validity mask -> time values
+    data: Dict[str, Tuple[npt.NDArray[Any], npt.NDArray[Any]]] = {}
+    for col_name, series in df.items():
+        if col_name == time_column:
+            continue
+        values, copied = ingest_array(series)
+        if gap_jump_factor is not None and np.issubdtype(values.dtype, np.number):
+            GapIndex.build(time_values, values, gap_jump_factor)
+            not_nans = None
+        else:
+            not_nans = pd.notna(values)
+        if not_nans is None or not_nans.all():
+            xs, ys = time_values, values
+        else:  # get rid of nans, which requires a copy
+            mask_key = np.packbits(not_nans).tobytes()
+            if mask_key not in masked_time_values:
+                masked_time_values[mask_key] = time_values[not_nans]
+                masked_time_values[mask_key].flags.writeable = False
+                UniformTimebase.detect(masked_time_values[mask_key])
+            xs, ys = masked_time_values[mask_key], CategoricalCodes.masked(values, not_nans)
+            copied = True
+        if copied:
+            copied_names.append(str(col_name))
+        data[str(col_name)] = (xs, ys)
+    return data, copied_names
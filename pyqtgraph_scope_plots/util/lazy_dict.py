@@ -0,0 +1,69 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Callable, Collection, Dict, Iterator, Mapping, Optional, TypeVar
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+
+class LazyDataDict(Mapping[KeyType, ValueType]):
+    """A read-only mapping over a known set of candidate keys, where each value is computed on first access and
+    memoized. The compute function may return None for keys that have no value (eg, a failed transform), which are
+    then treated as not in the mapping.
+
+    Lookups (get, [], in) only compute the requested key. Iteration and len need to know which keys have values, so
+    compute every candidate key. Consumers that only need some keys should look them up by name."""
+
+    def __init__(
+        self,
+        keys: Collection[KeyType],
+        compute_fn: Callable[[KeyType], Optional[ValueType]],
+        computed: Optional[Mapping[KeyType, ValueType]] = None,
+    ) -> None:
+        """computed optionally provides already-computed values (eg, reused from a previous LazyDataDict)"""
+        self._keys = keys
+        self._compute_fn = compute_fn
+        self._computed: Dict[KeyType, Optional[ValueType]] = (
+            {key: value for key, value in computed.items() if key in keys} if computed is not None else {}
+        )
+
+    def __getitem__(self, key: KeyType) -> ValueType:
+        if key in self._computed:
+            value = self._computed[key]
+        elif key in self._keys:
+            value = self._compute_fn(key)
+            self._computed[key] = value
+        else:
+            value = None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[KeyType]:
+        return iter([key for key in self._keys if key in self])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def computed_items(self) -> Mapping[KeyType, ValueType]:
+        """Returns the values computed so far, without computing anything."""
+        return {key: value for key, value in self._computed.items() if value is not None}
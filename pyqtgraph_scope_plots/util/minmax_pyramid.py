@@ -0,0 +1,166 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import List, Optional, Any, Callable
+
+import numpy as np
+import numpy.typing as npt
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max decimation of a numeric array, for rendering large data sets.
+
+    Level 0 groups BASE_BUCKET samples per bucket, and each following level groups LEVEL_FACTOR buckets of the
+    previous level. Each bucket stores the index of its minimum and maximum sample, so the decimated data is a
+    subset of the original samples and peaks are preserved at any zoom level.
+    Buckets are built once in O(n), and levels are only stored down to a handful of buckets."""
+
+    BASE_BUCKET = 8
+    LEVEL_FACTOR = 4
+
+    def __init__(self, ys: npt.NDArray[Any], prefix: Optional["MinMaxPyramid"] = None) -> None:
+        """Builds the pyramid for ys. If prefix is the pyramid of a prefix of ys (eg, before data was appended),
+        only the trailing buckets are recomputed. This takes over the buffers of prefix, which becomes invalid."""
+        self._len = len(ys)
+        self.valid = True
+        self.bucket_sizes: List[int] = []
+        self._counts: List[int] = []  # buckets per level, buffers may have spare capacity past this
+        self._min_indices: List[npt.NDArray[np.integer[Any]]] = []
+        self._max_indices: List[npt.NDArray[np.integer[Any]]] = []
+
+        index_dtype = np.int32 if len(ys) < np.iinfo(np.int32).max else np.int64
+        if prefix is not None:
+            assert prefix.valid and len(prefix) <= len(ys)
+            prefix.valid = False
+            if prefix._min_indices and prefix._min_indices[0].dtype != index_dtype:
+                prefix = None  # outgrew the index dtype, rebuild everything
+        prefix_len = len(prefix) if prefix is not None else 0
+
+        level = 0
+        bucket_size = self.BASE_BUCKET
+        while True:
+            count = -(-len(ys) // bucket_size)
+            if prefix is not None and level < len(prefix.bucket_sizes):
+                kept = prefix_len // bucket_size  # full buckets of the prefix are unchanged
+                min_indices = self._grown(prefix._min_indices[level], kept, count)
+                max_indices = self._grown(prefix._max_indices[level], kept, count)
+            else:
+                kept = 0
+                min_indices = np.empty(count, dtype=index_dtype)
+                max_indices = np.empty(count, dtype=index_dtype)
+            if level == 0:
+                min_indices[kept:count] = self._reduce(None, ys, kept * bucket_size, bucket_size, np.argmin, np.inf)
+                max_indices[kept:count] = self._reduce(None, ys, kept * bucket_size, bucket_size, np.argmax, -np.inf)
+            else:
+                prev_count = self._counts[-1]
+                prev_min = self._min_indices[-1][kept * self.LEVEL_FACTOR : prev_count]
+                prev_max = self._max_indices[-1][kept * self.LEVEL_FACTOR : prev_count]
+                min_indices[kept:count] = self._reduce(prev_min, ys, 0, self.LEVEL_FACTOR, np.argmin, np.inf)
+                max_indices[kept:count] = self._reduce(prev_max, ys, 0, self.LEVEL_FACTOR, np.argmax, -np.inf)
+            self.bucket_sizes.append(bucket_size)
+            self._counts.append(count)
+            self._min_indices.append(min_indices)
+            self._max_indices.append(max_indices)
+            if count <= self.LEVEL_FACTOR:
+                break
+            level += 1
+            bucket_size *= self.LEVEL_FACTOR
+
+    @staticmethod
+    def _grown(buffer: npt.NDArray[np.integer[Any]], kept: int, count: int) -> npt.NDArray[np.integer[Any]]:
+        """Returns buffer if it can hold count buckets, otherwise a larger (doubled) copy of its first kept buckets,
+        so repeated appends are amortized O(1)."""
+        if len(buffer) >= count:
+            return buffer
+        new_buffer = np.empty(max(count, 2 * len(buffer)), dtype=buffer.dtype)
+        new_buffer[:kept] = buffer[:kept]
+        return new_buffer
+
+    @staticmethod
+    def _reduce(
+        indices: Optional[npt.NDArray[np.integer[Any]]],
+        ys: npt.NDArray[Any],
+        start: int,
+        group_size: int,
+        pick: Callable[..., Any],
+        nan_fill: float,
+    ) -> npt.NDArray[np.integer[Any]]:
+        """Reduces each group of group_size consecutive indices (or samples from start, if indices is None) into
+        the index of the sample picked (argmin or argmax) by pick. NaNs are replaced by nan_fill, since they
+        would otherwise win all comparisons."""
+
+        def filled(values: npt.NDArray[Any]) -> npt.NDArray[Any]:
+            if np.issubdtype(values.dtype, np.floating):
+                return np.where(np.isnan(values), nan_fill, values)
+            return values
+
+        values = ys[start:] if indices is None else ys[indices]
+        count = len(values)
+        full_groups = count // group_size
+        out = np.empty(full_groups + (1 if count % group_size else 0), dtype=np.int64)
+        if full_groups:
+            picked = pick(filled(values[: full_groups * group_size].reshape(full_groups, group_size)), axis=1)
+            if indices is None:
+                out[:full_groups] = picked + np.arange(full_groups) * group_size + start
+            else:
+                grouped_indices = indices[: full_groups * group_size].reshape(full_groups, group_size)
+                out[:full_groups] = grouped_indices[np.arange(full_groups), picked]
+        if count % group_size:
+            picked_tail = pick(filled(values[full_groups * group_size :]))
+            if indices is None:
+                out[-1] = start + full_groups * group_size + picked_tail
+            else:
+                out[-1] = indices[full_groups * group_size + picked_tail]
+        return out
+
+    def __len__(self) -> int:
+        return self._len
+
+    def level_for(self, count: int, width_px: float) -> Optional[int]:
+        """Returns the coarsest level that still has at least one bucket per pixel for count visible samples,
+        or None if the raw samples should be drawn instead."""
+        level = None
+        for i, bucket_size in enumerate(self.bucket_sizes):
+            if count / bucket_size < width_px:
+                break
+            level = i
+        return level
+
+    def level_within(self, count: int, max_buckets: int) -> Optional[int]:
+        """Returns the finest level that has at most max_buckets buckets for count samples (the coarsest level if
+        none do), or None if the raw samples are within max_buckets."""
+        if count <= max_buckets:
+            return None
+        for i, bucket_size in enumerate(self.bucket_sizes):
+            if count / bucket_size <= max_buckets:
+                return i
+        return len(self.bucket_sizes) - 1
+
+    def indices(self, level: int, start: int = 0, end: Optional[int] = None) -> npt.NDArray[np.integer[Any]]:
+        """Returns the sorted sample indices of the min/max envelope at some level, for buckets overlapping the
+        sample range [start, end). The first and last sample of the range are always included."""
+        if end is None:
+            end = self._len
+        if start >= end:
+            return np.array([], dtype=np.int64)
+        bucket_size = self.bucket_sizes[level]
+        bucket_start = start // bucket_size
+        bucket_end = (end - 1) // bucket_size + 1
+        bucket_end = min(bucket_end, self._counts[level])
+        min_indices = self._min_indices[level][bucket_start:bucket_end]
+        max_indices = self._max_indices[level][bucket_start:bucket_end]
+        envelope = np.stack([np.minimum(min_indices, max_indices), np.maximum(min_indices, max_indices)], axis=1)
+        envelope = envelope.ravel()
+        envelope = envelope[(envelope >= start) & (envelope < end)]  # edge buckets may extend past the range
+        return np.concatenate([[start], envelope, [end - 1]]).astype(np.int64)
@@ -0,0 +1,115 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache_dict import IdentityCacheDict
+from .categorical import CategoricalCodes
+from .uniform_timebase import UniformTimebase
+
+
+class RunLengthEncoding:
+    """Tracks data arrays that are run-length encoded: each sample's value holds until the next sample, so only
+    transitions (and a final sample marking the end of the data) need to be stored. This lets state and mode
+    signals scale with the number of transitions instead of the number of samples.
+    Data arrays are plain (xs, ys) arrays, so they work everywhere. Consumers that care about held values (eg,
+    value lookups between samples, step rendering, and CSV export) check is_run_length.
+    Arrays are tracked by identity (of ys), and must be immutable (read-only) to be registered."""
+
+    _encoded = IdentityCacheDict[npt.NDArray[Any], bool]()  # ys -> True if run-length encoded
+
+    @classmethod
+    def encode(
+        cls, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+        """Returns read-only run-length encoded (xs, ys), keeping only the first sample of each run of equal values
+        and the last sample. Categorical codes (see CategoricalCodes) are kept, and used to find runs if present."""
+        if not len(ys):
+            return xs, ys
+        indices = np.concatenate([[0], np.flatnonzero(cls._changes(ys)) + 1])
+        if indices[-1] != len(ys) - 1:  # keep the last sample to mark the end
+            indices = np.append(indices, len(ys) - 1)
+        rle_xs = xs[indices]
+        rle_xs.flags.writeable = False
+        rle_ys = CategoricalCodes.masked(ys, indices)
+        cls._encoded.set(rle_ys, None, [], True)
+        return rle_xs, rle_ys
+
+    @classmethod
+    def encode_appended(
+        cls, prev_ys: npt.NDArray[Any], xs: npt.NDArray[np.float64], ys: npt.NDArray[Any]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+        """Returns read-only (xs, ys) samples to append to run-length encoded prev_ys, keeping only the samples that
+        change from the value held before them, and the last sample to mark the new end. The previous end sample is
+        kept (data is append-only), so data grows by one sample per append plus one per transition."""
+        if not len(ys) or not len(prev_ys):
+            return cls.encode(xs, ys)
+        changes = cls._changes(np.concatenate((prev_ys[-1:], ys)))
+        indices = np.flatnonzero(changes)
+        if not len(indices) or indices[-1] != len(ys) - 1:  # keep the last sample to mark the end
+            indices = np.append(indices, len(ys) - 1)
+        encoded_xs = xs[indices]
+        encoded_xs.flags.writeable = False
+        return encoded_xs, CategoricalCodes.masked(ys, indices)
+
+    @staticmethod
+    def _changes(ys: npt.NDArray[Any]) -> npt.NDArray[np.bool_]:
+        """Returns whether each sample of ys (after the first) differs from the one before it."""
+        if CategoricalCodes.of(ys) is not None or not np.issubdtype(ys.dtype, np.number):
+            codes, _ = CategoricalCodes.encode(ys)
+            changes: npt.NDArray[np.bool_] = codes[1:] != codes[:-1]
+        else:
+            changes = (ys[1:] != ys[:-1]) & ~(np.isnan(ys[1:]) & np.isnan(ys[:-1]))
+        return changes
+
+    @classmethod
+    def from_transitions(
+        cls, times: npt.ArrayLike, values: npt.ArrayLike, end: Optional[float] = None
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]:
+        """Returns read-only run-length encoded (xs, ys) from transition times and the values from each transition,
+        with the last value held until end (if specified)."""
+        xs = np.array(times, dtype=np.float64)
+        ys = np.array(values)
+        if end is not None and len(ys):
+            xs = np.append(xs, end)
+            ys = np.append(ys, ys[-1:])
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        cls._encoded.set(ys, None, [], True)
+        return xs, ys
+
+    @classmethod
+    def is_run_length(cls, ys: npt.NDArray[Any]) -> bool:
+        return cls._encoded.get(ys, None, [], False)
+
+    @classmethod
+    def register_derived(cls, source: npt.NDArray[Any], derived: npt.NDArray[Any]) -> None:
+        """Registers derived (eg, a cast, pointwise transform, or extension of source, so still holding each value
+        until the next sample) as run-length encoded, if source is."""
+        if cls.is_run_length(source) and not derived.flags.writeable:
+            cls._encoded.set(derived, None, [], True)
+
+    @classmethod
+    def index_at(cls, xs: npt.NDArray[np.float64], ys: npt.NDArray[Any], x: float) -> Optional[int]:
+        """Returns the index of the sample whose value is at x: the sample exactly at x, or for run-length encoded
+        data, the sample whose value is held at x. Returns None if there is no value at x."""
+        index = UniformTimebase.bisect_left(xs, x)
+        if index < len(xs) and xs[index] == x:  # found exact match
+            return index
+        if 0 < index < len(xs) and cls.is_run_length(ys):
+            return index - 1
+        return None
@@ -0,0 +1,136 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+import math
+from typing import Any, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .array_meta import ArrayMeta
+from .cache_dict import IdentityCacheDict
+
+
+class UniformTimebase:
+    """Tracks x arrays detected as uniformly sampled (x[i] ~= t0 + i * dt, within a tolerance of dt), so index lookups
+    on them are O(1) arithmetic instead of a bisect over Python-level indexing.
+
+    Lookups are exact (identical to bisect on the actual values): the arithmetic estimate is corrected against the
+    neighboring samples, which is O(1) since samples deviate from the ideal timebase by much less than dt.
+    Arrays are tracked by identity, and must be immutable (read-only) to be registered."""
+
+    TOLERANCE = 1e-3  # max deviation from the ideal timebase, as a fraction of dt
+    _DETECT_CHUNK = 1 << 20  # samples checked per pass, to bound temporary memory
+
+    # xs -> (t0, dt)
+    _timebases = IdentityCacheDict[npt.NDArray[Any], Tuple[float, float]]()
+
+    @classmethod
+    def detect(cls, xs: npt.NDArray[Any]) -> Optional[Tuple[float, float]]:
+        """If xs is read-only and uniformly sampled, registers and returns its (t0, dt). Results are cached."""
+        if xs.flags.writeable or xs.ndim != 1 or len(xs) < 2 or not np.issubdtype(xs.dtype, np.number):
+            return None
+        timebase = cls._timebases.get(xs, None, [])
+        if timebase is not None:
+            return timebase
+        meta = ArrayMeta.cached(xs)
+        if meta is not None and not meta.sorted:  # already known not to be a timebase
+            return None
+        t0, dt = float(xs[0]), float(xs[-1] - xs[0]) / (len(xs) - 1)
+        if not dt > 0 or not math.isfinite(dt) or not cls._fits(xs, 0, t0, dt):
+            return None
+        cls._timebases.set(xs, None, [], (t0, dt))
+        return t0, dt
+
+    @classmethod
+    def _fits(cls, xs: npt.NDArray[Any], start: int, t0: float, dt: float) -> bool:
+        """Returns whether xs[start:] is within tolerance of the timebase (t0, dt)."""
+        for chunk_start in range(start, len(xs), cls._DETECT_CHUNK):
+            chunk = xs[chunk_start : chunk_start + cls._DETECT_CHUNK]
+            ideal = t0 + np.arange(chunk_start, chunk_start + len(chunk)) * dt
+            if not np.all(np.abs(chunk - ideal) <= cls.TOLERANCE * dt):
+                return False
+        return True
+
+    @classmethod
+    def of(cls, xs: npt.NDArray[Any]) -> Optional[Tuple[float, float]]:
+        """Returns the (t0, dt) of xs if it was registered as uniformly sampled, without detecting."""
+        return cls._timebases.get(xs, None, [])
+
+    @classmethod
+    def register_shifted(cls, xs: npt.NDArray[Any], shifted: npt.NDArray[Any], shift: float) -> None:
+        """Registers shifted (xs + shift, eg timeshifted xs), if xs is uniformly sampled."""
+        timebase = cls.of(xs)
+        if timebase is not None and not shifted.flags.writeable:
+            cls._timebases.set(shifted, None, [], (timebase[0] + shift, timebase[1]))
+
+    @classmethod
+    def register_extended(cls, prefix: Optional[npt.NDArray[Any]], xs: npt.NDArray[Any]) -> None:
+        """Registers xs (prefix with appended samples), if prefix is uniformly sampled and the appended samples
+        continue its timebase. Only the appended samples are checked."""
+        cls.register_rolled(prefix, xs, 0)
+
+    @classmethod
+    def register_rolled(cls, prev: Optional[npt.NDArray[Any]], xs: npt.NDArray[Any], dropped: int) -> None:
+        """Registers xs (prev with its first dropped samples removed and samples appended, eg a rolling window), if
+        prev is uniformly sampled and the appended samples continue its timebase. Only the appended samples are
+        checked."""
+        if prev is None or xs.flags.writeable:
+            return
+        timebase = cls.of(prev)
+        if timebase is None:
+            return
+        t0, dt = timebase[0] + dropped * timebase[1], timebase[1]
+        if cls._fits(xs, max(len(prev) - dropped, 0), t0, dt):
+            cls._timebases.set(xs, None, [], (t0, dt))
+
+    @classmethod
+    def bisect_left(cls, xs: npt.NDArray[Any], x: float, lo: int = 0, hi: Optional[int] = None) -> int:
+        """Equivalent to bisect.bisect_left, in O(1) for registered uniformly-sampled xs."""
+        if hi is None:
+            hi = len(xs)
+        timebase = cls.of(xs)
+        if timebase is None:
+            return bisect.bisect_left(xs, x, lo, hi)
+        index = cls._estimate(timebase, x, lo, hi)
+        while index > lo and xs[index - 1] >= x:
+            index -= 1
+        while index < hi and xs[index] < x:
+            index += 1
+        return index
+
+    @classmethod
+    def bisect_right(cls, xs: npt.NDArray[Any], x: float, lo: int = 0, hi: Optional[int] = None) -> int:
+        """Equivalent to bisect.bisect_right, in O(1) for registered uniformly-sampled xs."""
+        if hi is None:
+            hi = len(xs)
+        timebase = cls.of(xs)
+        if timebase is None:
+            return bisect.bisect_right(xs, x, lo, hi)
+        index = cls._estimate(timebase, x, lo, hi)
+        while index > lo and xs[index - 1] > x:
+            index -= 1
+        while index < hi and xs[index] <= x:
+            index += 1
+        return index
+
+    @staticmethod
+    def _estimate(timebase: Tuple[float, float], x: float, lo: int, hi: int) -> int:
+        """Returns the insertion index estimated from the timebase, clamped to [lo, hi]."""
+        t0, dt = timebase
+        estimate = (x - t0) / dt
+        if not math.isfinite(estimate):
+            return lo if estimate < 0 or math.isnan(estimate) else hi
+        return min(max(math.ceil(estimate), lo), hi)
@@ -0,0 +1,144 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import time
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, QTimer, Signal
+
+DataMapping = Mapping[str, Tuple[npt.ArrayLike, npt.ArrayLike]]
+
+
+class UpdateScheduler(QObject):
+    """Coalesces data updates, which producers may push at any rate and from any thread, into at most one update
+    per frame at a target rate, run on the thread owning this object (normally the GUI thread).
+
+    Pending updates are merged: the latest data items and the latest set_data replace earlier pending ones
+    (which are counted as dropped), and appends are concatenated per data name (counted as merged).
+    A set_data discards earlier pending appends, since it replaces all data."""
+
+    class Metrics(NamedTuple):
+        submitted: int  # updates pushed by producers
+        executed: int  # coalesced updates run
+        merged: int  # updates folded into a pending update, with no data lost
+        dropped: int  # updates superseded by a later update before being run
+
+    _sigSubmitted = Signal()  # internal, to start the timer from the owning thread
+
+    def __init__(
+        self,
+        set_data_items_fn: Callable[[Any], None],
+        set_data_fn: Callable[[DataMapping], None],
+        append_data_fn: Callable[[DataMapping], None],
+        rate_hz: float = 60,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._set_data_items_fn = set_data_items_fn
+        self._set_data_fn = set_data_fn
+        self._append_data_fn = append_data_fn
+        self._period_s = 1 / rate_hz
+        self._last_run_s = 0.0
+
+        self._mutex = QMutex()  # guards all state below
+        self._pending_data_items: Optional[Any] = None
+        self._pending_data: Optional[DataMapping] = None
+        self._pending_appends: Dict[str, List[Tuple[npt.ArrayLike, npt.ArrayLike]]] = {}  # ordered chunks per name
+        self._pending_count = 0  # submissions contributing to the pending update
+        self._submitted = 0
+        self._executed = 0
+        self._merged = 0
+        self._dropped = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._sigSubmitted.connect(self._schedule)  # queued if submitted from another thread
+
+    def set_rate(self, rate_hz: float) -> None:
+        self._period_s = 1 / rate_hz
+
+    def metrics(self) -> "UpdateScheduler.Metrics":
+        with QMutexLocker(self._mutex):
+            return self.Metrics(self._submitted, self._executed, self._merged, self._dropped)
+
+    def set_data_items(self, data_items: Any) -> None:
+        with QMutexLocker(self._mutex):
+            if self._pending_data_items is not None:
+                self._dropped += 1
+            self._pending_data_items = data_items
+            self._add_submission()
+        self._sigSubmitted.emit()
+
+    def set_data(self, data: DataMapping) -> None:
+        with QMutexLocker(self._mutex):
+            self._dropped += (self._pending_data is not None) + sum(
+                len(chunks) for chunks in self._pending_appends.values()
+            )
+            self._pending_data = data
+            self._pending_appends = {}
+            self._add_submission()
+        self._sigSubmitted.emit()
+
+    def append_data(self, data: DataMapping) -> None:
+        with QMutexLocker(self._mutex):
+            if self._pending_count:
+                self._merged += 1
+            for name, chunk in data.items():
+                self._pending_appends.setdefault(name, []).append(chunk)
+            self._add_submission()
+        self._sigSubmitted.emit()
+
+    def _add_submission(self) -> None:
+        """Updates counters for a submission, the mutex must be held."""
+        self._submitted += 1
+        self._pending_count += 1
+
+    def _schedule(self) -> None:
+        """Starts the timer for the next frame, if not already pending."""
+        if self._timer.isActive():
+            return
+        delay_s = self._last_run_s + self._period_s - time.monotonic()
+        self._timer.start(max(int(delay_s * 1000), 0))
+
+    def flush(self) -> None:
+        """Runs the pending update now, if any. Must be called from the owning thread."""
+        self._timer.stop()
+        with QMutexLocker(self._mutex):
+            if not self._pending_count:
+                return
+            data_items, self._pending_data_items = self._pending_data_items, None
+            data, self._pending_data = self._pending_data, None
+            appends, self._pending_appends = self._pending_appends, {}
+            self._pending_count = 0
+            self._executed += 1
+
+        self._last_run_s = time.monotonic()
+        if data_items is not None:
+            self._set_data_items_fn(data_items)
+        if data is not None:
+            self._set_data_fn(data)
+        if appends:
+            self._append_data_fn({name: self._concatenate(chunks) for name, chunks in appends.items()})
+
+    @staticmethod
+    def _concatenate(chunks: List[Tuple[npt.ArrayLike, npt.ArrayLike]]) -> Tuple[npt.ArrayLike, npt.ArrayLike]:
+        if len(chunks) == 1:
+            return chunks[0]
+        return (
+            np.concatenate([np.asarray(xs) for xs, _ in chunks]),
+            np.concatenate([np.asarray(ys) for _, ys in chunks]),
+        )
@@ -0,0 +1,68 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .array_meta import ArrayMeta
+
+PRECISION_TOLERANCE = 1e-5  # max rounding error of a lossy cast, as a fraction of the value span
+
+
+def cast_values(ys: npt.NDArray[Any], dtype: npt.DTypeLike) -> Optional[npt.NDArray[Any]]:
+    """Returns ys cast to dtype if the values are representable in it, otherwise None.
+    Casts to integer dtypes must be exact: values must be integral, finite, and within range.
+    Casts to floating dtypes must not overflow, and rounding errors must be within PRECISION_TOLERANCE of the value
+    span (or magnitude, for constant values), so eg 16-bit ADC values fit exactly in float32, while small variations
+    on a large offset (like epoch timestamps) are rejected.
+    Non-numeric ys are never cast."""
+    target = np.dtype(dtype)
+    if ys.dtype == target:
+        return ys
+    if not np.issubdtype(ys.dtype, np.number) or not np.issubdtype(target, np.number):
+        return None
+    if not len(ys):
+        return ys.astype(target)
+
+    meta = ArrayMeta.of(ys)  # cached, so the checks here and later consumers (eg, autorange) skip redundant passes
+    if meta is None:  # eg, complex
+        return None
+    if np.issubdtype(target, np.integer):
+        if not meta.all_finite:
+            return None
+        info = np.iinfo(target)
+        if meta.finite_min < info.min or meta.finite_max > info.max:
+            return None
+        result = ys.astype(target)
+        return result if np.array_equal(result, ys) else None
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        result = ys.astype(target)
+    if meta.all_finite:
+        if not np.all(np.isfinite(result)):  # overflowed to inf
+            return None
+        error = np.max(np.abs(result.astype(np.float64) - ys.astype(np.float64)))
+    else:
+        ys_finite = np.isfinite(ys)
+        if not np.array_equal(np.isfinite(result), ys_finite):  # overflowed to inf
+            return None
+        if not np.any(ys_finite):
+            return result
+        error = np.max(np.abs(result[ys_finite].astype(np.float64) - ys[ys_finite].astype(np.float64)))
+    scale = meta.finite_max - meta.finite_min
+    if scale == 0:
+        scale = abs(meta.finite_min)
+    return result if error <= PRECISION_TOLERANCE * scale else None
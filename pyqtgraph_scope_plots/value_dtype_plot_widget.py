@@ -0,0 +1,163 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from functools import partial
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QMenu
+from pydantic import BaseModel
+
+from .multi_plot_widget import MultiPlotWidget
+from .signals_table import ContextMenuSignalsTable
+from .util import BaseTopModel, DataTopModel, HasSaveLoadDataConfig, LazyDataDict
+
+
+class ValueDtypeStateModel(BaseModel):
+    value_dtype: Optional[str] = None  # default storage dtype, empty to keep the dtype values are provided in
+
+
+class ValueDtypeDataStateModel(DataTopModel):
+    value_dtype: Optional[str] = None  # storage dtype for this data item, empty to use the default
+
+
+class MemoryReportRow(NamedTuple):
+    data_name: str
+    dtype: str  # dtype values are actually stored in
+    stored_bytes: int  # values, including transformed copies
+    float64_bytes: int  # the same values, if stored as float64
+
+
+class ValueDtypePlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
+    """Adds a storage dtype policy for data values (ys), globally or per data item, eg float32 or int16 for ADC
+    values, to reduce memory compared to float64. The policy applies to set, ingested, appended, and transformed
+    values, which are only cast if representable in the dtype (see cast_values), otherwise keeping their dtype.
+    Digital bus words are bit-packed lines rather than values, so they keep their dtype.
+    Stats are still calculated in float64.
+    Changing the policy re-casts the current values, but values already narrowed are not restored to their original
+    precision until data is set again."""
+
+    _MODEL_BASES = [ValueDtypeStateModel]
+    _DATA_MODEL_BASES = [ValueDtypeDataStateModel]
+
+    VALUE_DTYPES = ["float64", "float32", "int32", "int16", "uint16", "int8", "uint8"]  # offered in the UI
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self._default_value_dtype: Optional[np.dtype[Any]] = None
+        self._value_dtypes: Dict[str, np.dtype[Any]] = {}  # data name -> dtype, overriding the default
+        super().__init__(*args, **kwargs)
+
+    def _write_model(self, model: BaseModel) -> None:
+        assert isinstance(model, BaseTopModel) and isinstance(model, ValueDtypeStateModel)
+        super()._write_model(model)
+        model.value_dtype = self._default_value_dtype.name if self._default_value_dtype is not None else ""
+        for data_name, data_model in model.data.items():
+            assert isinstance(data_model, ValueDtypeDataStateModel)
+            dtype = self._value_dtypes.get(data_name, None)
+            data_model.value_dtype = dtype.name if dtype is not None else ""
+
+    def _load_model(self, model: BaseModel) -> None:
+        assert isinstance(model, BaseTopModel) and isinstance(model, ValueDtypeStateModel)
+        super()._load_model(model)
+        if model.value_dtype is not None:
+            self.set_default_value_dtype(model.value_dtype or None, update=False)
+        for data_name, data_model in model.data.items():
+            assert isinstance(data_model, ValueDtypeDataStateModel)
+            if data_model.value_dtype is not None:
+                self.set_value_dtype([data_name], data_model.value_dtype or None, update=False)
+
+    def _value_dtype(self, data_name: str) -> Optional[np.dtype[Any]]:
+        return self._value_dtypes.get(data_name, self._default_value_dtype)
+
+    def set_default_value_dtype(self, dtype: Optional[npt.DTypeLike], update: bool = True) -> None:
+        """Sets the storage dtype for data items without their own, or None to keep the dtype values are provided in.
+        Optionally, updating can be disabled for performance, for example to batch-update after a bunch of ops."""
+        self._default_value_dtype = np.dtype(dtype) if dtype is not None else None
+        if update:
+            self._recast_values([data_name for data_name in self._raw_data if data_name not in self._value_dtypes])
+
+    def set_value_dtype(self, data_names: List[str], dtype: Optional[npt.DTypeLike], update: bool = True) -> None:
+        """Sets the storage dtype for the specified data names, or None to use the default."""
+        for data_name in data_names:
+            if dtype is not None:
+                self._value_dtypes[data_name] = np.dtype(dtype)
+            else:
+                self._value_dtypes.pop(data_name, None)
+        if update:
+            self._recast_values(data_names)
+
+    def _recast_values(self, data_names: List[str]) -> None:
+        """Re-casts the raw values of data_names per the current policy, and re-processes them."""
+        data_names = [data_name for data_name in data_names if data_name in self._raw_data]
+        if not data_names:
+            return
+        raw_data = dict(self._raw_data)
+        for data_name in data_names:
+            xs, ys = raw_data[data_name]
+            raw_data[data_name] = (xs, self._to_value_array(data_name, ys))
+        self._raw_data = raw_data
+        self._update_plots(data_names)
+        self.sigDataUpdated.emit()
+
+    def memory_report(self) -> List[MemoryReportRow]:
+        """Returns the memory used by the values of each data item, counting transformed copies that have been
+        computed (without computing any), compared against float64 storage. x values are not included, since they
+        are float64 regardless of policy and typically shared between data items."""
+        computed_data = self._data.computed_items() if isinstance(self._data, LazyDataDict) else self._data
+        rows = []
+        for data_name, (_, ys) in self._raw_data.items():
+            arrays = [ys]
+            transformed = computed_data.get(data_name, None)
+            if transformed is not None and transformed[1] is not ys:
+                arrays.append(transformed[1])
+            stored_bytes = sum(arr.nbytes for arr in arrays)
+            float64_bytes = sum(
+                len(arr) * np.dtype(np.float64).itemsize if np.issubdtype(arr.dtype, np.number) else arr.nbytes
+                for arr in arrays
+            )
+            rows.append(MemoryReportRow(data_name, ys.dtype.name, stored_bytes, float64_bytes))
+        return rows
+
+    def memory_report_text(self) -> str:
+        """Returns the memory report as human-readable text, with a total."""
+        rows = self.memory_report()
+        lines = [f"{row.data_name}: {row.dtype}, {row.stored_bytes / 1e6:.2f} MB" for row in rows]
+        stored_total = sum(row.stored_bytes for row in rows)
+        float64_total = sum(row.float64_bytes for row in rows)
+        lines.append(f"Total: {stored_total / 1e6:.2f} MB ({float64_total / 1e6:.2f} MB as float64)")
+        return "\n".join(lines)
+
+
+class ValueDtypeSignalsTable(ContextMenuSignalsTable):
+    """Mixin into SignalsTable that adds a context menu to set the storage dtype of the selected data items.
+    The plots must be a ValueDtypePlotWidget."""
+
+    def _populate_context_menu(self, menu: QMenu) -> None:
+        super()._populate_context_menu(menu)
+        dtype_menu = menu.addMenu("Set Storage Type")
+        default_action = QAction("Default", dtype_menu)
+        default_action.triggered.connect(partial(self._on_set_value_dtype, None))
+        dtype_menu.addAction(default_action)
+        for dtype in ValueDtypePlotWidget.VALUE_DTYPES:
+            action = QAction(dtype, dtype_menu)
+            action.triggered.connect(partial(self._on_set_value_dtype, dtype))
+            dtype_menu.addAction(action)
+
+    def _on_set_value_dtype(self, dtype: Optional[str]) -> None:
+        assert isinstance(self._plots, ValueDtypePlotWidget)
+        data_names = list(self._data_items.keys())
+        selected_data_names = [data_names[item.row()] for item in self.selectedItems()]
+        self._plots.set_value_dtype(selected_data_names, dtype)
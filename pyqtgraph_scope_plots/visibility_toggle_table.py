@@ -11,7 +11,7 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
-from typing import List, Any, Set, Optional
+from typing import List, Any, Set, Optional, Collection
 
 from PySide6.QtCore import QSignalBlocker
 from PySide6.QtGui import Qt
@@ -31,9 +31,8 @@ class VisibilityPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
     _DATA_MODEL_BASES = [VisibilityDataStateModel]
 
     def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-
         self._hidden_data: Set[str] = set()  # set of data traces that are invisible
+        super().__init__(*args, **kwargs)
 
     def _write_model(self, model: BaseModel) -> None:
         assert isinstance(model, BaseTopModel)
@@ -67,9 +66,23 @@ class VisibilityPlotWidget(MultiPlotWidget, HasSaveLoadDataConfig):
                         item.hide()
                     else:
                         item.show()
+                if not hidden and data_item in self._data:  # hidden data is not updated, catch up
+                    plot_item.update_data({data_item: self._data[data_item]})
+            if not hidden:
+                self.sigDataUpdated.emit()  # newly displayed data may now be processed, eg for stats
+
+    def _displayed_data_names(self) -> Set[str]:
+        return super()._displayed_data_names() - self._hidden_data
+
+    def _update_plots(self, data_names: Optional[Collection[str]] = None) -> None:
+        super()._update_plots(data_names)
+        self._apply_hidden_data()
+
+    def _update_plot_item_data_items(self) -> None:
+        super()._update_plot_item_data_items()
+        self._apply_hidden_data()  # for graphics newly generated
 
-    def _update_plots(self) -> None:
-        super()._update_plots()
+    def _apply_hidden_data(self) -> None:
         for data_item in self._hidden_data:
             plot_item = self._data_name_to_plot_item.get(data_item, None)
             if plot_item is None:
@@ -12,13 +12,12 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 from abc import abstractmethod
-import bisect
 from typing import List, Tuple, Optional, Literal, Union, cast, Any, Dict
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import QSize, Signal, QPoint
-from PySide6.QtGui import QColor, QDragMoveEvent, QDragLeaveEvent, QDropEvent, Qt, QAction
+from PySide6.QtCore import QSize, Signal, QPoint, QObject, QEvent
+from PySide6.QtGui import QColor, QDragMoveEvent, QDragLeaveEvent, QDropEvent, Qt, QAction, QShowEvent, QHideEvent
 from PySide6.QtWidgets import QMessageBox, QWidget, QTableWidgetItem, QMenu
 from numpy import typing as npt
 from pydantic import BaseModel
@@ -26,7 +25,7 @@ from pydantic import BaseModel
 from .graphics_collections import ScatterItemCollection
 from .interactivity_mixins import LiveCursorPlot
 from .multi_plot_widget import DragTargetOverlay, MultiPlotWidget, LinkedMultiPlotWidget
-from .util import HasSaveLoadConfig, MixinColsTable
+from .util import HasSaveLoadConfig, MixinColsTable, UniformTimebase
 from .signals_table import HasRegionSignalsTable, DraggableSignalsTable, SignalsTable
 
 
@@ -75,8 +74,13 @@ class XyPlotWidget(BaseXyPlot, pg.PlotWidget):  # type: ignore[misc]
         self._xys: List[Tuple[str, str]] = []
         self._xy_curves: Dict[Tuple[str, str], List[pg.PlotCurveItem]] = {}
         self._xy_colors: Dict[Tuple[str, str], QColor] = {}  # empty entry if not specified
+        # while hidden or minimized, data updates are deferred and caught up when visible
+        self._xys_suspended = False
+        self._xys_stale = False
+        self._watched_window: Optional[QWidget] = None
 
         plots.sigDataUpdated.connect(self._update_datasets)
+        plots.sigDataAppended.connect(self._update_xys)  # curves are unchanged, only update the data
         if isinstance(self._plots, LinkedMultiPlotWidget):
             plots.sigCursorRangeChanged.connect(self._update_xys)
 
@@ -111,6 +115,29 @@ class XyPlotWidget(BaseXyPlot, pg.PlotWidget):  # type: ignore[misc]
         if model.x_range == "auto" or model.y_range == "auto":
             viewbox.enableAutoRange(x=model.x_range == "auto" or None, y=model.y_range == "auto" or None)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        window = self.window()
+        if window is not self._watched_window:  # to get minimize / restore events
+            window.installEventFilter(self)
+            self._watched_window = window
+        self._set_xys_suspended(window.isMinimized())
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        super().hideEvent(event)
+        self._set_xys_suspended(True)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._watched_window and event.type() == QEvent.Type.WindowStateChange:
+            self._set_xys_suspended(self.window().isMinimized() or not self.isVisible())
+        return super().eventFilter(watched, event)  # type: ignore[no-any-return]
+
+    def _set_xys_suspended(self, suspended: bool) -> None:
+        self._xys_suspended = suspended
+        if not suspended and self._xys_stale:
+            self._xys_stale = False
+            self._update_xys()
+
     def _color_of(self, x_name: str, y_name: str) -> QColor:
         color = self._xy_colors.get((x_name, y_name))
         if color is not None:
@@ -149,9 +176,11 @@ class XyPlotWidget(BaseXyPlot, pg.PlotWidget):  # type: ignore[misc]
 
         if (xt_hi - xt_lo) != (yt_hi - yt_lo):
             return None
+        if x_ts is y_ts and xt_lo == yt_lo:  # shared timebase (eg, columns of one DataFrame), trivially correlated
+            return (xt_lo, xt_hi), (yt_lo, yt_hi)
         x_indices = x_ts[xt_lo:xt_hi]
         y_indices = y_ts[yt_lo:yt_hi]
-        if max(abs(y_indices - x_indices)) > (y_indices[1] - y_indices[0]) / 1000:
+        if np.max(np.abs(y_indices - x_indices)) > (y_indices[1] - y_indices[0]) / 1000:
             return None
         return (xt_lo, xt_hi), (yt_lo, yt_hi)
 
@@ -184,7 +213,10 @@ class XyPlotWidget(BaseXyPlot, pg.PlotWidget):  # type: ignore[misc]
 
     def _update_xys(self) -> None:
         """Updates the data points for XYs that have already been created.
-        Efficient when only the data has changed."""
+        Efficient when only the data has changed. Deferred while suspended (hidden or minimized)."""
+        if self._xys_suspended:
+            self._xys_stale = True
+            return
         region = HasRegionSignalsTable._region_of_plot(self._plots)
         data = self._plots._data
         for (x_name, y_name), xy_curves in self._xy_curves.items():
@@ -230,10 +262,10 @@ class XyPlotWidget(BaseXyPlot, pg.PlotWidget):  # type: ignore[misc]
             xy_curves = self._xy_curves.get((x_name, y_name), [])
             if not any(xy_curve.isVisible() for xy_curve in xy_curves):
                 continue
-            x_ts, x_ys = self._plots._data.get(x_name, ([], []))
-            y_ts, y_ys = self._plots._data.get(y_name, ([], []))
-            x_index = bisect.bisect_left(x_ts, t)
-            y_index = bisect.bisect_left(y_ts, t)
+            x_ts, x_ys = self._plots._data.get(x_name, (np.array([]), np.array([])))
+            y_ts, y_ys = self._plots._data.get(y_name, (np.array([]), np.array([])))
+            x_index = UniformTimebase.bisect_left(x_ts, t)
+            y_index = UniformTimebase.bisect_left(y_ts, t)
             if x_index >= len(x_ts) or y_index >= len(y_ts) or x_ts[x_index] != t or y_ts[y_index] != t:
                 continue
             outputs.append((x_ys[x_index], y_ys[y_index], self._color_of(x_name, y_name)))
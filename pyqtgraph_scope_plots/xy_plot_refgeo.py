@@ -27,7 +27,7 @@ from pydantic import BaseModel, model_validator
 from .transforms_signal_table import TransformsPlotWidget
 from .code_input_dialog import CodeInputDialog
 from .signals_table import SignalsTable, HasRegionSignalsTable
-from .util import HasSaveLoadConfig
+from .util import HasSaveLoadConfig, LazyDataDict
 from .xy_plot import XyPlotWidget, XyPlotTable, ContextMenuXyPlotTable, XyWindowModel, DeleteableXyPlotTable
 from .xy_plot_visibility import VisibilityXyPlotTable
 
@@ -340,15 +340,17 @@ class RefGeoXyPlotWidget(XyPlotWidget, HasSaveLoadConfig):
     def _update_refgeo(self) -> None:
         region = HasRegionSignalsTable._region_of_plot(self._plots)
 
-        def get_data_region(ts: npt.NDArray[np.float64], ys: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-            """Given ts and xs of a data item, return ys bounded to the input region."""
+        def get_data_region(name: str) -> npt.NDArray[np.float64]:
+            """Given a data item, return ys bounded to the input region."""
+            ts, ys = self._plots._data[name]
             ts_lo, ts_hi = HasRegionSignalsTable._indices_of_region(ts, region)
             if ts_lo is None or ts_hi is None:
                 return np.array([])
             else:
                 return ys[ts_lo:ts_hi]
 
-        filtered_data = {name: get_data_region(ts, ys) for name, (ts, ys) in self._plots._data.items()}
+        # only data referenced by the expressions is processed
+        filtered_data = LazyDataDict(self._plots._data.keys(), get_data_region)
 
         # draw reference geometry
         last_refgeo_err = any(
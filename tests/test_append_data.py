@@ -0,0 +1,137 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import MultiPlotWidget, StatsSignalsTable, TimeshiftPlotWidget, TransformsPlotWidget
+from pyqtgraph_scope_plots.util import AppendableArray, MinMaxPyramid, RunLengthEncoding
+from .common_testdata import DATA_ITEMS, DATA
+
+
+def test_appendable_array() -> None:
+    arr1 = AppendableArray.extend(None, [0.0, 1.0])
+    arr2 = AppendableArray.extend(arr1, [2.0])
+    assert not arr2.flags.writeable
+    assert arr2.tolist() == [0.0, 1.0, 2.0]
+    assert arr1.tolist() == [0.0, 1.0]  # views are never modified
+    assert AppendableArray.prefix_of(arr2) is arr1
+    assert np.shares_memory(arr1, arr2)  # appended in place
+
+    arr2_branch = AppendableArray.extend(arr1, [5.0])  # arr1 is no longer the latest view, must copy
+    assert arr2_branch.tolist() == [0.0, 1.0, 5.0]
+    assert arr2.tolist() == [0.0, 1.0, 2.0]
+    assert not np.shares_memory(arr2, arr2_branch)
+
+    arr_upcast = AppendableArray.extend(AppendableArray.extend(None, [1, 2]), [2.5])
+    assert arr_upcast.tolist() == [1.0, 2.0, 2.5]
+
+
+def test_pyramid_extended() -> None:
+    ys = np.sin(np.linspace(0, 100, 10007)) * np.linspace(0, 1, 10007)
+    ys[5000] = np.nan
+    prefix_pyramid = MinMaxPyramid(ys[:3001])
+    pyramid = MinMaxPyramid(ys, prefix_pyramid)
+    assert not prefix_pyramid.valid
+    reference = MinMaxPyramid(ys)
+    assert pyramid.bucket_sizes == reference.bucket_sizes
+    for level in range(len(reference.bucket_sizes)):
+        assert pyramid.indices(level).tolist() == reference.indices(level).tolist()
+
+
+def test_append_data(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data(DATA)
+    qtbot.addWidget(plots)
+
+    with qtbot.waitSignal(plots.sigDataAppended) as blocker:
+        plots.append_data({"0": ([2.1, 2.2], [0.5, 0.25]), "new": ([0], [1])})
+    assert blocker.args == [["0", "new"]]
+    assert plots._data["0"][0].tolist() == [0, 0.1, 1, 2, 2.1, 2.2]
+    assert plots._data["0"][1].tolist() == [0.01, 1, 1, 0, 0.5, 0.25]
+    assert plots._data["1"] is not None and plots._data["1"][1].tolist() == [0.5, 0.25, 0.5]  # untouched
+    assert plots._data["new"][1].tolist() == [1]
+
+    prev_xs = plots._data["0"][0]
+    plots.append_data({"0": ([3], [0.75])})
+    assert plots._data["0"][1].tolist() == [0.01, 1, 1, 0, 0.5, 0.25, 0.75]
+    assert AppendableArray.prefix_of(plots._data["0"][0]) is prev_xs
+
+
+def test_append_data_run_length(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data({"0": RunLengthEncoding.from_transitions([0, 1], [5.0, 6.0], end=2)})
+    qtbot.addWidget(plots)
+
+    plots.append_data({"0": ([3, 4, 5], [6.0, 6.0, 6.0])})  # no transitions, only the new end is stored
+    assert plots._raw_data["0"][0].tolist() == [0, 1, 2, 5]
+    plots.append_data({"0": ([6, 7, 8, 9], [6.0, 7.0, 7.0, 5.0])})  # only transitions and the end are stored
+    assert plots._raw_data["0"][0].tolist() == [0, 1, 2, 5, 7, 9]
+    assert plots._raw_data["0"][1].tolist() == [5, 6, 6, 6, 7, 5]
+    assert RunLengthEncoding.is_run_length(plots._raw_data["0"][1])
+    assert RunLengthEncoding.index_at(*plots._raw_data["0"], 8) == 4  # held value
+
+
+def test_append_data_timeshift(qtbot: QtBot) -> None:
+    plots = TimeshiftPlotWidget()
+    plots.show_data_items([("0", QColor("yellow"), MultiPlotWidget.PlotType.DEFAULT)])
+    plots.set_data({"0": DATA["0"]})
+    qtbot.addWidget(plots)
+    plots.set_timeshift(["0"], 1)
+    plots.append_data({"0": ([3, 4], [0.5, 0.25])})
+    assert plots._data["0"][0].tolist() == [1, 1.1, 2, 3, 4, 5]
+
+
+def test_append_data_transform(qtbot: QtBot) -> None:
+    plots = TransformsPlotWidget()
+    plots.show_data_items(
+        [
+            ("0", QColor("yellow"), MultiPlotWidget.PlotType.DEFAULT),
+            ("1", QColor("orange"), MultiPlotWidget.PlotType.DEFAULT),
+        ]
+    )
+    plots.set_data({"0": DATA["0"], "1": DATA["1"]})
+    qtbot.addWidget(plots)
+    plots.set_transform(["0"], "x * 2")
+    plots.append_data({"0": ([3], [0.5])})
+    assert plots._data["0"][1].tolist() == [0.02, 2, 2, 0, 1]
+
+    plots.set_transform(["0"], "")
+    plots.set_transform(["1"], "x + data['0']")
+    assert plots._data["1"][1].tolist() == [0.51, 1.25, 0.5]
+    plots.append_data({"1": ([3], [0.25])})
+    assert plots._data["1"][1].tolist() == [0.51, 1.25, 0.5, 0.75]
+
+
+def test_append_data_stats(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    table = StatsSignalsTable(plots)
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data(DATA)
+    qtbot.addWidget(table)
+    qtbot.waitUntil(lambda: table.item(0, table.COL_STAT + table.COL_STAT_MIN).text() != "")
+
+    plots.append_data({"0": ([3, 4], [2, -1])})
+    all_ys = np.array([0.01, 1, 1, 0, 2, -1])
+    qtbot.waitUntil(lambda: float(table.item(0, table.COL_STAT + table.COL_STAT_MAX).text()) == 2)
+    assert float(table.item(0, table.COL_STAT + table.COL_STAT_MIN).text()) == -1
+    assert float(table.item(0, table.COL_STAT + table.COL_STAT_AVG).text()) == pytest.approx(np.mean(all_ys), 0.01)
+    assert float(table.item(0, table.COL_STAT + table.COL_STAT_RMS).text()) == pytest.approx(
+        np.sqrt(np.mean(all_ys**2)), 0.01
+    )
+    assert float(table.item(0, table.COL_STAT + table.COL_STAT_STDEV).text()) == pytest.approx(np.std(all_ys), 0.01)
@@ -0,0 +1,77 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import math
+from unittest import mock
+
+import numpy as np
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots.multi_plot_widget import InteractivePlot
+from pyqtgraph_scope_plots.util import AppendableArray, ArrayMeta, not_none
+from .common_testdata import np_immutable
+
+
+def test_compute() -> None:
+    meta = ArrayMeta.compute(np.array([0.0, 1, 1, 5]))
+    assert meta == ArrayMeta.Meta(nan_count=0, all_finite=True, sorted=True, finite_min=0, finite_max=5)
+    meta = ArrayMeta.compute(np.array([2.0, np.nan, -np.inf, 1]))
+    assert meta == ArrayMeta.Meta(nan_count=1, all_finite=False, sorted=False, finite_min=1, finite_max=2)
+    meta = ArrayMeta.compute(np.array([3, 2], dtype=np.int16))
+    assert meta == ArrayMeta.Meta(nan_count=0, all_finite=True, sorted=False, finite_min=2, finite_max=3)
+    meta = ArrayMeta.compute(np.array([np.nan]))
+    assert meta is not None and math.isnan(meta.finite_min)
+    assert ArrayMeta.compute(np.array(["a", "b"])) is None
+
+
+def test_cached() -> None:
+    arr = np_immutable([0.0, 1, 2])
+    assert ArrayMeta.cached(arr) is None
+    meta = ArrayMeta.of(arr)
+    with mock.patch.object(ArrayMeta, "compute", wraps=ArrayMeta.compute) as compute:
+        assert ArrayMeta.of(arr) is meta
+        compute.assert_not_called()
+    assert ArrayMeta.cached(arr) is meta
+
+    shifted = np_immutable([10.0, 11, 12])
+    ArrayMeta.register_shifted(arr, shifted, 10)
+    assert ArrayMeta.cached(shifted) == meta._replace(finite_min=10, finite_max=12)
+
+
+def test_extended() -> None:
+    prefix = AppendableArray.extend(None, [0.0, 1, 2])
+    prefix_meta = ArrayMeta.of(prefix)
+    arr = AppendableArray.extend(prefix, [1.5, np.nan, 7])
+    with mock.patch.object(ArrayMeta, "compute", wraps=ArrayMeta.compute) as compute:
+        meta = ArrayMeta.of(arr)
+        assert len(compute.call_args[0][0]) == 3  # only the appended tail
+    assert meta == ArrayMeta.compute(arr)
+    assert prefix_meta is not None and prefix_meta.sorted and meta is not None and not meta.sorted
+
+    sorted_arr = AppendableArray.extend(prefix, [2, 3])  # sortedness checked across the boundary
+    assert not_none(ArrayMeta.of(sorted_arr)).sorted
+    assert not not_none(ArrayMeta.of(AppendableArray.extend(sorted_arr, [2.5]))).sorted
+
+
+def test_curve_finite_check(qtbot: QtBot) -> None:
+    plot = InteractivePlot()
+    plot.set_data_items({"0": QColor("yellow")})
+    plot.set_data({"0": (np_immutable([0, 1, 2]), np_immutable([1, 2, 3]))})
+    assert plot._curves["0"].opts["skipFiniteCheck"]  # known finite, pyqtgraph's pass skipped
+    assert plot._finite_bounds(plot._data["0"][1]) == (1, 3)
+
+    plot.set_data({"0": (np_immutable([0, 1, 2]), np_immutable([1, np.nan, 3]))})
+    assert plot._curves["0"].getData()[0].tolist() == [0, 2]  # missing samples aren't drawn, see GapIndex
+    assert plot._finite_bounds(plot._data["0"][1]) == (1, 3)
@@ -15,14 +15,16 @@
 from io import StringIO
 from typing import cast
 
+import numpy as np
 import pyqtgraph as pg
 import pytest
 from PySide6.QtGui import QColor
 from pytestqt.qtbot import QtBot
 
-from pyqtgraph_scope_plots.multi_plot_widget import MultiPlotStateModel, PlotWidgetModel
-from pyqtgraph_scope_plots import MultiPlotWidget, PlotsTableWidget
-from .common_testdata import DATA_ITEMS, DATA
+from pyqtgraph_scope_plots.multi_plot_widget import MultiPlotStateModel, PlotWidgetModel, InteractivePlot
+from pyqtgraph_scope_plots import MultiPlotWidget, PlotsTableWidget, TimeAxisItem
+from pyqtgraph_scope_plots.util import RunLengthEncoding
+from .common_testdata import DATA_ITEMS, DATA, np_immutable
 from .util import assert_cast
 
 
@@ -186,6 +188,64 @@ def test_export_csv(qtbot: QtBot, plot: PlotsTableWidget) -> None:
 2.0,0.0,,0.6""".replace("\r", "").replace("\n", "")  # ignore newline format
 
 
+def test_run_length(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    rle_xs, rle_ys = RunLengthEncoding.encode(np_immutable([0, 0.5, 1, 1.5, 2]), np_immutable([5, 5, 6, 6, 6]))
+    assert rle_xs.tolist() == [0, 1, 2] and rle_ys.tolist() == [5, 6, 6]  # transitions and the end sample
+    assert RunLengthEncoding.from_transitions([0, 1], [5, 6], end=2)[0].tolist() == rle_xs.tolist()
+    plot._set_data({"0": (rle_xs, rle_ys), "1": ([0, 0.5, 2, 3], [0.25, 0.5, 0.25, 0.5])})
+    out_io = StringIO()
+    plot._write_csv(out_io)
+    assert out_io.getvalue().replace("\r", "").replace("\n", "") == """# time,0,1
+0.0,5,0.25
+0.5,5,0.5
+1.0,6,
+2.0,6,0.25
+3.0,,0.5""".replace("\r", "").replace("\n", "")  # values held until the end sample
+
+    plot_item = cast(InteractivePlot, plot._plots._data_name_to_plot_item["0"])
+    assert [y for y, _, _ in plot_item._data_value_label_at(0.5)] == [5]  # held value between samples
+    assert plot_item._data_value_label_at(2.5) == []  # past the end
+    assert plot_item._curves["0"].opts["stepMode"] == "right"
+
+
+def test_datetime_xs(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    ts = np.array(["2026-01-01T00:00:00.5", "2026-01-01T00:00:01.000000001"], dtype="datetime64[ns]")
+    ts.flags.writeable = False
+    plot._set_data({"0": (ts, [0.5, 1]), "1": (ts, [1, 0.5])})
+    assert plot._plots._x_origin == np.datetime64("2026-01-01T00:00:00")
+    xs = plot._plots._raw_data["0"][0]
+    assert xs.tolist() == [0.5, 1.000000001]  # nanosecond resolution relative to the origin
+    assert plot._plots._raw_data["1"][0] is xs  # shared time arrays converted once
+
+    bottom_axis = plot._plots._data_name_to_plot_item["0"].getAxis("bottom")
+    assert isinstance(bottom_axis, TimeAxisItem)
+    assert bottom_axis._origin_s == int(np.datetime64("2026-01-01T00:00:00").astype(np.int64))
+
+    out_io = StringIO()
+    plot._write_csv(out_io)
+    assert out_io.getvalue().splitlines()[1].startswith("1767225600.500000000,")  # written as epoch seconds
+
+    plot._set_data({"0": ([1767225600.5, 1767225601.0], [0.5, 1])})  # epoch seconds, resets the origin
+    assert plot._plots._x_origin is None
+    assert bottom_axis._origin_s == 0
+
+
+def test_datetime_xs_export(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    """Tests that datetime64 xs are exported with nanosecond resolution, not rounded through float epoch seconds"""
+    ts = np.array(
+        ["2023-11-14T22:13:20.123456789", "2023-11-14T22:13:20.123456790", "2023-11-14T22:13:20.123457"],
+        dtype="datetime64[ns]",
+    )
+    plot._set_data({"0": (ts, [0, 1, 2])})
+    out_io = StringIO()
+    plot._write_csv(out_io)
+    assert [line.split(",")[0] for line in out_io.getvalue().splitlines()[1:]] == [
+        "1700000000.123456789",
+        "1700000000.123456790",
+        "1700000000.123457000",
+    ]
+
+
 def test_empty_plot_indicator(qtbot: QtBot) -> None:
     """Test that empty plot indicator is shown when appropriate."""
     from pyqtgraph_scope_plots.interactivity_mixins import EmptyPlotIndicatorPlot
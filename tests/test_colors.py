@@ -57,6 +57,17 @@ def test_color(qtbot: QtBot, color_plots: ColorPickerPlotWidget) -> None:
     assert color_of_curve(color_plots._data_name_to_plot_item["2"]._data_graphics["2"][0]) == QColor("blue")
 
 
+def test_color_in_place(qtbot: QtBot, color_plots: ColorPickerPlotWidget) -> None:
+    plot_item = color_plots._data_name_to_plot_item["1"]
+    curve, scatter = plot_item._data_graphics["1"]
+    with mock.patch.object(color_plots, "_update_plots") as update_plots:
+        color_plots.set_colors(["1"], QColor("indigo"))
+    update_plots.assert_not_called()  # no data reprocessing
+    assert plot_item._data_graphics["1"] == [curve, scatter]  # graphics recolored in place
+    assert color_of_curve(curve) == QColor("indigo")
+    assert cast(pg.ScatterPlotItem, scatter).opts["brush"].color() == QColor("indigo")
+
+
 def test_color_table(qtbot: QtBot, color_plots: ColorPickerPlotWidget) -> None:
     color_table = ColorPickerSignalsTable(color_plots)
 
@@ -14,8 +14,10 @@
 
 import os
 import time
+from io import StringIO
 from unittest import mock
 
+import numpy as np
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QInputDialog
@@ -23,6 +25,7 @@ from pytestqt.qtbot import QtBot
 
 from pyqtgraph_scope_plots.csv.csv_plots import CsvLoaderPlotsTableWidget
 from pyqtgraph_scope_plots.recents import RecentsModel, RecentsManager
+from pyqtgraph_scope_plots.util import CategoricalCodes, GapIndex, RunLengthEncoding, not_none
 from tests.util import MockQSettings, menu_action_by_name
 
 
@@ -46,6 +49,37 @@ def test_load_sparse_csv(qtbot: QtBot, plot: CsvLoaderPlotsTableWidget) -> None:
     qtbot.waitUntil(lambda: plot._plots.count() == 3)  # just make sure it loads
 
 
+def test_load_shared_time(qtbot: QtBot, plot: CsvLoaderPlotsTableWidget) -> None:
+    plot._load_csvs([os.path.join(os.path.dirname(__file__), "data", "test_csv_viewer_data_sparse.csv")])
+    qtbot.waitUntil(lambda: plot._plots.count() == 3)
+    raw_data = plot._plots._raw_data
+    assert raw_data["float_row_desc"][0].tolist() == [0, 1, 2, 3]
+    assert raw_data["float_row_asc"][0] is raw_data["float_row_desc"][0]  # missing values kept, time not masked
+    assert raw_data["float_row_asc"][1][0] == 1 and np.isnan(raw_data["float_row_asc"][1][1:]).all()
+    gaps = not_none(GapIndex.of(*raw_data["float_row_asc"]))
+    assert gaps.starts.tolist() == [1] and gaps.ends.tolist() == [4]  # trailing missing values are a gap
+    assert raw_data["cat_row"][0].tolist() == [0, 1, 3]  # missing values dropped, not held by run-length encoding
+    assert raw_data["cat_row"][1].tolist() == ["duck", "duck", "no geese"]
+    assert CategoricalCodes.of(raw_data["cat_row"][1]) is not None  # loaded as categorical, sparse mask applied
+    assert not RunLengthEncoding.is_run_length(raw_data["cat_row"][1])
+
+    out_io = StringIO()
+    plot._write_csv(out_io)
+    assert out_io.getvalue().replace("\r", "").splitlines()[1:] == [  # missing cells exported empty
+        "0.0,1.0,10.0,duck",
+        "1.0,,8.0,duck",
+        "2.0,,7.0,",
+        "3.0,,6.0,no geese",
+    ]
+
+    plot._load_csvs([os.path.join(os.path.dirname(__file__), "data", "test_csv_viewer_data.csv")])
+    qtbot.waitUntil(lambda: plot._plots.count() == 3)
+    raw_data = plot._plots._raw_data
+    assert raw_data["float_row_asc"][0] is raw_data["float_row_desc"][0]  # dense columns share the time array
+    assert raw_data["cat_row"][0].tolist() == [0, 3]  # transitions and end only
+    assert raw_data["cat_row"][1].tolist() == ["duck", "no geese"]
+
+
 def test_load_multiple_csv(qtbot: QtBot, plot: CsvLoaderPlotsTableWidget) -> None:
     plot._load_csvs(
         [
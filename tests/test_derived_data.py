@@ -0,0 +1,148 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import Any, Dict, Mapping, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import (
+    MultiPlotWidget,
+    RollingPlotWidget,
+    TimeshiftPlotWidget,
+    TransformsPlotWidget,
+    ValueDtypePlotWidget,
+)
+from pyqtgraph_scope_plots.util import (
+    AppendableArray,
+    ArrayMeta,
+    DerivedData,
+    DigitalBus,
+    GapIndex,
+    RunLengthEncoding,
+    UniformTimebase,
+    not_none,
+)
+from .common_testdata import np_immutable
+
+
+def _immutable(arr: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    arr = arr.copy()
+    arr.flags.writeable = False
+    return arr
+
+
+def _source_data() -> Dict[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]]:
+    """Returns data registered with each of the value registries, with a uniform timebase"""
+    xs = np_immutable([0, 1, 2, 3])
+    UniformTimebase.detect(xs)
+    sparse_ys = np_immutable([0, np.nan, 2, 3])
+    GapIndex.build(xs, sparse_ys, jump_factor=10)
+    return {
+        "rle": RunLengthEncoding.from_transitions([0, 1, 2], [1.0, 2.0, 1.0], end=3),
+        "bus": (xs, DigitalBus.pack({"ready": [0, 1, 1, 0], "busy": [1, 0, 1, 1]})),
+        "sparse": (xs, sparse_ys),
+    }
+
+
+def _assert_registered(data: Mapping[str, Tuple[npt.NDArray[np.float64], npt.NDArray[Any]]], held: bool = True) -> None:
+    assert RunLengthEncoding.is_run_length(data["rle"][1]) == held
+    assert DigitalBus.line_names(data["bus"][1]) == ("ready", "busy")
+    assert not_none(GapIndex.sparse_of(data["sparse"][1])).missing_starts.tolist() == [1]
+
+
+@pytest.mark.parametrize("held", [True, False])
+def test_register_values(held: bool) -> None:
+    source = _source_data()
+    derived = {name: (xs, _immutable(ys)) for name, (xs, ys) in source.items()}
+    for name in source:
+        DerivedData.register_values(source[name][1], derived[name][1], held)
+    _assert_registered(derived, held)
+
+    uint16_ys = _immutable(source["bus"][1].astype(np.uint16))
+    DerivedData.register_values(source["bus"][1], uint16_ys)
+    assert DigitalBus.line_names(uint16_ys) is None  # words of a different width aren't the same lines
+
+
+def test_register_shifted() -> None:
+    xs = np_immutable([0, 1, 2, 3])
+    UniformTimebase.detect(xs)
+    ArrayMeta.of(xs)
+    shifted = np_immutable([1, 2, 3, 4])
+    DerivedData.register_shifted(xs, shifted, 1)
+    assert UniformTimebase.of(shifted) == (1.0, 1.0)
+    assert not_none(ArrayMeta.cached(shifted)).finite_min == 1
+
+
+@pytest.mark.parametrize("dropped", [0, 2])
+def test_register_appended(dropped: int) -> None:
+    source = _source_data()
+    appended = {}
+    for name, (xs, ys) in source.items():
+        new_xs = np.concatenate((xs, [4.0]))[dropped:]
+        new_ys = np.concatenate((ys, ys[-1:]))[dropped:]
+        appended[name] = (_immutable(new_xs), _immutable(new_ys))
+        DerivedData.register_appended(xs, ys, *appended[name], dropped)
+
+    assert RunLengthEncoding.is_run_length(appended["rle"][1])
+    assert DigitalBus.line_names(appended["bus"][1]) == ("ready", "busy")
+    assert GapIndex.sparse_of(appended["sparse"][1]) is not None  # gaps rebuilt with the same jump factor
+    assert UniformTimebase.of(appended["bus"][0]) == (float(dropped), 1.0)
+    if dropped == 0:  # derived data can be extended from the previous data
+        assert AppendableArray.prefix_of(appended["bus"][0]) is source["bus"][0]
+        assert AppendableArray.prefix_of(appended["bus"][1]) is source["bus"][1]
+    else:
+        assert AppendableArray.prefix_of(appended["bus"][1]) is None
+
+
+class DerivedPlotWidget(TimeshiftPlotWidget, TransformsPlotWidget, ValueDtypePlotWidget, RollingPlotWidget):
+    pass
+
+
+def test_derived_plots(qtbot: QtBot) -> None:
+    """Tests that data derived by casts, transforms, timeshifts, appends, and rolls keeps all its registrations"""
+    plots = DerivedPlotWidget()
+    qtbot.addWidget(plots)
+    plots.show_data_items(
+        [
+            ("rle", QColor("yellow"), MultiPlotWidget.PlotType.DEFAULT),
+            ("bus", QColor("orange"), MultiPlotWidget.PlotType.DIGITAL_BUS),
+            ("sparse", QColor("blue"), MultiPlotWidget.PlotType.DEFAULT),
+        ]
+    )
+    plots.set_default_value_dtype(np.float32)  # cast
+    plots.set_data(_source_data())
+    assert plots._data["rle"][1].dtype == np.float32
+    _assert_registered(plots._data)
+
+    plots.set_transform(["rle", "sparse"], "x * 2")
+    plots.set_transform(["bus"], "x ^ 3")  # inverts both lines
+    plots.set_timeshift(["rle", "bus", "sparse"], 1)
+    _assert_registered(plots._data)
+    assert DigitalBus.bits(plots._data["bus"][1], 2)[:, 0].tolist() == [1, 0, 0, 1]
+    assert UniformTimebase.of(plots._data["bus"][0]) == (1.0, 1.0)
+
+    plots.append_data({name: ([4.0], [ys[-1]]) for name, (_, ys) in _source_data().items()})  # append
+    _assert_registered(plots._data)
+    assert UniformTimebase.of(plots._data["bus"][0]) == (1.0, 1.0)
+
+    plots.set_roll(samples=4)  # roll
+    plots.append_data({name: ([5.0, 6.0], [ys[-1], ys[-1]]) for name, (_, ys) in _source_data().items()})
+    assert len(plots._data["bus"][0]) == 4
+    assert RunLengthEncoding.is_run_length(plots._data["rle"][1])
+    assert DigitalBus.line_names(plots._data["bus"][1]) == ("ready", "busy")
+    assert UniformTimebase.of(plots._data["bus"][0]) == (4.0, 1.0)
@@ -0,0 +1,91 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import cast
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import MultiPlotWidget
+from pyqtgraph_scope_plots.multi_plot_widget import DigitalBusInteractivePlot
+from pyqtgraph_scope_plots.util import DigitalBus
+from pyqtgraph_scope_plots.util.util import not_none
+
+BUS_XS = np.array([0.0, 1, 2, 3, 4])
+BUS_LINES = {
+    "ready": [0, 1, 1, 1, 0],
+    "busy": [0, 0, 1, 0, 0],
+    "error": [1, 1, 1, 1, 1],
+}
+
+
+def test_pack() -> None:
+    ys = DigitalBus.pack(BUS_LINES)
+    assert ys.dtype == np.uint8 and not ys.flags.writeable
+    assert ys.tolist() == [0b100, 0b101, 0b111, 0b101, 0b100]
+    assert DigitalBus.line_names(ys) == ("ready", "busy", "error")
+    assert DigitalBus.bits(ys, 3).T.tolist() == list(BUS_LINES.values())
+
+    wide_ys = DigitalBus.pack({str(i): [i % 2, 1] for i in range(64)})
+    assert wide_ys.dtype == np.uint64
+    assert DigitalBus.bits(wide_ys, 64)[:, 63].tolist() == [1, 1] and wide_ys[1] == np.iinfo(np.uint64).max
+
+    with pytest.raises(ValueError):
+        DigitalBus.pack({str(i): [0] for i in range(65)})
+    with pytest.raises(ValueError):
+        DigitalBus.pack({"a": [0, 1], "b": [0]})
+
+
+def test_edges() -> None:
+    ys = DigitalBus.pack(BUS_LINES)
+    indices, lines = DigitalBus.edges(ys, 3)
+    assert list(zip(lines.tolist(), indices.tolist())) == [(0, 1), (0, 4), (1, 2), (1, 3)]  # by line, then index
+
+    # equivalent to per-line change detection
+    rng = np.random.default_rng(0)
+    lines_values = {str(i): rng.random(1000) < 0.1 * (i + 1) for i in range(9)}
+    indices, lines = DigitalBus.edges(DigitalBus.pack(lines_values), 9)
+    for line, values in enumerate(lines_values.values()):
+        assert indices[lines == line].tolist() == (np.flatnonzero(values[1:] != values[:-1]) + 1).tolist()
+
+
+def test_plot(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    qtbot.addWidget(plots)
+    plots.show_data_items([("bus", QColor("yellow"), MultiPlotWidget.PlotType.DIGITAL_BUS)])
+    plots.set_data({"bus": (BUS_XS, DigitalBus.pack(BUS_LINES))})
+    plot_item = cast(DigitalBusInteractivePlot, plots._data_name_to_plot_item["bus"])
+    assert isinstance(plot_item, DigitalBusInteractivePlot)
+
+    data_x, data_y = plot_item._curve.getData()
+    pitch = plot_item.LINE_PITCH
+    ready_len = 6  # first, 2 edges x 2, last
+    assert data_x[:ready_len].tolist() == [0, 1, 1, 4, 4, 4]
+    assert data_y[:ready_len].tolist() == [2 * pitch, 2 * pitch, 2 * pitch + 1, 2 * pitch + 1, 2 * pitch, 2 * pitch]
+    assert np.isnan(data_y[ready_len])  # break between lines
+    assert data_y[-3:-1].tolist() == [1, 1]  # error line, at the bottom, always high
+    assert [name for _, name in plot_item.getAxis("left")._tickLevels[0]] == ["ready", "busy", "error"]
+
+    # all lines read out at once
+    assert [text for _, text, _ in plot_item._data_value_label_at(2)] == ["1", "1", "1"]
+    assert [y for y, _, _ in plot_item._data_value_label_at(3)] == [2 * pitch + 0.5, pitch + 0.5, 0.5]
+    assert plot_item._data_value_label_at(2.5) == []
+    assert not_none(plot_item._snap_pos(QPointF(1.8, 0), 0, 10)).x() == 2  # prefers changes
+
+    plots.append_data({"bus": ([5.0], np.array([0b110], dtype=np.uint8))})
+    assert [text for _, text, _ in plot_item._data_value_label_at(5)] == ["0", "1", "1"]
+    assert plot_item._line_names == ("ready", "busy", "error")  # appended data keeps the line names
@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 from typing import cast
+from unittest import mock
 
 import pyqtgraph as pg
 import pytest
@@ -106,6 +107,20 @@ def test_plot_merge_multi(qtbot: QtBot, plots: DroppableMultiPlotWidget) -> None
     assert len(cast(pg.PlotItem, cast(pg.PlotWidget, plots.widget(0)).getPlotItem()).listDataItems()) == 3 * 2 + 1
 
 
+def test_plot_merge_reconciled(qtbot: QtBot, plots: DroppableMultiPlotWidget) -> None:
+    qtbot.waitUntil(lambda: plots.count() == 3)  # wait for plots to be ready
+    target_plot_item = plots._data_name_to_plot_item["1"]
+    target_graphics = target_plot_item._data_graphics["1"]
+
+    with mock.patch.object(plots, "_update_plots") as update_plots:
+        plots._merge_data_into_item(["0"], 1)  # merge
+    update_plots.assert_not_called()  # moved data is not reprocessed
+    assert target_plot_item._data_graphics["1"] == target_graphics  # existing graphics untouched
+    curve = cast(pg.PlotCurveItem, target_plot_item._data_graphics["0"][0])
+    target_plot_item.setXRange(0, 2)  # curves are clipped to the view
+    qtbot.waitUntil(lambda: curve.getData()[1].tolist() == [0.01, 1, 1, 0])  # moved data rendered in the new plot
+
+
 def test_invalid_plot_merge(qtbot: QtBot, plots: DroppableMultiPlotWidget) -> None:
     plots.show_data_items(
         DATA_ITEMS
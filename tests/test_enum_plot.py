@@ -13,8 +13,10 @@
 #    limitations under the License.
 
 from typing import cast
+from unittest import mock
 
 import numpy as np
+import pandas as pd
 import pytest
 from PySide6.QtCore import QPointF
 from PySide6.QtGui import QColor
@@ -22,6 +24,7 @@ import pyqtgraph as pg
 from pytestqt.qtbot import QtBot
 
 from pyqtgraph_scope_plots.multi_plot_widget import EnumWaveformInteractivePlot
+from pyqtgraph_scope_plots.util import AppendableArray, CategoricalCodes, RunLengthEncoding
 from pyqtgraph_scope_plots.util.util import not_none
 
 ENUM_DATA_ITEMS = {"0": QColor("yellow")}
@@ -48,6 +51,21 @@ def test_plot_true(qtbot: QtBot, plot: pg.PlotWidget) -> None:
     assert np.array_equal(data_y, np.array([1, 1, -1, -1, 1, 1, -1, -1]))
 
 
+def test_plot_categorical(qtbot: QtBot, plot: pg.PlotWidget) -> None:
+    plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
+    ys = CategoricalCodes.from_codes([0, 1, 1, 1, 2, 0, 0], ["A", "B", "C"])
+    assert ys.tolist() == ENUM_DATA["0"][1].tolist()
+    with mock.patch.object(pd, "factorize", wraps=pd.factorize) as factorize:
+        plot_item.set_data({"0": (ENUM_DATA["0"][0], ys)})
+        factorize.assert_not_called()  # edges from the registered codes
+    data_x, data_y = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert np.array_equal(data_x, np.array([0, 0, 1, 2, 6, 6, 7, 7.4]))
+    assert np.array_equal(data_y, np.array([1, 1, -1, -1, 1, 1, -1, -1]))
+
+    codes, categories = CategoricalCodes.encode(ENUM_DATA["0"][1])  # uncategorized data is encoded
+    assert categories[codes].tolist() == ENUM_DATA["0"][1].tolist()
+
+
 def test_empty_one(qtbot: QtBot, plot: pg.PlotWidget) -> None:
     plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
     plot_item.set_data({"0": (np.array([]), np.array([]))})
@@ -74,6 +92,20 @@ def test_labels(qtbot: QtBot, plot: pg.PlotWidget) -> None:
     assert plot_item._curves_labels._labels[0].toPlainText() == "test"
 
 
+def test_run_length(qtbot: QtBot, plot: pg.PlotWidget) -> None:
+    plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
+    plot_item.set_data({"0": RunLengthEncoding.encode(*ENUM_DATA["0"])})  # values hold until the next transition
+    data_x, data_y = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert np.array_equal(data_x, np.array([0, 1, 1, 6, 6, 7, 7, 7.4]))  # edges at transitions, not ramps
+    assert np.array_equal(data_y, np.array([1, 1, -1, -1, 1, 1, -1, -1]))
+    qtbot.waitUntil(lambda: len(plot_item._curves_labels._labels) == 4)  # held segments are wide enough for labels
+    assert [label.toPlainText() for label in plot_item._curves_labels._labels] == ["A", "B", "C", "A"]
+
+    plot_item.setXRange(2, 5, padding=0)  # view starts inside a held run
+    plot_item._settle_view_range()
+    assert [label.toPlainText() for label in plot_item._curves_labels._labels] == ["B"]
+
+
 def test_snap(qtbot: QtBot, plot: pg.PlotWidget) -> None:
     plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
     assert not_none(plot_item._snap_pos(QPointF(0, 0), 0, 10)) == QPointF(0, 0)  # exact snap
@@ -93,3 +125,53 @@ def test_data_values(qtbot: QtBot, plot: pg.PlotWidget) -> None:
     assert plot_item._data_value_label_at(1.5) == [(0, "B", QColor("yellow"))]
     assert plot_item._data_value_label_at(1.6) == []
     assert plot_item._data_value_label_at(7.4) == [(0, "A", QColor("yellow"))]
+
+
+def test_activity_bands(qtbot: QtBot, plot: pg.PlotWidget) -> None:
+    plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
+    xs = np.arange(100000, dtype=np.float64)
+    ys = np.array(["A", "B"] * 50000)
+    ys[50000:] = "A"  # quiet second half
+    plot_item.set_data({"0": (xs, ys)})
+    plot_item.setXRange(0, 100000, padding=0)
+    plot_item._settle_view_range()
+    assert len(plot_item._activity_spans) == 2  # one band over the busy first half
+    assert plot_item._activity_spans[0] == 0 and 49000 < plot_item._activity_spans[1] < 51000
+    data_x, _ = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert len(data_x) < 10  # edges in the band not drawn
+    assert np.all(np.diff(data_x) >= 0)
+    assert data_x[-1] == 99999  # quiet part still drawn
+
+    plot_item.setXRange(1000, 1010, padding=0)  # zoomed in, full edges come back
+    plot_item._settle_view_range()
+    assert len(plot_item._activity_spans) == 0
+    data_x, _ = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert 20 <= len(data_x) <= 24  # visible edges plus margin
+
+    plot_item.setXRange(40000, 60000, padding=0)  # labels only outside bands
+    plot_item._settle_view_range()
+    assert [label.toPlainText() for label in plot_item._curves_labels._labels] == ["A"]
+    assert plot_item._curves_labels._labels[0].pos().x() >= plot_item._activity_spans[-1]
+
+
+def test_incremental_edges(qtbot: QtBot, plot: pg.PlotWidget) -> None:
+    plot_item = cast(EnumWaveformInteractivePlot, plot.plotItem)
+    all_xs, all_ys = ENUM_DATA["0"]
+    xs, ys = AppendableArray.extend(None, all_xs[:3]), AppendableArray.extend(None, all_ys[:3])
+    plot_item.set_data({"0": (xs, ys)})
+    for split in [4, 5, 7]:  # append across a change, on a change, and a run of samples
+        prev_len, prev_data = len(ys), (xs, ys)  # previous data kept alive, as in MultiPlotWidget.append_data
+        xs, ys = AppendableArray.extend(xs, all_xs[prev_len:split]), AppendableArray.extend(ys, all_ys[prev_len:split])
+        with mock.patch.object(CategoricalCodes, "encode", wraps=CategoricalCodes.encode) as encode:
+            plot_item.set_data({"0": (xs, ys)})
+            assert len(encode.call_args[0][0]) == split - prev_len + 1  # only appended samples plus overlap scanned
+        del prev_data
+    plot_item.setXRange(0, 8, padding=0)
+    plot_item._settle_view_range()
+    data_x, data_y = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert np.array_equal(data_x, np.array([0, 0, 1, 2, 6, 6, 7, 7.4]))
+    assert np.array_equal(data_y, np.array([1, 1, -1, -1, 1, 1, -1, -1]))
+
+    plot_item.set_data({"0": (all_xs[:2], all_ys[:2])})  # unrelated data does a full scan
+    data_x, data_y = cast(pg.PlotDataItem, plot_item._data_graphics["0"][0]).getData()
+    assert np.array_equal(data_x, np.array([0, 0, 1, 1])) and np.array_equal(data_y, np.array([1, 1, -1, -1]))
@@ -0,0 +1,77 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from io import StringIO
+from typing import cast
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import PlotsTableWidget
+from pyqtgraph_scope_plots.multi_plot_widget import InteractivePlot
+from pyqtgraph_scope_plots.util import GapIndex, ingest_data_frame, not_none
+from .common_testdata import np_immutable
+
+
+def test_build() -> None:
+    xs = np_immutable([0, 1, 2, 3, 4, 5, 6, 20, 21, 22])
+    ys = np_immutable([0, np.nan, 2, np.nan, np.nan, 5, 6, 7, 8, np.nan])
+    gaps = GapIndex.build(xs, ys)  # without a jump factor, all missing samples are gaps
+    assert gaps.starts.tolist() == [1, 3, 9] and gaps.ends.tolist() == [2, 5, 10]
+    assert GapIndex.of(xs, ys) is gaps
+    assert GapIndex.sparse_of(ys) is None  # non-finite samples are values, not missing rows
+
+    gaps = GapIndex.build(xs, ys, jump_factor=1.2)  # max step of 1.2 * 1 * 10 / 6 = 2
+    assert gaps.starts.tolist() == [3, 7, 9] and gaps.ends.tolist() == [5, 7, 10]  # long run, jump, trailing
+    assert gaps.missing_starts.tolist() == [1, 3, 9]
+    assert gaps.is_missing(1) and gaps.is_missing(4) and not gaps.is_missing(5) and not gaps.is_missing(7)
+    assert np.flatnonzero(gaps.missing_mask(len(ys))).tolist() == [1, 3, 4, 9]
+    assert GapIndex.sparse_of(ys) is gaps
+    assert gaps.connected(np.array([0, 2, 5, 6, 7, 8])).tolist() == [True, False, True, False, True, False]
+
+    assert GapIndex.of(xs, np_immutable([0.0] * 10)) is None  # no missing samples
+
+
+def test_ingest_gaps() -> None:
+    df = pd.DataFrame({"t": [0.0, 1, 2, 3, 4, 50], "a": [1.0, np.nan, 3, 4, 5, 6], "b": [1.0, 2, 3, 4, 5, 6]})
+    data, copied_names = ingest_data_frame(df, gap_jump_factor=10)
+    assert data["a"][0] is data["b"][0]  # time array shared, not masked
+    assert copied_names == []
+    assert not_none(GapIndex.of(*data["a"])).starts.tolist() == [5]  # missing sample skipped over, jump is a gap
+    assert not_none(GapIndex.of(*data["b"])).starts.tolist() == [5]
+
+
+def test_gap_rendering(qtbot: QtBot) -> None:
+    plots = PlotsTableWidget()
+    qtbot.addWidget(plots)
+    plots._set_data_items([("0", QColor("yellow"), PlotsTableWidget.Plots.PlotType.DEFAULT)])
+    xs, ys = np_immutable([0, 1, 2, 3, 10, 11]), np_immutable([0, 1, np.nan, 3, 4, 5])
+    GapIndex.build(xs, ys, jump_factor=3)
+    plots._set_data({"0": (xs, ys)})
+    plot_item = cast(InteractivePlot, plots._plots._data_name_to_plot_item["0"])
+    plot_item.setXRange(0, 11, padding=0)
+    plot_item._settle_view_range()
+    curve_xs, _ = plot_item._curves["0"].getData()
+    assert curve_xs.tolist() == [0, 1, 3, 10, 11]  # missing sample not drawn
+    connect = plot_item._curves["0"].opts["connect"]
+    assert connect.tolist() == [True, True, False, True, False]  # connected over the missing sample, not the jump
+
+    assert plot_item._data_value_label_at(2) == []  # missing samples skipped by readouts and snapping
+    assert not_none(plot_item._snap_pos(QPointF(2, 2), 0, 3)).x() in (1, 3)
+    fileio = StringIO()
+    plots._write_csv(fileio)
+    assert fileio.getvalue().splitlines()[3] == "2,"  # and written empty
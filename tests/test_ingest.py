@@ -0,0 +1,84 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import array
+
+import numpy as np
+import pandas as pd
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import MultiPlotWidget
+from pyqtgraph_scope_plots.util import ingest_array, ingest_data_frame
+from .common_testdata import DATA_ITEMS
+
+
+def test_ingest_array() -> None:
+    arr = np.array([1.0, 2.0, 3.0])
+    ingested, copied = ingest_array(arr, np.float64)
+    assert ingested is arr and not copied
+    assert not arr.flags.writeable  # ownership taken
+
+    arr = np.array([1.0, 2.0, 3.0])
+    ingested, copied = ingest_array(pd.Series(arr))  # the Series wraps arr without copying
+    assert np.shares_memory(ingested, arr) and not copied
+    assert not arr.flags.writeable  # frozen through the Series
+
+    base = np.arange(6.0)
+    ingested, copied = ingest_array(base[:3])  # view
+    assert not copied and not base.flags.writeable  # frozen through the base
+
+    ingested, copied = ingest_array(array.array("d", [1.0, 2.0]), np.float64)  # buffer protocol
+    assert ingested.tolist() == [1.0, 2.0] and not copied
+
+    ingested, copied = ingest_array(np.array([1, 2, 3]), np.float64)  # dtype conversion
+    assert ingested.dtype == np.float64 and copied and not ingested.flags.writeable
+
+    ingested, copied = ingest_array(np.arange(6.0)[::2])  # not contiguous
+    assert ingested.tolist() == [0.0, 2.0, 4.0] and copied and ingested.flags.c_contiguous
+
+    ingested, copied = ingest_array([1, 2])  # not an array
+    assert ingested.tolist() == [1, 2] and copied
+
+
+def test_ingest_data_frame() -> None:
+    df = pd.DataFrame(
+        {
+            "t": np.array([0.0, 1.0, 2.0]),
+            "a": np.array([1.0, 2.0, 3.0]),
+            "b": np.array([4.0, np.nan, 6.0]),
+            "c": np.array([7.0, np.nan, 9.0]),
+        }
+    )
+    data, copied_names = ingest_data_frame(df)
+    assert data["a"][0].tolist() == [0.0, 1.0, 2.0] and data["a"][1].tolist() == [1.0, 2.0, 3.0]
+    assert np.shares_memory(data["a"][1], df["a"].to_numpy())  # not copied
+    assert data["b"][0].tolist() == [0.0, 2.0] and data["b"][1].tolist() == [4.0, 6.0]
+    assert data["b"][0] is data["c"][0]  # same validity mask, shared time
+    assert copied_names == ["b", "c"]  # dropping NaNs requires a copy
+
+    try:  # column memory is frozen, so this either raises or (with pandas copy-on-write) writes to a copy
+        df.loc[0, "a"] = 99
+    except ValueError:
+        pass
+    assert data["a"][1].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_set_data_frame(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    qtbot.addWidget(plots)
+    df = pd.DataFrame({"t": [0, 1, 2], "0": [0.5, 0.25, 0.5], "1": [0.7, 0.6, 0.5]})
+    assert plots.set_data_frame(df) == ["t"]  # int time converted to float
+    assert plots._raw_data["0"][0] is plots._raw_data["1"][0]
+    assert plots._data_name_to_plot_item["1"]._data["1"][1].tolist() == [0.7, 0.6, 0.5]
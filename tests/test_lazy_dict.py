@@ -0,0 +1,46 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import List, Optional
+
+import pytest
+
+from pyqtgraph_scope_plots.util import LazyDataDict
+
+
+def test_lazy_dict() -> None:
+    computed: List[str] = []
+
+    def compute(key: str) -> Optional[int]:
+        computed.append(key)
+        return None if key == "bad" else len(key)
+
+    lazy = LazyDataDict(["a", "bb", "bad"], compute, {"ccc": 3})
+    assert lazy["bb"] == 2
+    assert lazy.get("bb") == 2
+    assert computed == ["bb"]  # only requested keys computed, and memoized
+    assert "ccc" not in lazy  # precomputed values limited to keys
+
+    assert lazy.get("bad") is None  # no value
+    assert "bad" not in lazy
+    with pytest.raises(KeyError):
+        lazy["bad"]
+    with pytest.raises(KeyError):
+        lazy["missing"]
+    assert computed == ["bb", "bad"]
+    assert lazy.computed_items() == {"bb": 2}
+
+    assert dict(lazy) == {"a": 1, "bb": 2}  # iteration computes the rest
+    assert len(lazy) == 2
+    assert computed == ["bb", "bad", "a"]
@@ -11,14 +11,19 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import time
 from typing import cast
+from unittest import mock
 
+import pytest
+from PySide6.QtCore import QPointF
 from pytestqt.qtbot import QtBot
 
 from pyqtgraph_scope_plots.multi_plot_widget import LinkedMultiPlotStateModel
 from pyqtgraph_scope_plots.util.util import not_none
-from pyqtgraph_scope_plots import PlotsTableWidget
+from pyqtgraph_scope_plots import LinkedMultiPlotWidget, PlotsTableWidget
 from .test_base_plot import plot_item, plot
+from .util import assert_cast
 
 
 def test_linked_live_cursor(qtbot: QtBot, plot: PlotsTableWidget) -> None:
@@ -39,6 +44,34 @@ def test_linked_live_cursor(qtbot: QtBot, plot: PlotsTableWidget) -> None:
     qtbot.waitUntil(lambda: not plot_item(plot, 2)._hover_cursor.isVisible())
 
 
+def test_linked_live_cursor_coalesced(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    qtbot.waitUntil(lambda: plot._plots.count() == 3)  # wait for the initial placeholder plot to be deleted
+    plots = assert_cast(LinkedMultiPlotWidget, plot._plots)
+
+    # a burst of hover events is processed once per frame, with the latest position winning
+    start_metrics = plots.hover_metrics()
+    hover_item = plot_item(plot, 0)
+    hover_item._last_hover_s = time.monotonic()  # as if just processed, so the burst is deferred to the next frame
+    for x in [100.0, 110.0, 120.0]:
+        hover_item.hoverEvent(mock.Mock(enter=False, exit=False, pos=mock.Mock(return_value=QPointF(x, 50))))
+    metrics = plots.hover_metrics()
+    assert metrics.received == start_metrics.received + 3
+    assert metrics.processed == start_metrics.processed
+    qtbot.waitUntil(lambda: plots.hover_metrics().propagated == start_metrics.propagated + 1)
+    assert plots.hover_metrics().processed == start_metrics.processed + 1
+    latest_x = cast(QPointF, hover_item.mapToView(QPointF(120, 50))).x()
+    assert hover_item._hover_cursor.isVisible()
+    assert plot_item(plot, 1)._hover_cursor.x() == pytest.approx(latest_x)
+
+    # cursor changes from multiple plots are propagated in one batch, with the latest winning
+    plot_item(plot, 0).set_live_cursor(0.1)
+    plot_item(plot, 1).set_live_cursor(0.2)
+    qtbot.waitUntil(lambda: plots.hover_metrics().propagated == start_metrics.propagated + 2)
+    assert plots._last_hover == 0.2
+    assert plot_item(plot, 0)._hover_cursor.x() == 0.2
+    assert plot_item(plot, 2)._hover_cursor.x() == 0.2
+
+
 def test_linked_region(qtbot: QtBot, plot: PlotsTableWidget) -> None:
     for i in range(3):
         assert plot_item(plot, i).cursor is None  # verify initial state
@@ -140,3 +173,27 @@ def test_linked_drag_cursor(qtbot: QtBot, plot: PlotsTableWidget) -> None:
     )
     assert plot_item(plot, 1).drag_cursor.pos().x() == 0.2
     assert plot_item(plot, 2).drag_cursor.pos().x() == 0.2
+
+
+def test_batched_range_settle(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    qtbot.waitUntil(lambda: plot._plots.count() == 3)
+    plot_items = [plot_item(plot, i) for i in range(3)]
+    plot_items[1].set_region((0.5, 1.5))
+    qtbot.waitUntil(lambda: not plot._plots._range_settle_timer.isActive())
+
+    spies = [
+        mock.patch.object(item, "_on_view_range_settled", wraps=item._on_view_range_settled) for item in plot_items
+    ]
+    settles = [spy.start() for spy in spies]
+    for i in range(20):  # many pans of one plot, propagated to all linked plots
+        plot_items[0].setXRange(-0.9 + 0.1 * i, 4.1 + 0.1 * i, padding=0)
+    assert [settle.call_count for settle in settles] == [0, 0, 0]  # deferred
+    qtbot.waitUntil(lambda: [settle.call_count for settle in settles] == [1, 1, 1])  # one pass per plot
+    for spy in spies:
+        spy.stop()
+
+    label = not_none(plot_items[2]._cursor_range_label)  # only shown on the bottom plot
+    view_rect = plot_items[2].viewRect()
+    assert view_rect.left() > 0.5  # region partially visible
+    # centered on the visible part of the region, updated in the pass
+    assert label.pos().x() == pytest.approx((view_rect.left() + 1.5) / 2)
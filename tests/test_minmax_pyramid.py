@@ -0,0 +1,88 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import numpy as np
+import pyqtgraph as pg
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots.interactivity_mixins import DataPlotCurveItem
+from pyqtgraph_scope_plots.util import MinMaxPyramid
+
+
+def test_pyramid_envelope() -> None:
+    ys = np.sin(np.linspace(0, 100, 10007)) * np.linspace(0, 1, 10007)
+    pyramid = MinMaxPyramid(ys)
+    assert pyramid.bucket_sizes[0] == MinMaxPyramid.BASE_BUCKET
+    for level, bucket_size in enumerate(pyramid.bucket_sizes):
+        indices = pyramid.indices(level)
+        assert np.all(np.diff(indices) >= 0)  # temporal order
+        assert indices[0] == 0 and indices[-1] == len(ys) - 1
+        for bucket_start in range(0, len(ys), bucket_size):  # each bucket's peaks are preserved
+            bucket = ys[bucket_start : bucket_start + bucket_size]
+            in_bucket = indices[(indices >= bucket_start) & (indices < bucket_start + bucket_size)]
+            assert ys[in_bucket].min() == bucket.min()
+            assert ys[in_bucket].max() == bucket.max()
+
+
+def test_pyramid_nan() -> None:
+    ys = np.arange(64, dtype=np.float64)
+    ys[10] = np.nan
+    ys[16:24] = np.nan
+    pyramid = MinMaxPyramid(ys)
+    indices = pyramid.indices(0)
+    assert 8 in indices and 15 in indices  # bucket with a NaN keeps its finite peaks
+
+
+def test_pyramid_level_for() -> None:
+    pyramid = MinMaxPyramid(np.zeros(100000))
+    assert pyramid.level_for(100000, 100) == 3  # 100000/512 >= 100 buckets
+    assert pyramid.level_for(1000, 100) == 0
+    assert pyramid.level_for(100, 100) is None
+    assert len(pyramid.indices(0, 80, 160)) == 2 * 10 + 2
+
+    assert pyramid.level_within(100000, 200) == 3  # 100000/512 <= 200 buckets
+    assert pyramid.level_within(1000, 200) == 0
+    assert pyramid.level_within(100, 200) is None
+    assert pyramid.level_within(100000, 1) == len(pyramid.bucket_sizes) - 1  # coarsest if none fit
+
+
+def test_curve_decimation(qtbot: QtBot) -> None:
+    plot_item = DataPlotCurveItem()
+    widget = pg.PlotWidget(plotItem=plot_item)
+    widget.setFixedSize(200, 120)
+    qtbot.addWidget(widget)
+    widget.show()
+    qtbot.waitExposed(widget)
+
+    xs = np.arange(100000, dtype=np.float64)
+    ys = np.sin(xs / 100)
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    plot_item.set_data_items({"0": pg.mkColor("red")})
+    plot_item.set_data({"0": (xs, ys)})
+    plot_item.getViewBox().setXRange(0, 100000, padding=0)
+    qtbot.waitUntil(lambda: plot_item._curve_views.get("0", (None,))[0] is not None)
+    curve_xs, curve_ys = plot_item._curves["0"].getData()
+    assert len(curve_xs) < len(xs) / 10
+    assert max(curve_ys) == max(ys) and min(curve_ys) == min(ys)
+
+    plot_item.getViewBox().setXRange(1000, 1200, padding=0)  # zoomed in, raw data clipped to view with margin
+    qtbot.waitUntil(lambda: plot_item._curve_views.get("0") == (None, 999, 1202))
+    curve_xs, curve_ys = plot_item._curves["0"].getData()
+    assert list(curve_xs) == list(xs[999:1202])
+
+    # autorange should still see the full data
+    plot_item.getViewBox().autoRange(padding=0)
+    view_x_range = plot_item.getViewBox().viewRange()[0]
+    assert view_x_range[0] <= 0 and view_x_range[1] >= 99999 and view_x_range[1] - view_x_range[0] < 101000
@@ -76,6 +76,28 @@ def test_snap_api(qtbot: QtBot) -> None:
     assert not_none(plot_item._snap_pos(QPointF(1, 0.9), 0.5, 1.5)) == QPointF(1, 1)
 
 
+def test_snap_dense(qtbot: QtBot) -> None:
+    plot_item = LiveCursorPlot()
+    plot = pg.PlotWidget(plotItem=plot_item)
+    qtbot.addWidget(plot)
+    plot.show()
+    qtbot.waitExposed(plot)
+    xs = np.arange(1000000, dtype=np.float64)
+    ys = np.zeros(1000000)
+    ys[500003] = 1  # narrow peak
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    plot_item.set_data_items({"A": QColor("yellow")})
+    plot_item.set_data({"A": (xs, ys)})
+    plot_item.getViewBox().setRange(xRange=(0, 1000000), yRange=(0, 1), padding=0)
+
+    # windows far denser than MAX_PTS still snap, including to peaks
+    assert not_none(plot_item._snap_pos(QPointF(500000, 1), 490000, 510000)) == QPointF(500003, 1)
+    assert not_none(plot_item._snap_pos(QPointF(200000, 0), 190000, 210000)).y() == 0
+    snap_x = not_none(plot_item._snap_pos(QPointF(200000, 0), 190000, 210000)).x()
+    assert 190000 <= snap_x <= 210000
+
+
 def test_data_values_api(qtbot: QtBot) -> None:
     plot_item = PointsOfInterestPlot()
     plot = pg.PlotWidget(plotItem=plot_item)
@@ -138,8 +160,8 @@ def test_snap_gui(qtbot: QtBot) -> None:
             Qt.KeyboardModifier.NoModifier,
         )
     )
-    qtbot.waitUntil(lambda: plot_item._hover_target.isVisible())
-    assert plot_item._hover_target.pos() == QPointF(1, 0.25)
+    qtbot.waitUntil(lambda: plot_item._hover_target.pos() == QPointF(1, 0.25))  # hover is coalesced to frames
+    assert plot_item._hover_target.isVisible()
     assert not_none(plot_item.hover_snap_point.snap_pos) == QPointF(1, 0.25)
     assert plot_item._hover_cursor.pos().x() == 1
     assert [label.toPlainText() for label in plot_item._hover_y_labels._labels] == ["1.000", "0.250", "0.600"]
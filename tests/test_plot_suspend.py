@@ -0,0 +1,64 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import MultiPlotWidget, XyPlotWidget
+from pyqtgraph_scope_plots.interactivity_mixins import DataPlotCurveItem
+from .common_testdata import DATA_ITEMS, DATA, XY_DATA
+
+
+def test_collapsed_plot_suspended(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data(DATA)
+    plots.resize(400, 600)
+    qtbot.addWidget(plots)
+    plots.show()
+    qtbot.waitExposed(plots)
+
+    plot_item = plots._data_name_to_plot_item["1"]
+    assert isinstance(plot_item, DataPlotCurveItem)
+    index = plots.indexOf(plot_item.getViewWidget())
+    plots.setSizes([0 if i == index else 300 for i in range(plots.count())])  # collapse the middle plot
+    qtbot.waitUntil(lambda: plot_item._suspended)
+
+    plots.set_data({**DATA, "1": ([0, 1], [4, 5])})
+    assert plot_item._data["1"][1].tolist() == [4, 5]  # data is available
+    assert plot_item._curves["1"].getData()[1].tolist() == [0.5, 0.25, 0.5]  # but not rendered
+    assert not plots._data_name_to_plot_item["0"]._suspended
+
+    plots.setSizes([200] * plots.count())
+    qtbot.waitUntil(lambda: not plot_item._suspended)
+    assert plot_item._curves["1"].getData()[1].tolist() == [4, 5]  # caught up
+
+
+def test_hidden_xy_suspended(qtbot: QtBot) -> None:
+    plots = MultiPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data(XY_DATA)
+    xy_plot = XyPlotWidget(plots)
+    xy_plot.add_xy("0", "1")
+    qtbot.addWidget(xy_plot)
+    xy_plot.show()
+    qtbot.waitExposed(xy_plot)
+    assert xy_plot._xy_curves[("0", "1")][-1].getData()[1].tolist() == [1, 0]
+
+    xy_plot.hide()
+    plots.set_data({**XY_DATA, "1": ([0, 1, 2], [4, 5, 6])})
+    assert xy_plot._xys_stale  # not updated while hidden
+
+    xy_plot.show()
+    qtbot.waitExposed(xy_plot)
+    assert xy_plot._xy_curves[("0", "1")][-1].getData()[1].tolist() == [5, 6]
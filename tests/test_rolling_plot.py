@@ -0,0 +1,136 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import MultiPlotWidget, LinkedMultiPlotWidget, RollingPlotWidget
+from pyqtgraph_scope_plots.rolling_plot_widget import RollStateModel
+from pyqtgraph_scope_plots.util import AppendableArray, DigitalBus, RunLengthEncoding, UniformTimebase
+from .common_testdata import DATA_ITEMS, DATA
+
+
+class LinkedRollingPlotWidget(RollingPlotWidget, LinkedMultiPlotWidget):
+    pass
+
+
+@pytest.fixture()
+def plots(qtbot: QtBot) -> LinkedRollingPlotWidget:
+    plots = LinkedRollingPlotWidget()
+    plots.show_data_items(DATA_ITEMS + [("enum", QColor("red"), MultiPlotWidget.PlotType.ENUM_WAVEFORM)])
+    plots.set_data(DATA)
+    qtbot.addWidget(plots)
+    plots.show()
+    qtbot.waitExposed(plots)
+    return plots
+
+
+def test_roll_samples(qtbot: QtBot, plots: LinkedRollingPlotWidget) -> None:
+    plots.set_roll(samples=3)
+    assert plots._raw_data["0"][0].tolist() == [0.1, 1, 2]  # existing data trimmed
+    assert plots._raw_data["0"][1].tolist() == [1, 1, 0]
+
+    for i in range(1000):
+        plots.append_data({"0": ([3 + i], [i]), "enum": ([3 + i], [f"s{i % 2}"])})
+    assert plots._raw_data["0"][0].tolist() == [1000, 1001, 1002]
+    assert plots._raw_data["0"][1].tolist() == [997, 998, 999]
+    assert plots._raw_data["enum"][1].tolist() == ["s1", "s0", "s1"]
+    assert plots._roll_buffers["0"][0].capacity() < 32  # storage stays bounded
+    assert plots._raw_data["1"][0].tolist() == [0, 1, 2]  # not appended, left alone
+
+    assert plots.view_x_range() == pytest.approx((0, 1002))  # follows the oldest-to-newest sample
+
+
+def test_roll_window(qtbot: QtBot, plots: LinkedRollingPlotWidget) -> None:
+    plots.set_roll(window=10)
+    plots.append_data({"0": (np.arange(3, 100), np.arange(3, 100))})
+    assert plots._raw_data["0"][0].tolist() == list(range(89, 100))
+    assert plots.view_x_range() == pytest.approx((89, 99))
+
+    plots.set_data({"0": (np.arange(10000.0), np.arange(10000.0))})  # only the window of the history is copied
+    plots.set_roll(window=10)
+    assert plots._raw_data["0"][0].tolist() == list(range(9989, 10000))
+    assert plots._roll_buffers["0"][0].capacity() < 64
+
+    plots.set_roll()  # disabled, retains all further data
+    plots.append_data({"0": ([200], [0])})
+    assert plots._raw_data["0"][0].tolist() == list(range(9989, 10000)) + [200]
+
+
+def test_roll_derived_data(qtbot: QtBot, plots: LinkedRollingPlotWidget) -> None:
+    plots.show_data_items(
+        [
+            ("bus", QColor("yellow"), MultiPlotWidget.PlotType.DIGITAL_BUS),
+            ("enum", QColor("red"), MultiPlotWidget.PlotType.ENUM_WAVEFORM),
+            ("0", QColor("blue"), MultiPlotWidget.PlotType.DEFAULT),
+        ]
+    )
+    xs = np.arange(4, dtype=np.float64)
+    xs.flags.writeable = False
+    UniformTimebase.detect(xs)
+    plots.set_data(
+        {
+            "bus": (xs, DigitalBus.pack({"ready": [1, 1, 0, 0], "busy": [0, 1, 1, 0]})),
+            "enum": RunLengthEncoding.from_transitions([0, 2], ["A", "B"], end=3),
+            "0": (xs, np.arange(4, dtype=np.float64)),
+        }
+    )
+    plots.set_roll(samples=6)
+
+    plots.append_data({"0": ([4.0], [4.0])})  # window not full, so extends the previous data
+    prev_xs, prev_ys = plots._raw_data["0"]
+    plots.append_data({"0": ([5.0], [5.0])})
+    assert AppendableArray.prefix_of(plots._raw_data["0"][1]) is prev_ys
+
+    for i in range(4, 10):
+        plots.append_data(
+            {
+                "bus": ([float(i)], np.array([i % 4], dtype=np.uint8)),
+                "enum": ([float(i)], ["C" if i < 8 else "D"]),
+                "0": ([float(i + 2)], [float(i + 2)]),
+            }
+        )
+    bus_xs, bus_ys = plots._raw_data["bus"]
+    assert bus_xs.tolist() == [4, 5, 6, 7, 8, 9]
+    assert DigitalBus.line_names(bus_ys) == ("ready", "busy")  # still a bus after samples are dropped
+    assert UniformTimebase.of(bus_xs) == (4.0, 1.0)  # timebase follows the dropped samples
+    assert RunLengthEncoding.is_run_length(plots._raw_data["enum"][1])  # values still held between samples
+    assert RunLengthEncoding.index_at(*plots._raw_data["enum"], 8.5) is not None
+
+
+def test_roll_cursors(qtbot: QtBot, plots: LinkedRollingPlotWidget) -> None:
+    plots._on_poi_change(None, [0.5, 5])
+    plots._on_region_change(None, (0.5, 1.5))
+    plots.set_roll(samples=5)
+    for i in range(3):
+        plots.append_data({name: ([3 + i], [0]) for name in ["0", "1", "2"]})
+    assert plots._last_pois == [5]
+    assert plots._last_region == (0.5, 1.5)  # still partially within data
+
+    plots.append_data({name: ([10], [0]) for name in ["0", "1", "2"]})
+    assert plots._last_region is None
+
+
+def test_roll_save(qtbot: QtBot, plots: LinkedRollingPlotWidget) -> None:
+    plots.set_roll(samples=100, window=2.5)
+    model = plots._dump_data_model([])
+    assert isinstance(model, RollStateModel)
+    assert model.roll_samples == 100 and model.roll_window == 2.5
+
+    model.roll_samples = 2
+    model.roll_window = None
+    plots._load_model(model)
+    assert plots._raw_data["0"][0].tolist() == [1, 2]
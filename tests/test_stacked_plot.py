@@ -0,0 +1,112 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import List, cast
+
+import pyqtgraph as pg
+import pytest
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import DroppableMultiPlotWidget, LinkedMultiPlotWidget, StackedLayoutMultiPlotWidget
+from pyqtgraph_scope_plots.multi_plot_widget import MultiPlotStateModel, PlotWidgetModel
+from .common_testdata import DATA_ITEMS, DATA
+
+
+class StackedPlotWidget(StackedLayoutMultiPlotWidget, LinkedMultiPlotWidget, DroppableMultiPlotWidget):
+    pass
+
+
+@pytest.fixture()
+def plots(qtbot: QtBot) -> StackedPlotWidget:
+    plots = StackedPlotWidget()
+    plots.show_data_items(DATA_ITEMS)
+    plots.set_data(DATA)
+    plots.resize(400, 600)
+    qtbot.addWidget(plots)
+    plots.show()
+    qtbot.waitExposed(plots)
+    return plots
+
+
+def data_names(plots: StackedPlotWidget) -> List[List[str]]:
+    return [plots._plot_item_data[plot_item] for plot_item in plots._plot_items_ordered()]
+
+
+def test_stacked_single_scene(qtbot: QtBot, plots: StackedPlotWidget) -> None:
+    assert plots.count() == 1  # one view for all plots
+    plot_items = plots._plot_items_ordered()
+    assert data_names(plots) == [["0"], ["1"], ["2"]]
+    assert len({plot_item.scene() for plot_item in plot_items}) == 1
+    qtbot.waitUntil(lambda: plot_items[0].sceneBoundingRect().bottom() <= plot_items[1].sceneBoundingRect().top())
+
+    assert not cast(pg.AxisItem, plot_items[0].getAxis("bottom")).style["showValues"]  # only the bottom x-axis
+    assert cast(pg.AxisItem, plot_items[2].getAxis("bottom")).style["showValues"]
+
+    plot_items[1].setXRange(0.5, 1.5, padding=0)  # x-axes linked
+    assert plots.view_x_range() == pytest.approx((0.5, 1.5))
+
+
+def test_stacked_merge(qtbot: QtBot, plots: StackedPlotWidget) -> None:
+    plots._merge_data_into_item(["0"], 1)  # merge
+    assert data_names(plots) == [["1", "0"], ["2"]]
+    assert len(plots._plot_items_ordered()[0].listDataItems()) == 2 * 2 + 1
+
+    plots._merge_data_into_item(["2"], 0, insert=True)  # insert at top
+    assert data_names(plots) == [["2"], ["1", "0"]]
+    plots._merge_data_into_item(["0"], 2, insert=True)  # insert at bottom
+    assert data_names(plots) == [["2"], ["1"], ["0"]]
+    assert cast(pg.AxisItem, plots._plot_items_ordered()[2].getAxis("bottom")).style["showValues"]
+
+    plots.remove_plot_items(["0", "1", "2"])  # replaced with the empty plot
+    assert data_names(plots) == [[]]
+
+
+def test_stacked_drag_geometry(qtbot: QtBot, plots: StackedPlotWidget) -> None:
+    plot_items = plots._plot_items_ordered()
+    qtbot.waitUntil(lambda: plot_items[0].sceneBoundingRect().height() > 0)
+    widget, rect = plots._plot_item_geometry(plot_items[1])
+    assert widget is plots._stacked_view
+    assert rect.top() == pytest.approx(600 / 3, abs=5) and rect.height() == pytest.approx(600 / 3, abs=5)
+
+
+def test_stacked_save(qtbot: QtBot, plots: StackedPlotWidget) -> None:
+    plots._merge_data_into_item(["0"], 1)
+    model = cast(MultiPlotStateModel, plots._dump_data_model([]))
+    assert model.plot_widgets == [
+        PlotWidgetModel(data_items=["1", "0"], y_range="auto"),
+        PlotWidgetModel(data_items=["2"], y_range="auto"),
+    ]
+
+    model.plot_widgets = [PlotWidgetModel(data_items=["2"]), PlotWidgetModel(data_items=["0", "1"])]
+    plots._load_model(model)
+    assert data_names(plots) == [["2"], ["0", "1"]]
+    assert len(plots._plot_items_ordered()[1].listDataItems()) == 2 * 2 + 1
+
+
+def test_stacked_suspended(qtbot: QtBot, plots: StackedPlotWidget) -> None:
+    plot_items = plots._plot_items_ordered()
+    qtbot.waitUntil(lambda: not any(plot_item._suspended for plot_item in plot_items))
+
+    plots.setSizes([0])  # collapse the view
+    qtbot.waitUntil(lambda: all(plot_item._suspended for plot_item in plot_items))
+    plots.set_data({**DATA, "1": ([0, 1], [4, 5])})
+    assert plot_items[1]._curves["1"].getData()[1].tolist() == [0.5, 0.25, 0.5]  # not rendered
+
+    plots.setSizes([600])
+    qtbot.waitUntil(lambda: not any(plot_item._suspended for plot_item in plot_items))
+    assert plot_items[1]._curves["1"].getData()[1].tolist() == [4, 5]  # caught up
+
+    assert plots._stacked_view is not None
+    plots._stacked_view.hide()
+    qtbot.waitUntil(lambda: all(plot_item._suspended for plot_item in plot_items))
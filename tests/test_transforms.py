@@ -23,8 +23,9 @@ from pytestqt.qtbot import QtBot
 from pyqtgraph_scope_plots import MultiPlotWidget, TransformsSignalsTable, TransformsPlotWidget
 from pyqtgraph_scope_plots.code_input_dialog import CodeInputDialog
 from pyqtgraph_scope_plots.transforms_signal_table import TransformsDataStateModel
+from pyqtgraph_scope_plots.util import GapIndex, RunLengthEncoding
 from pyqtgraph_scope_plots.util.util import not_none
-from .common_testdata import DATA
+from .common_testdata import DATA, np_immutable
 from .util import context_menu, menu_action_by_name
 
 
@@ -83,6 +84,40 @@ def test_transform_multiple(qtbot: QtBot, transforms_plots: TransformsPlotWidget
     qtbot.waitUntil(lambda: transforms_plots._apply_transform("0", DATA).tolist() == [0.51, 1, 1.25, 0.5])
 
 
+def test_transform_run_length(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
+    """Tests transforms referencing run-length encoded data, which holds values between transitions"""
+    data = {**DATA, "e": RunLengthEncoding.from_transitions([0, 1], ["duck", "goose"], end=1.5)}
+    transforms_plots.set_transform(["0"], "x if data.get('e') == 'duck' else -1.0")
+    qtbot.waitUntil(lambda: transforms_plots._apply_transform("0", data).tolist() == [0.01, 1, -1, -1])
+
+
+def test_transform_sparse(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
+    """Tests transforms over sparse data, where missing (NaN) samples are treated as no value at that x"""
+    sparse_xs, sparse_ys = np_immutable([0, 0.1, 1, 2]), np_immutable([1.0, float("nan"), 2.0, float("nan")])
+    GapIndex.build(sparse_xs, sparse_ys, jump_factor=10)  # as indexed by ingest_data_frame
+    data = {**DATA, "s": (sparse_xs, sparse_ys)}
+    transforms_plots.set_transform(["0"], "x + data.get('s', 0)")
+    qtbot.waitUntil(lambda: transforms_plots._apply_transform("0", data).tolist() == [1.01, 1, 3, 0])
+    transforms_plots.set_transform(["s"], "x * 2 if x > 1 else -1.0")  # missing samples stay missing
+    qtbot.waitUntil(
+        lambda: str(transforms_plots._apply_transform("s", data).tolist())
+        == str([-1.0, float("nan"), 4.0, float("nan")])
+    )
+
+
+def test_transform_non_finite(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
+    """Tests that non-finite samples of dense data are values, evaluated and readable through data"""
+    data = {**DATA, "a": (np_immutable([0, 1, 2]), np_immutable([1.0, float("inf"), float("nan")]))}
+    transforms_plots.set_transform(["a"], "abs(x) * 0")
+    qtbot.waitUntil(
+        lambda: str(transforms_plots._apply_transform("a", data).tolist()) == str([0.0, float("nan"), float("nan")])
+    )
+    transforms_plots.set_transform(["1"], "data['a']")
+    qtbot.waitUntil(
+        lambda: str(transforms_plots._apply_transform("1", data).tolist()) == str([1.0, float("inf"), float("nan")])
+    )
+
+
 def test_transform_ui(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
     """Basic test of transforms driven from the UI"""
     transforms_table = TransformsSignalsTable(transforms_plots)
@@ -211,3 +246,34 @@ def test_transform_direct_cell_edit_syntaxerror(qtbot: QtBot, transforms_plots:
         first_call_args = mock_input.call_args_list[0]
         assert "is" in first_call_args[0][3]
         assert "SyntaxError" in first_call_args[0][2]
+
+
+def test_transform_dirty_update(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
+    """Tests that changing one transform only updates that data item and data items that reference other data"""
+    plot_items = {name: transforms_plots._data_name_to_plot_item[name] for name in ["0", "1", "2"]}
+    transforms_plots.set_transform(["2"], "x + data['0']")
+    with (
+        mock.patch.object(plot_items["0"], "update_data", wraps=plot_items["0"].update_data) as update_0,
+        mock.patch.object(plot_items["1"], "update_data", wraps=plot_items["1"].update_data) as update_1,
+        mock.patch.object(plot_items["2"], "update_data", wraps=plot_items["2"].update_data) as update_2,
+    ):
+        transforms_plots.set_transform(["0"], "x * 2")
+        assert update_0.call_count == 1
+        assert update_1.call_count == 0  # untouched
+        assert update_2.call_count == 1  # references data['0']
+    assert transforms_plots._data["0"][1].tolist() == [0.02, 2, 2, 0]
+    assert transforms_plots._data["2"][1].tolist() == [0.7 + 0.01, 0.6 + 1, 0.5 + 0]  # references input data
+
+
+def test_transform_lazy(qtbot: QtBot, transforms_plots: TransformsPlotWidget) -> None:
+    """Tests that transforms are only applied to data that is displayed or requested"""
+    transforms_plots.remove_plot_items(["2"])
+    transforms_plots.set_transform(["0", "2"], "x + 1", update=False)
+    with mock.patch.object(
+        transforms_plots, "_apply_transform", wraps=transforms_plots._apply_transform
+    ) as apply_transform:
+        transforms_plots.set_data(DATA)
+        assert {call.args[0] for call in apply_transform.call_args_list} == {"0", "1"}  # plotted only
+        assert transforms_plots._data["2"][1].tolist() == [1.7, 1.6, 1.5]  # computed on request
+        assert transforms_plots._data["2"][1].tolist() == [1.7, 1.6, 1.5]
+        assert [call.args[0] for call in apply_transform.call_args_list].count("2") == 1  # and memoized
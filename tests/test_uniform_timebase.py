@@ -0,0 +1,80 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+
+import numpy as np
+import pandas as pd
+
+from pyqtgraph_scope_plots.util import UniformTimebase, ingest_data_frame
+
+
+def test_uniform_detect() -> None:
+    xs = np.arange(100) * 0.1 + 5
+    assert UniformTimebase.detect(xs) is None  # writeable arrays may change, so not tracked
+    xs.flags.writeable = False
+    t0, dt = UniformTimebase.detect(xs)  # type: ignore[misc]
+    assert t0 == 5 and np.isclose(dt, 0.1)
+    assert UniformTimebase.of(xs) == (t0, dt)
+
+    nonuniform = np.array([0, 1, 2, 4, 5], dtype=np.float64)
+    nonuniform.flags.writeable = False
+    assert UniformTimebase.detect(nonuniform) is None
+    assert UniformTimebase.of(nonuniform) is None
+
+
+def test_uniform_bisect_exact() -> None:
+    rng = np.random.default_rng(0)
+    xs = np.arange(1000) * 0.5 + rng.uniform(-1e-4, 1e-4, 1000)  # jitter within tolerance
+    xs.flags.writeable = False
+    assert UniformTimebase.detect(xs) is not None
+    queries = list(xs[::37]) + list(rng.uniform(-10, 510, 200)) + [-np.inf, np.inf]
+    for x in queries:
+        assert UniformTimebase.bisect_left(xs, x) == bisect.bisect_left(xs, x)
+        assert UniformTimebase.bisect_right(xs, x) == bisect.bisect_right(xs, x)
+        assert UniformTimebase.bisect_left(xs, x, 100, 200) == bisect.bisect_left(xs, x, 100, 200)
+        assert UniformTimebase.bisect_right(xs, x, 100, 200) == bisect.bisect_right(xs, x, 100, 200)
+
+    repeated = np.array([0, 1, 1, 1, 4], dtype=np.float64)  # unregistered, falls back to bisect
+    assert UniformTimebase.bisect_left(repeated, 1) == 1
+    assert UniformTimebase.bisect_right(repeated, 1) == 4
+
+
+def test_uniform_register_derived() -> None:
+    xs = np.arange(10, dtype=np.float64)
+    xs.flags.writeable = False
+    UniformTimebase.detect(xs)
+
+    shifted = xs + 2.5
+    shifted.flags.writeable = False
+    UniformTimebase.register_shifted(xs, shifted, 2.5)
+    assert UniformTimebase.of(shifted) == (2.5, 1.0)
+    assert UniformTimebase.bisect_left(shifted, 3) == 1
+
+    extended = np.concatenate([xs, np.arange(10, 15, dtype=np.float64)])
+    extended.flags.writeable = False
+    UniformTimebase.register_extended(xs, extended)
+    assert UniformTimebase.of(extended) == (0.0, 1.0)
+
+    broken = np.concatenate([xs, np.array([20.0])])  # appended data breaks the timebase
+    broken.flags.writeable = False
+    UniformTimebase.register_extended(xs, broken)
+    assert UniformTimebase.of(broken) is None
+
+
+def test_uniform_ingest() -> None:
+    df = pd.DataFrame({"t": np.arange(10) * 0.5, "a": np.arange(10.0), "b": [1.0, np.nan] * 5})
+    data, _ = ingest_data_frame(df)
+    assert UniformTimebase.of(data["a"][0]) == (0.0, 0.5)
+    assert UniformTimebase.of(data["b"][0]) == (0.0, 1.0)  # masked time array is also uniform
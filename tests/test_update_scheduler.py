@@ -0,0 +1,82 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import threading
+from typing import List
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import PlotsTableWidget
+from pyqtgraph_scope_plots.util import UpdateScheduler
+from .common_testdata import DATA_ITEMS, DATA
+
+
+@pytest.fixture()
+def plot(qtbot: QtBot) -> PlotsTableWidget:
+    plot = PlotsTableWidget()
+    plot.set_update_rate(20)
+    qtbot.addWidget(plot)
+    return plot
+
+
+def test_coalesce_set_data(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    updates: List[None] = []
+    plot._plots.sigDataUpdated.connect(lambda: updates.append(None))
+    plot._set_data_items(DATA_ITEMS)
+    for i in range(50):
+        plot._set_data({"0": ([0, 1], [i, i])})
+    assert plot._plots._data == {}  # not yet applied
+
+    qtbot.waitUntil(lambda: len(updates) > 0)
+    assert len(updates) == 1
+    assert plot._plots._data["0"][1].tolist() == [49, 49]
+    assert len(plot._plots._data_items) == 3
+    assert plot.update_metrics() == UpdateScheduler.Metrics(submitted=51, executed=1, merged=0, dropped=49)
+
+
+def test_coalesce_append_data(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    plot._set_data_items(DATA_ITEMS)
+    plot._set_data(DATA)
+    plot._flush_updates()
+
+    appended: List[List[str]] = []
+    plot._plots.sigDataAppended.connect(lambda names: appended.append(names))
+    for i in range(10):
+        plot._append_data({"1": ([3 + i], [i])})
+    qtbot.waitUntil(lambda: len(appended) > 0)
+    assert appended == [["1"]]
+    assert plot._plots._data["1"][1].tolist() == [0.5, 0.25, 0.5] + list(range(10))
+    metrics = plot.update_metrics()
+    assert metrics is not None and metrics.merged == 9 and metrics.dropped == 0
+
+
+def test_threaded_producer(qtbot: QtBot, plot: PlotsTableWidget) -> None:
+    plot._set_data_items(DATA_ITEMS)
+    plot._set_data(DATA)
+
+    def producer() -> None:
+        for i in range(200):
+            plot._append_data({"0": ([3 + i], [i])})
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    thread.join()
+    qtbot.waitUntil(lambda: len(plot._plots._data.get("0", ([], []))[0]) == 4 + 200)
+    metrics = plot.update_metrics()
+    assert metrics is not None and metrics.submitted == 202 and metrics.executed < 10
+
+    plot.set_update_rate(None)  # back to immediate updates
+    plot._set_data({"0": ([0], [0])})
+    assert plot._plots._data["0"][1].tolist() == [0]
@@ -0,0 +1,118 @@
+# Copyright 2026 Enphase Energy, Inc.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from typing import cast
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor
+from pytestqt.qtbot import QtBot
+
+from pyqtgraph_scope_plots import ValueDtypePlotWidget, TransformsPlotWidget, StatsSignalsTable
+from pyqtgraph_scope_plots.multi_plot_widget import DigitalBusInteractivePlot
+from pyqtgraph_scope_plots.util import DigitalBus, cast_values
+from pyqtgraph_scope_plots.value_dtype_plot_widget import ValueDtypeDataStateModel, ValueDtypeStateModel
+from .common_testdata import DATA_ITEMS
+
+
+class TransformsValueDtypePlotWidget(ValueDtypePlotWidget, TransformsPlotWidget):
+    pass
+
+
+ADC_DATA = {
+    "0": (np.arange(4, dtype=np.float64), np.array([0, 1000, 65535, 3], dtype=np.float64)),  # eg, 16-bit ADC
+    "1": (np.arange(3, dtype=np.float64), np.array([0.5, 0.25, 0.5])),
+    "2": (np.arange(3, dtype=np.float64), np.array([1e9, 1e9 + 0.001, 1e9 + 0.002])),  # precision-sensitive
+}
+
+
+@pytest.fixture()
+def plot(qtbot: QtBot) -> TransformsValueDtypePlotWidget:
+    plot = TransformsValueDtypePlotWidget()
+    plot.show_data_items(DATA_ITEMS)
+    qtbot.addWidget(plot)
+    return plot
+
+
+def test_cast_values() -> None:
+    ys = np.array([0, 1000, 65535], dtype=np.float64)
+    assert cast_values(ys, np.uint16).tolist() == [0, 1000, 65535]
+    assert cast_values(ys, np.int16) is None  # out of range
+    assert cast_values(np.array([0.5, 1.0]), np.int32) is None  # not integral
+    assert cast_values(np.array([np.nan, 1.0]), np.int32) is None  # not finite
+    assert cast_values(np.array([np.nan, 0.1]), np.float32) is not None  # NaN preserved in floats
+    assert cast_values(np.array([1e40, 1.0]), np.float32) is None  # overflow
+    assert cast_values(np.array([1e9, 1e9 + 0.001]), np.float32) is None  # precision loss relative to span
+    assert cast_values(np.array(["a", "b"]), np.float32) is None  # non-numeric
+
+
+def test_value_dtype_policy(qtbot: QtBot, plot: TransformsValueDtypePlotWidget) -> None:
+    plot.set_default_value_dtype(np.float32)
+    plot.set_value_dtype(["0"], np.uint16)
+    plot.set_data(ADC_DATA)
+    assert plot._raw_data["0"][1].dtype == np.uint16
+    assert plot._raw_data["1"][1].dtype == np.float32
+    assert plot._raw_data["2"][1].dtype == np.float64  # guardrail, kept as-is
+    assert plot._raw_data["2"][1].tolist() == ADC_DATA["2"][1].tolist()
+
+    plot.set_transform(["1"], "x * 2")
+    assert plot._data["1"][1].dtype == np.float32  # transformed values follow the policy
+    assert plot._data["1"][1].tolist() == [1.0, 0.5, 1.0]
+
+    plot.append_data({"1": ([3], [0.75])})
+    assert plot._raw_data["1"][1].dtype == np.float32
+    assert plot._data["1"][1].tolist() == [1.0, 0.5, 1.0, 1.5]
+
+    plot.set_value_dtype(["1"], np.float64)  # re-cast on change
+    assert plot._raw_data["1"][1].dtype == np.float64
+
+    report = {row.data_name: row for row in plot.memory_report()}
+    assert report["0"].dtype == "uint16" and report["0"].stored_bytes == 8 and report["0"].float64_bytes == 32
+    assert "Total" in plot.memory_report_text()
+
+
+def test_value_dtype_stats() -> None:
+    # int16 values would overflow if accumulated in the storage dtype
+    stats = StatsSignalsTable.StatsCalculatorWorker._calculate_stats(np.array([30000, 30000], dtype=np.int16))
+    assert stats[StatsSignalsTable.COL_STAT_AVG] == 30000
+    assert stats[StatsSignalsTable.COL_STAT_RMS] == 30000
+
+
+def test_value_dtype_save_load(qtbot: QtBot, plot: TransformsValueDtypePlotWidget) -> None:
+    model = plot._dump_data_model(["0"])
+    assert cast(ValueDtypeStateModel, model).value_dtype == ""
+    assert cast(ValueDtypeDataStateModel, model.data["0"]).value_dtype == ""
+
+    plot.set_default_value_dtype(np.float32)
+    plot.set_value_dtype(["0"], np.int16)
+    model = plot._dump_data_model(["0"])
+    assert cast(ValueDtypeStateModel, model).value_dtype == "float32"
+    assert cast(ValueDtypeDataStateModel, model.data["0"]).value_dtype == "int16"
+
+    new_plot = TransformsValueDtypePlotWidget()
+    qtbot.addWidget(new_plot)
+    new_plot._load_model(model)
+    assert new_plot._value_dtype("0") == np.int16
+    assert new_plot._value_dtype("1") == np.float32
+
+
+def test_value_dtype_digital_bus(qtbot: QtBot, plot: TransformsValueDtypePlotWidget) -> None:
+    plot.show_data_items([("bus", QColor("yellow"), ValueDtypePlotWidget.PlotType.DIGITAL_BUS)])
+    bus_ys = DigitalBus.pack({"ready": [0, 1, 1], "busy": [1, 0, 1]})
+    for dtype in (np.float32, np.uint16):  # bus words are kept as-is, with their line names
+        plot.set_default_value_dtype(dtype)
+        plot.set_data({"bus": (np.arange(3, dtype=np.float64), bus_ys)})
+        assert plot._raw_data["bus"][1] is bus_ys
+        plot_item = cast(DigitalBusInteractivePlot, plot._data_name_to_plot_item["bus"])
+        assert plot_item._line_names == ("ready", "busy")